@@ -0,0 +1,234 @@
+import atexit
+import itertools
+import math
+import pickle
+import random
+import time
+
+from game_io import ScriptedIO, ScriptExhausted
+from outcome import GameEnded
+from simulate import SensiblePolicy
+
+# NOVA's "recommend" command.
+#
+# Every option at a decision point is scored by Monte Carlo rollouts: fork
+# the game with fresh luck, apply the option, then let the sensible policy
+# play on for a few days. Rollouts go to whichever option UCB1 picks next,
+# so the time budget is spent on the options that are still close. This is
+# the root level of a Monte Carlo tree search; the policy plays the rest of
+# each line. Forks are reseeded from the advisor's own RNG, so
+# asking for advice never touches (or peeks at) the real game's rolls.
+#
+# Options are plain tuples so they can be sent to worker processes:
+#   ("daily", choice)              a choice from the daily menu
+#   ("contract", index, hub_type)  accept a hub contract (None declines them all)
+#   ("police", "run" | "stop" | "bribe", enemy_type)  see PoliceEncounter.resolve
+#
+# With workers, the main process still runs UCB1 and hands out small batches
+# of rollouts for one option at a time, so K workers add up to K times the
+# rollouts of one rather than K separate searches.
+
+LOSING_ENDINGS = ("DEATH", "STRANDED", "MARTYR")
+CREDIT_SCALE = 10000  # Credits gained (or lost) that count as a full point of reward
+CREDIT_WEIGHT = 0.25
+DEFAULT_WORKERS = 0  # Set by --advisor-workers
+BATCH = 4  # Rollouts per job handed to a worker
+
+class OptionStats:
+    """Rollout totals for one option"""
+
+    def __init__(self, label, option):
+        self.label = label
+        self.option = option
+        self.visits = 0
+        self.survived = 0
+        self.credits = 0
+        self.reward = 0.0
+
+    @property
+    def survival(self):
+        return self.survived / self.visits if self.visits else 0.0
+
+    @property
+    def mean_credits(self):
+        return self.credits / self.visits if self.visits else 0.0
+
+    def add(self, survived, credits, reward):
+        self.visits += 1
+        self.survived += survived
+        self.credits += credits
+        self.reward += reward
+
+def apply_option(game, option):
+    """Carry out an option on a (forked) game"""
+    kind = option[0]
+    if kind == "daily":
+        game.perform_daily_action(option[1])
+    elif kind == "contract":
+        from trade_hub_gameplay import hub_menu
+        if option[1] is not None:
+            game.current_hub.available_contracts[option[1]].accept(game)
+        hub_menu(game, option[2])  # Finish the hub visit: fuel, shopping
+    elif kind == "police":
+        from fights import PoliceEncounter
+        result = PoliceEncounter(game).resolve(option[1], option[2])
+        if game.game_over:
+            return
+        # Play the rest of the day out as the real game would, so rollouts
+        # start from the next morning and not from the middle of a trip
+        if game.trip is not None:
+            # Police stop the trip itself, or meet you at a hub you landed at
+            game.finish_trip(result if game.trip[1] == "police" else "planet_landing")
+        game.end_day()
+    else:
+        raise ValueError(f"Unknown option {option!r}")
+
+def rollout(game, option, seed, horizon):
+    """Play one continuation after an option, with fresh luck.
+
+    Returns:
+        (survived, credits at the end, reward in [0, 1])
+    """
+    policy = SensiblePolicy(seed, max_days=game.day + horizon)
+    fork = game.fork(ScriptedIO(policy=policy, max_inputs=2000), reseed=seed)
+    policy.attach(fork)
+    try:
+        apply_option(fork, option)
+        while not fork.game_over:
+            fork.play_turn()
+    except (GameEnded, ScriptExhausted):
+        pass  # Game over, or the horizon was reached
+    survived = fork.result is None or fork.result.ending not in LOSING_ENDINGS
+    gain = max(-1.0, min(1.0, (fork.player.credits - game.player.credits) / CREDIT_SCALE))
+    reward = ((1.0 if survived else 0.0) + CREDIT_WEIGHT * (gain + 1) / 2) / (1 + CREDIT_WEIGHT)
+    return survived, fork.player.credits, reward
+
+def _pick(stats, pending, exploration):
+    """Index of the option UCB1 rolls out next; rollouts still running count as visits"""
+    for i, (s, running) in enumerate(zip(stats, pending)):
+        if s.visits + running == 0:
+            return i  # Every option gets one rollout first
+    log_total = math.log(sum(s.visits for s in stats) + sum(pending))
+    def score(i):
+        s = stats[i]
+        mean = s.reward / s.visits if s.visits else 0.5  # Nothing back from the workers yet
+        return mean + exploration * math.sqrt(log_total / (s.visits + pending[i]))
+    return max(range(len(stats)), key=score)
+
+def search(game, options, budget, horizon, seed, exploration=1.4):
+    """UCB1 over the options until the time budget runs out
+
+    Args:
+        options: [(label, option)]
+
+    Returns:
+        [OptionStats], in the order of options
+    """
+    stats = [OptionStats(label, option) for label, option in options]
+    pending = [0] * len(stats)
+    seeds = random.Random(seed)
+    deadline = time.perf_counter() + budget
+    total = 0
+    while total < len(stats) or time.perf_counter() < deadline:
+        pick = stats[_pick(stats, pending, exploration)]
+        pick.add(*rollout(game, pick.option, seeds.getrandbits(32), horizon))
+        total += 1
+    return stats
+
+_snapshot_ids = itertools.count()
+_worker_game = (None, None)  # (snapshot id, game), in a worker process
+
+def _rollouts(snapshot_id, data, option, seeds, horizon):
+    """A batch of rollouts in a worker; the game is unpickled once per snapshot"""
+    global _worker_game
+    if _worker_game[0] != snapshot_id:
+        _worker_game = (snapshot_id, pickle.loads(data))
+    game = _worker_game[1]
+    return [rollout(game, option, seed, horizon) for seed in seeds]
+
+def parallel_search(game, options, budget, horizon, seed, workers, exploration=1.4):
+    """search() with the rollouts run in batches on a pool of worker processes
+
+    Keeps a batch per worker in flight, picked by UCB1 with the rollouts
+    still running counted as visits, and merges each batch as it comes back.
+    """
+    pool = _pool(workers)
+    stats = [OptionStats(label, option) for label, option in options]
+    pending = [0] * len(stats)
+    seeds = random.Random(seed)
+    snapshot_id = next(_snapshot_ids)
+    data = pickle.dumps(game.fork(ScriptedIO()))  # The live IO stays in this process
+    deadline = time.perf_counter() + budget
+    running = []  # (option index, AsyncResult), oldest first
+    while True:
+        while len(running) < workers:
+            unstarted = any(s.visits + n == 0 for s, n in zip(stats, pending))
+            if not unstarted and time.perf_counter() >= deadline:
+                break  # Every option has had a batch, and the time is up
+            i = _pick(stats, pending, exploration)
+            batch = [seeds.getrandbits(32) for _ in range(BATCH)]
+            running.append((i, pool.apply_async(_rollouts, (snapshot_id, data, stats[i].option, batch, horizon))))
+            pending[i] += BATCH
+        if not running:
+            break
+        i, job = running.pop(0)
+        for result in job.get():
+            stats[i].add(*result)
+        pending[i] -= BATCH
+    return stats
+
+_pools = {}
+
+def _pool(workers):
+    """A process pool kept alive between recommendations"""
+    if workers not in _pools:
+        from multiprocessing import Pool
+        _pools[workers] = Pool(workers)
+    return _pools[workers]
+
+def shutdown():
+    """Stop the worker pools; also run at exit"""
+    while _pools:
+        _, pool = _pools.popitem()
+        pool.terminate()
+        pool.join()
+
+atexit.register(shutdown)
+
+class Advisor:
+    """Recommends an option at a decision point from time-boxed rollouts.
+
+    Args:
+        budget: Seconds to think per recommendation
+        horizon: Days each rollout plays past today
+        workers: Worker processes to search in parallel (0 searches in-process;
+            defaults to DEFAULT_WORKERS)
+    """
+
+    def __init__(self, budget=0.2, horizon=10, workers=None):
+        self.budget = budget
+        self.horizon = horizon
+        self.workers = DEFAULT_WORKERS if workers is None else workers
+
+    def evaluate(self, game, options):
+        """Return [OptionStats] for each (label, option), best first"""
+        state = f"{game.rng.seed}:{game.rng.epoch}:{game.day}:{game.player.credits}:{game.player.heat}"
+        seed = random.Random(state).getrandbits(32)  # Same spot, same advice
+        if self.workers <= 1:
+            stats = search(game, options, self.budget, self.horizon, seed)
+        else:
+            stats = parallel_search(game, options, self.budget, self.horizon, seed, self.workers)
+        return sorted(stats, key=lambda s: -(s.reward / s.visits))
+
+    def recommend(self, game, options):
+        """Evaluate the options and have NOVA report the numbers"""
+        io = game.io
+        io.print("\n[NOVA] 'Running the numbers...'")
+        stats = self.evaluate(game, options)
+        for s in stats:
+            io.print(f"  {s.label:<24} survival {s.survival:6.1%}   credits ~{s.mean_credits:>9,.0f}   ({s.visits} runs)")
+        best = stats[0]
+        io.print(f"[NOVA] 'I'd go with: {best.label}. {best.survival:.0%} of the futures I ran, you're still breathing.'")
+        return best
+
+__all__ = ['Advisor', 'OptionStats', 'apply_option', 'rollout', 'search', 'parallel_search', 'shutdown']
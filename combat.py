@@ -1,76 +1,135 @@
-from utils import DiceRoller, wait_for_enter
-import random
+from collections import namedtuple
+
 from equipment import get_enemy_weapon_drop
+from enemies import EnemyTier, tier_profile
+from outcome import GameEnded
+
+# --- Templates ----------------------------------------------------------------
+# Items and enemies with fixed stats are registered templates with a stable
+# string id. A template is called like a factory (MEDKIT() makes a medkit),
+# and instances made from one pickle as just (id, ...) instead of every field.
+
+ITEM_TEMPLATES = {}
+ENEMY_TEMPLATES = {}
+
+class ItemTemplate:
+    """Registered recipe for a CombatItem"""
+
+    def __init__(self, item_id, name, description):
+        self.item_id = item_id
+        self.name = name
+        self.description = description
+        ITEM_TEMPLATES[item_id] = self
+
+    def __call__(self):
+        return CombatItem(self.name, self.description, self.item_id)
+
+    def __reduce__(self):
+        return (item_template, (self.item_id,))
+
+class EnemyTemplate:
+    """Registered recipe for an Enemy"""
+
+    def __init__(self, enemy_id, name, hp, min_damage, max_damage, credits_reward, tier):
+        self.enemy_id = enemy_id
+        self.name = name
+        self.hp = hp
+        self.min_damage = min_damage
+        self.max_damage = max_damage
+        self.credits_reward = credits_reward
+        self.tier = tier
+        ENEMY_TEMPLATES[enemy_id] = self
+
+    def __call__(self):
+        return Enemy(self.name, self.hp, self.min_damage, self.max_damage, self.credits_reward,
+                     self.tier, enemy_id=self.enemy_id)
+
+    def __reduce__(self):
+        return (enemy_template, (self.enemy_id,))
 
-def use_medkit(combat):
-    """Heal 30 HP"""
-    heal_amount = 30
-    combat.player.hp = min(combat.player.max_hp, combat.player.hp + heal_amount)
-    print(f"\nUsed medkit! Healed {heal_amount} HP")
-    wait_for_enter()
-
-def use_shield(combat):
-    """Activate shield to block next attack"""
-    combat.shield_active = True
-    print("\nShield activated! Next attack will be blocked")
-    wait_for_enter()
-
-def use_stun_grenade(combat):
-    """Deal explosive damage to enemy"""
-    # Calculate grenade damage (15-25 damage)
-    damage = random.randint(15, 35)
-    combat.enemy.take_damage(damage)
-    print(f"\nExplosive grenade detonates! Deals {damage} damage!")
-    wait_for_enter()
+def item_template(item_id):
+    """Look up an item template by id"""
+    return ITEM_TEMPLATES[item_id]
+
+def enemy_template(enemy_id):
+    """Look up an enemy template by id"""
+    return ENEMY_TEMPLATES[enemy_id]
+
+def create_item(item_id):
+    """Make a fresh CombatItem from its template id"""
+    return ITEM_TEMPLATES[item_id]()
+
+def create_enemy(enemy_id, hp=None):
+    """Make an Enemy from its template id, optionally already wounded"""
+    enemy = ENEMY_TEMPLATES[enemy_id]()
+    if hp is not None:
+        enemy.hp = hp
+    return enemy
 
 # Define some basic items
-MEDKIT = lambda: CombatItem(name="Medkit", description="Heals 30 HP", effect=use_medkit)
-SHIELD = lambda: CombatItem(name="Shield", description="Blocks next attack", effect=use_shield)
-STUN_GRENADE = lambda: CombatItem(name="Explosive Grenade", description="Deals 15-25 damage", effect=use_stun_grenade)
+MEDKIT = ItemTemplate("medkit", "Medkit", "Heals 30 HP")
+SHIELD = ItemTemplate("shield", "Shield", "Blocks next attack")
+STUN_GRENADE = ItemTemplate("grenade", "Explosive Grenade", "Deals 15-25 damage")
 
 # Define law enforcement enemies (from lowest to highest threat)
-LOCAL_DEPUTY = lambda: Enemy(name="Local Deputy", hp=60, min_damage=5, max_damage=15, credits_reward=75)  # Level 1 - Local enforcer
-SECTOR_BADGE = lambda: Enemy(name="Sector Badge", hp=90, min_damage=10, max_damage=20, credits_reward=100)  # Level 2 - Corrupt sector cop
-FEDERATION_RANGER = lambda: Enemy(name="Federation Ranger", hp=120, min_damage=15, max_damage=25, credits_reward=1500)  # Level 3 - Legitimate authority
-GALACTIC_ENFORCER = lambda: Enemy(name="Galactic Enforcer", hp=165, min_damage=20, max_damage=35, credits_reward=2000)  # Level 4 - Elite federal agent
+LOCAL_DEPUTY = EnemyTemplate("local_deputy", "Local Deputy", hp=60, min_damage=5, max_damage=15, credits_reward=75, tier=EnemyTier.LOCAL_DEPUTY)  # Level 1 - Local enforcer
+SECTOR_BADGE = EnemyTemplate("sector_badge", "Sector Badge", hp=90, min_damage=10, max_damage=20, credits_reward=100, tier=EnemyTier.SECTOR_BADGE)  # Level 2 - Corrupt sector cop
+FEDERATION_RANGER = EnemyTemplate("federation_ranger", "Federation Ranger", hp=120, min_damage=15, max_damage=25, credits_reward=1500, tier=EnemyTier.FEDERATION_RANGER)  # Level 3 - Legitimate authority
+GALACTIC_ENFORCER = EnemyTemplate("galactic_enforcer", "Galactic Enforcer", hp=165, min_damage=20, max_damage=35, credits_reward=2000, tier=EnemyTier.GALACTIC_ENFORCER)  # Level 4 - Elite federal agent
 
 # Bounty Hunter System - unique enemies that can be eliminated permanently
 class BountyHunter:
     """Container for bounty hunter instances"""
     # List of available bounty hunters
     HUNTERS = [
-        lambda: Enemy(name="Agent Andrews", hp=300, min_damage=25, max_damage=40, credits_reward=2000),
-        lambda: Enemy(name="Killer Klakring", hp=350, min_damage=30, max_damage=50, credits_reward=5000),
-        lambda: Enemy(name="T-Mont the Tyrant", hp=400, min_damage=35, max_damage=55, credits_reward=10000),
-        lambda: Enemy(name="Garth Vader", hp=430, min_damage=40, max_damage=60, credits_reward=20000),
-        lambda: Enemy(name="D-Mac the Destroyer", hp=480, min_damage=45, max_damage=75, credits_reward=50000),
+        EnemyTemplate("agent_andrews", "Agent Andrews", hp=300, min_damage=25, max_damage=40, credits_reward=2000, tier=EnemyTier.BOUNTY_HUNTER),
+        EnemyTemplate("killer_klakring", "Killer Klakring", hp=350, min_damage=30, max_damage=50, credits_reward=5000, tier=EnemyTier.BOUNTY_HUNTER),
+        EnemyTemplate("t_mont", "T-Mont the Tyrant", hp=400, min_damage=35, max_damage=55, credits_reward=10000, tier=EnemyTier.BOUNTY_HUNTER),
+        EnemyTemplate("garth_vader", "Garth Vader", hp=430, min_damage=40, max_damage=60, credits_reward=20000, tier=EnemyTier.BOUNTY_HUNTER),
+        EnemyTemplate("d_mac", "D-Mac the Destroyer", hp=480, min_damage=45, max_damage=75, credits_reward=50000, tier=EnemyTier.BOUNTY_HUNTER),
     ]
-    
-    # Track which hunters have been eliminated
-    eliminated = set()
-    
-    @classmethod
-    def get_random_hunter(cls):
-        """Get a random non-eliminated bounty hunter"""
-        available = [i for i, hunter in enumerate(cls.HUNTERS) if i not in cls.eliminated]
+
+class BountyRoster:
+    """Which bounty hunters are still out there, for one game.
+
+    Hunters are indexed by name; eliminated ones are bits in an int mask
+    (bit i = BountyHunter.HUNTERS[i]), which is all a save needs to store.
+    """
+
+    def __init__(self, eliminated=0):
+        self.hunters = BountyHunter.HUNTERS
+        self.index = {hunter.name: i for i, hunter in enumerate(self.hunters)}
+        self.eliminated = eliminated
+
+    def get_random_hunter(self, rng):
+        """Get a random non-eliminated bounty hunter using the given random stream"""
+        available = [i for i in range(len(self.hunters)) if not self.eliminated >> i & 1]
         if not available:  # If all hunters are eliminated
             return GALACTIC_ENFORCER()  # Fallback to a Galactic Enforcer
         
-        idx = random.choice(available)
-        return cls.HUNTERS[idx]()
-    
-    @classmethod
-    def mark_eliminated(cls, hunter_name):
-        """Mark a hunter as eliminated"""
-        for i, hunter in enumerate(cls.HUNTERS):
-            if hunter().name == hunter_name:
-                cls.eliminated.add(i)
-                return True
-        return False
+        idx = rng.choice(available)
+        return self.hunters[idx]()
+
+    def mark_eliminated(self, hunter_name):
+        """Mark a hunter as eliminated; False if no hunter has that name"""
+        i = self.index.get(hunter_name)
+        if i is None:
+            return False
+        self.eliminated |= 1 << i
+        return True
+
+    def is_eliminated(self, hunter_name):
+        i = self.index.get(hunter_name)
+        return i is not None and bool(self.eliminated >> i & 1)
+
+    def __reduce__(self):
+        return (BountyRoster, (self.eliminated,))
 
 class Enemy:
-    def __init__(self, name, hp, min_damage, max_damage, credits_reward):
+    def __init__(self, name, hp, min_damage, max_damage, credits_reward, tier, enemy_id=None):
         self.name = name
+        self.enemy_id = enemy_id  # Template id, or None for enemies built on the fly
+        self.tier = tier  # EnemyTier; see enemies.ENEMY_TIERS for what it implies
         self.hp = hp
         self.min_damage = min_damage
         self.max_damage = max_damage
@@ -82,167 +141,296 @@ class Enemy:
     def take_damage(self, amount):
         self.hp = max(0, self.hp - amount)
         
-    def attack(self):
-        return random.randint(self.min_damage, self.max_damage)
+    def attack(self, rng):
+        return rng.randint(self.min_damage, self.max_damage)
+
+    def __reduce__(self):
+        if self.enemy_id is not None:
+            return (create_enemy, (self.enemy_id, self.hp))
+        return (Enemy, (self.name, self.hp, self.min_damage, self.max_damage, self.credits_reward, self.tier))
 
 class CombatItem:
-    def __init__(self, name, description, effect):
+    def __init__(self, name, description, item_id):
         self.name = name
         self.description = description
-        self.effect = effect  # Function that will be called when item is used
+        self.item_id = item_id  # What resolve_turn does with it: "medkit", "shield" or "grenade"
+
+    def __reduce__(self):
+        if self.item_id in ITEM_TEMPLATES:
+            return (create_item, (self.item_id,))
+        return (CombatItem, (self.name, self.description, self.item_id))
+
+# --- Combat rules -----------------------------------------------------------
+# resolve_turn() is the whole rulebook for a fight. It never prints or asks
+# anything: it takes a CombatState and an action and returns the new state
+# plus a list of event tuples, which Combat turns into text.
+
+MEDKIT_HEAL = 30
+GRENADE_DAMAGE = (15, 35)
+BASE_ESCAPE_CHANCE = 0.10
+ESCAPE_CHANCE_PER_SPEED = 0.05  # Each ship speed level past 1
+
+ATTACK = "attack"
+ESCAPE = "escape"
+
+def use_item(index):
+    """Action that uses the item at index in CombatState.items"""
+    return ("item", index)
+
+CombatState = namedtuple("CombatState", [
+    "player_hp", "player_max_hp", "player_damage", "armor",
+    "enemy_hp", "enemy_min_damage", "enemy_max_damage", "credits_reward", "drop_table",
+    "ship_speed", "items", "shield_active", "enemy_stunned", "outcome",
+])
+CombatState.__doc__ = """Everything resolve_turn needs to know about a fight.
+
+items is a tuple of item ids; outcome is None while the fight is on, then
+"victory", "escaped" or "defeat".
+"""
+
+def escape_chance(ship_speed):
+    """Chance of getting away from a fight"""
+    return BASE_ESCAPE_CHANCE + (ship_speed - 1) * ESCAPE_CHANCE_PER_SPEED
+
+def resolve_turn(state, action, rng):
+    """Resolve one round: the player's action, then the enemy's response.
+
+    Args:
+        state: CombatState before the round
+        action: ATTACK, ESCAPE or use_item(index)
+        rng: The game's GameRNG (rolls come from its combat and loot streams)
+
+    Returns:
+        (new CombatState, list of events). Events are tuples:
+        ("player_attack", damage), ("item_used", item_id, amount),
+        ("escaped",), ("escape_failed",), ("enemy_defeated", credits),
+        ("drop", equipment), ("enemy_stunned",), ("shield_blocked",),
+        ("armor_absorbed", amount), ("enemy_attack", damage),
+        ("player_defeated",)
+    """
+    events = []
+
+    # Player's turn
+    if action == ATTACK:
+        damage = state.player_damage
+        state = state._replace(enemy_hp=max(0, state.enemy_hp - damage))
+        events.append(("player_attack", damage))
+    elif action == ESCAPE:
+        if rng.combat.chance(escape_chance(state.ship_speed)):
+            events.append(("escaped",))
+            return state._replace(outcome="escaped"), events
+        events.append(("escape_failed",))
+    else:
+        _, index = action
+        item_id = state.items[index]
+        state = state._replace(items=state.items[:index] + state.items[index + 1:])
+        if item_id == "medkit":
+            healed = min(state.player_max_hp, state.player_hp + MEDKIT_HEAL) - state.player_hp
+            state = state._replace(player_hp=state.player_hp + healed)
+            events.append(("item_used", item_id, healed))
+        elif item_id == "shield":
+            state = state._replace(shield_active=True)
+            events.append(("item_used", item_id, 0))
+        elif item_id == "grenade":
+            damage = rng.combat.randint(*GRENADE_DAMAGE)
+            state = state._replace(enemy_hp=max(0, state.enemy_hp - damage))
+            events.append(("item_used", item_id, damage))
+        else:
+            raise ValueError(f"Unknown combat item: {item_id}")
+
+    # Check if enemy died
+    if state.enemy_hp <= 0:
+        events.append(("enemy_defeated", state.credits_reward))
+        dropped_item = get_enemy_weapon_drop(state.drop_table, rng.loot)
+        if dropped_item:
+            events.append(("drop", dropped_item))
+        return state._replace(outcome="victory"), events
+
+    # Enemy's turn
+    if state.enemy_stunned:
+        events.append(("enemy_stunned",))
+        return state._replace(enemy_stunned=False), events
+
+    raw_damage = rng.combat.randint(state.enemy_min_damage, state.enemy_max_damage)
+    if state.shield_active:
+        events.append(("shield_blocked",))
+        return state._replace(shield_active=False), events
+
+    # Apply armor reduction
+    final_damage = max(0, raw_damage - state.armor)
+    if state.armor > 0:
+        events.append(("armor_absorbed", state.armor))
+    state = state._replace(player_hp=state.player_hp - final_damage)
+    events.append(("enemy_attack", final_damage))
+
+    if state.player_hp <= 0:
+        events.append(("player_defeated",))
+        state = state._replace(outcome="defeat")
+    return state, events
 
 class Combat:
     def __init__(self, game, enemy):
         self.game = game
+        self.io = game.io
+        self.rng = game.rng
         self.player = game.player
         self.enemy = enemy
         self.shield_active = False  # Tracks if a shield item is protecting player
         self.enemy_stunned = False  # Tracks if enemy should skip next turn
         
     def display_status(self):
-        print("\n=== Combat Status ===")
-        print(f"Your HP: {self.player.hp}/{self.player.max_hp}")
+        self.io.print("\n=== Combat Status ===")
+        self.io.print(f"Your HP: {self.player.hp}/{self.player.max_hp}")
         if self.shield_active:
-            print("Shield: ACTIVE")
+            self.io.print("Shield: ACTIVE")
         if self.player.weapon:
-            print(f"Weapon: {self.player.weapon.name}")
+            self.io.print(f"Weapon: {self.player.weapon.name}")
         if self.player.armor_item:
-            print(f"Armor: {self.player.armor_item.name}")
-        print(f"{self.enemy.name} HP: {self.enemy.hp}")
-        print("=" * 20)
+            self.io.print(f"Armor: {self.player.armor_item.name}")
+        self.io.print(f"{self.enemy.name} HP: {self.enemy.hp}")
+        self.io.print("=" * 20)
         
-    def player_turn(self):
-        print("\nYour turn! What would you like to do?")
-        print("1. Attack")
-        print("2. Use Item")
-        print("3. Try to Escape")
+    def _state(self):
+        """Snapshot the fight as a CombatState for resolve_turn"""
+        return CombatState(
+            player_hp=self.player.hp,
+            player_max_hp=self.player.max_hp,
+            player_damage=self.player.get_total_damage(),
+            armor=self.player.armor_item.defense if self.player.armor_item else 0,
+            enemy_hp=self.enemy.hp,
+            enemy_min_damage=self.enemy.min_damage,
+            enemy_max_damage=self.enemy.max_damage,
+            credits_reward=self.enemy.credits_reward,
+            drop_table=tier_profile(self.enemy).drop_table,
+            ship_speed=self.game.ship.speed,
+            items=tuple(item.item_id for item in self.player.items),
+            shield_active=self.shield_active,
+            enemy_stunned=self.enemy_stunned,
+            outcome=None,
+        )
+
+    def choose_action(self):
+        """Ask the player what to do; returns an action for resolve_turn, or None for the cheat"""
+        self.io.print("\nYour turn! What would you like to do?")
+        self.io.print("1. Attack")
+        self.io.print("2. Use Item")
+        self.io.print("3. Try to Escape")
         
         while True:
             try:
-                choice = input("\nEnter choice (1-3): ")
+                choice = self.io.input("\nEnter choice (1-3): ")
                 if choice == "saveme":
-                    print("cheating...")
-                    return False
+                    self.io.print("cheating...")
+                    return None
                 choice = int(choice)
                 if choice == 1:
-                    # Use total damage (base + weapon)
-                    damage = self.player.get_total_damage()
-                    self.enemy.take_damage(damage)
-                    print(f"\nYou attack for {damage} damage!")
-                    wait_for_enter()
-                    return True
+                    return ATTACK
                     
                 elif choice == 2:
                     if not self.player.items:
-                        print("\nNo items to use!")
-                        wait_for_enter()
+                        self.io.print("\nNo items to use!")
+                        self.io.wait_for_enter()
                         continue
                         
-                    print("\nAvailable Items:")
+                    self.io.print("\nAvailable Items:")
                     for i, item in enumerate(self.player.items, 1):
-                        print(f"{i}. {item.name} - {item.description}")
-                    print("\n0. Cancel")
+                        self.io.print(f"{i}. {item.name} - {item.description}")
+                    self.io.print("\n0. Cancel")
                     
                     try:
-                        item_choice = int(input("\nChoose item:"))
+                        item_choice = int(self.io.input("\nChoose item:"))
                         if 1 <= item_choice <= len(self.player.items):
-                            item = self.player.items[item_choice - 1]
-                            item.effect(self)  # Use the item
-                            self.player.items.remove(item)  # Remove after use
-                            return True
+                            return use_item(item_choice - 1)
                         elif item_choice == 0:
                             continue
                     except ValueError:
-                        print("Invalid choice")
+                        self.io.print("Invalid choice")
                         
                 elif choice == 3:
-                    # Base escape chance is increased by ship speed
-                    base_escape_chance = 0.10
-                    speed_bonus = (self.game.ship.speed - 1) * 0.05  # Each level adds 12% chance
-                    escape_chance = base_escape_chance + speed_bonus
-                    
-                    #print(f"\nYour ship's speed rating: {self.game.ship.speed}")
-                    #escape_percent = int(escape_chance * 100)
-                    #print(f"Estimated escape chance: {escape_percent}%")
-                    #wait_for_enter()
-                    
-                    if DiceRoller.chance(escape_chance):
-                        print("\nYou manage to escape!")
-                        wait_for_enter()
-                        return False
-                    else:
-                        print("\nCouldn't get away!")
-                        wait_for_enter()
-                        return True
+                    return ESCAPE
             except ValueError:
-                print("Invalid choice. Please enter 1-3.")
-    
-    def enemy_turn(self):
-        # Check if enemy is stunned
-        if self.enemy_stunned:
-            print(f"\n{self.enemy.name} is stunned and skips their turn!")
-            self.enemy_stunned = False  # Reset stunned flag after one turn
-            wait_for_enter()
-            return
-            
-        raw_damage = self.enemy.attack()
-        
-        if self.shield_active:
-            print("\nYour shield absorbs the attack!")
-            self.shield_active = False
-            wait_for_enter()
-            return
-            
-        # Apply armor reduction
-        armor_reduction = self.player.armor_item.defense if self.player.armor_item else 0
-        final_damage = max(0, raw_damage - armor_reduction)
-        
-        if armor_reduction > 0:
-            print(f"\nYour armor absorbs {armor_reduction} damage!")
-            
-        self.player.hp -= final_damage
-        print(f"\n{self.enemy.name} attacks for {final_damage} damage!")
-        wait_for_enter()
+                self.io.print("Invalid choice. Please enter 1-3.")
+
+    def _apply(self, state, action):
+        """Copy the result of a round back onto the player and enemy"""
+        self.player.hp = state.player_hp
+        self.enemy.hp = state.enemy_hp
+        self.shield_active = state.shield_active
+        self.enemy_stunned = state.enemy_stunned
+        if action not in (ATTACK, ESCAPE):
+            del self.player.items[action[1]]  # Used up
+
+    def narrate(self, events):
+        """Print what happened in a round. Returns a dropped item, if any."""
+        dropped_item = None
+        for event in events:
+            kind = event[0]
+            if kind == "player_attack":
+                self.io.print(f"\nYou attack for {event[1]} damage!")
+                self.io.wait_for_enter()
+            elif kind == "item_used":
+                if event[1] == "medkit":
+                    self.io.print(f"\nUsed medkit! Healed {MEDKIT_HEAL} HP")
+                elif event[1] == "shield":
+                    self.io.print("\nShield activated! Next attack will be blocked")
+                else:
+                    self.io.print(f"\nExplosive grenade detonates! Deals {event[2]} damage!")
+                self.io.wait_for_enter()
+            elif kind == "escaped":
+                self.io.print("\nYou manage to escape!")
+                self.io.wait_for_enter()
+            elif kind == "escape_failed":
+                self.io.print("\nCouldn't get away!")
+                self.io.wait_for_enter()
+            elif kind == "enemy_defeated":
+                self.io.print(f"\n{self.enemy.name} defeated!")
+                self.io.print(f"You found {event[1]} credits!")
+                self.io.wait_for_enter()
+            elif kind == "drop":
+                dropped_item = event[1]
+            elif kind == "enemy_stunned":
+                self.io.print(f"\n{self.enemy.name} is stunned and skips their turn!")
+                self.io.wait_for_enter()
+            elif kind == "shield_blocked":
+                self.io.print("\nYour shield absorbs the attack!")
+                self.io.wait_for_enter()
+            elif kind == "armor_absorbed":
+                self.io.print(f"\nYour armor absorbs {event[1]} damage!")
+            elif kind == "enemy_attack":
+                self.io.print(f"\n{self.enemy.name} attacks for {event[1]} damage!")
+                self.io.wait_for_enter()
+            elif kind == "player_defeated":
+                self.io.print("\nYou've been defeated...")
+                self.io.wait_for_enter()
+        return dropped_item
     
     def run(self):
-        """Main combat loop"""
-        print(f"\nEngaging {self.enemy.name}!")
-        wait_for_enter()
+        """Main combat loop: ask, resolve, narrate, repeat"""
+        self.io.print(f"\nEngaging {self.enemy.name}!")
+        self.io.wait_for_enter()
         
         while self.enemy.is_alive() and self.player.hp > 0:
             self.display_status()
             
-            # Player's turn
-            if not self.player_turn():  # If player escaped
+            action = self.choose_action()
+            if action is None:  # Cheat code: walk away from the fight
                 return "escaped"
-            
-            # Check if enemy died
-            if not self.enemy.is_alive():
-                print(f"\n{self.enemy.name} defeated!")
-                
-                # Award credits
-                self.player.credits += self.enemy.credits_reward
-                print(f"You found {self.enemy.credits_reward} credits!")
-                wait_for_enter()
-                
-                # Check for equipment drops
-                dropped_item = get_enemy_weapon_drop(self.enemy.name)
+
+            state, events = resolve_turn(self._state(), action, self.rng)
+            self._apply(state, action)
+            dropped_item = self.narrate(events)
+
+            if state.outcome == "escaped":
+                return "escaped"
+            if state.outcome == "victory":
+                self.player.credits += state.credits_reward
                 if dropped_item:
                     self._handle_equipment_drop(dropped_item)
-                
                 return "victory"
-            
-            # Enemy's turn
-            self.enemy_turn()
-            
-            # Check if player died
-            if self.player.hp <= 0:
-                print("\nYou've been defeated...")
-                self.game.game_over = True
-                wait_for_enter()
-                print("\nGame Over!")
-                print(f"You survived {self.game.day} days")
-                quit()        
+            if state.outcome == "defeat":
+                self.io.print("\nGame Over!")
+                self.io.print(f"You survived {self.game.day} days")
+                raise GameEnded(self.game.end_game("DEATH", f"Killed by {self.enemy.name}"))
         return "defeat"  # Shouldn't reach here but just in case
     
     def _handle_equipment_drop(self, item):
@@ -250,51 +438,51 @@ class Combat:
         from equipment import Weapon, Armor
         
         item_type = "weapon" if isinstance(item, Weapon) else "armor"
-        print(f"\nThe {self.enemy.name} dropped {item.name}!")
-        print(f"{item}")
+        self.io.print(f"\nThe {self.enemy.name} dropped {item.name}!")
+        self.io.print(f"{item}")
         
         # Compare with current equipment
         current_item = self.player.weapon if item_type == "weapon" else self.player.armor_item
         
         if current_item:
-            print(f"\nYour current {item_type}: {current_item}")
+            self.io.print(f"\nYour current {item_type}: {current_item}")
             
             # For weapons, compare damage
             if item_type == "weapon":
                 if item.damage > current_item.damage:
-                    print("This weapon does more damage than your current one.")
+                    self.io.print("This weapon does more damage than your current one.")
                 else:
-                    print("This weapon does less damage than your current one.")
+                    self.io.print("This weapon does less damage than your current one.")
             # For armor, compare defense
             else:
                 if item.defense > current_item.defense:
-                    print("This armor provides more protection than your current one.")
+                    self.io.print("This armor provides more protection than your current one.")
                 else:
-                    print("This armor provides less protection than your current one.")
+                    self.io.print("This armor provides less protection than your current one.")
         
         # Ask player if they want to take it
-        print("\nTake it?")
-        print("1. Yes")
-        print("2. No")
+        self.io.print("\nTake it?")
+        self.io.print("1. Yes")
+        self.io.print("2. No")
         
         while True:
             try:
-                choice = int(input("\nEnter choice (1-2): "))
+                choice = int(self.io.input("\nEnter choice (1-2): "))
                 if choice == 1:
                     if item_type == "weapon":
                         self.player.weapon = item
-                        print(f"\nEquipped {item.name}!")
+                        self.io.print(f"\nEquipped {item.name}!")
                     else:  # armor
                         self.player.armor_item = item
-                        print(f"\nEquipped {item.name}!")
-                    wait_for_enter()
+                        self.io.print(f"\nEquipped {item.name}!")
+                    self.io.wait_for_enter()
                     break
                 elif choice == 2:
-                    print("\nYou leave it behind.")
-                    wait_for_enter()
+                    self.io.print("\nYou leave it behind.")
+                    self.io.wait_for_enter()
                     break
             except ValueError:
-                print("Please enter a valid choice (1-2)")
+                self.io.print("Please enter a valid choice (1-2)")
                 
 # Export enemies for use in other files
-__all__ = ['LOCAL_DEPUTY', 'SECTOR_BADGE', 'FEDERATION_RANGER', 'GALACTIC_ENFORCER', 'BountyHunter', 'Combat', 'CombatItem', 'Enemy', 'MEDKIT', 'SHIELD', 'STUN_GRENADE'] 
\ No newline at end of file
+__all__ = ['ItemTemplate', 'EnemyTemplate', 'ITEM_TEMPLATES', 'ENEMY_TEMPLATES', 'item_template', 'enemy_template', 'create_item', 'create_enemy', 'CombatState', 'resolve_turn', 'ATTACK', 'ESCAPE', 'use_item', 'escape_chance', 'LOCAL_DEPUTY', 'SECTOR_BADGE', 'FEDERATION_RANGER', 'GALACTIC_ENFORCER', 'BountyHunter', 'BountyRoster', 'Combat', 'CombatItem', 'Enemy', 'MEDKIT', 'SHIELD', 'STUN_GRENADE'] 
\ No newline at end of file
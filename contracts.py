@@ -1,27 +1,26 @@
-from utils import DiceRoller, wait_for_enter
-import random
-from trade_hub_gameplay import handle_trade_hub
-from fights import CartelEncounter
+from utils import lazy_import
+
+fights = lazy_import("fights")  # Only needed once the cartel turns up
 
 class Crate:
-    def __init__(self, tier):
+    def __init__(self, tier, rng):
         self.tier = tier  # "legit", "illicit", or "sealed"
         self.contents = None  # Will be revealed when opened
         self.is_opened = False
         self.is_stone = False
         self.stone_type = None
-        self.value = self._set_value()  # Set initial value based on tier
+        self.value = self._set_value(rng)  # Set initial value based on tier
     
-    def _set_value(self):
+    def _set_value(self, rng):
         """Calculate the value of the crate"""
         if self.tier == "legit":
-            return DiceRoller.d6() * 100
+            return rng.loot.d6() * 100
         elif self.tier == "illicit":
-            return DiceRoller.d6() * 500
+            return rng.loot.d6() * 500
         else:  # sealed
-            return DiceRoller.d6() * 1000
+            return rng.loot.d6() * 1000
 
-    def open(self, contract=None, game=None):
+    def open(self, contract, game):
         """Open the crate and determine its contents"""
         if self.is_opened:
             return self.contents, self.value
@@ -37,8 +36,8 @@ class Crate:
                 "Strange symbols glow briefly on the crate's surface...",
                 "A cold mist escapes as the crate unseals..."
             ]
-            print(random.choice(tension_lines))
-            wait_for_enter()
+            game.io.print(game.rng.flavor.choice(tension_lines))
+            game.io.wait_for_enter()
         
         # Determine if it's a stone based on tier
         stone_chance = {
@@ -47,7 +46,7 @@ class Crate:
             "sealed": 0.15  # 15% chance
         }
         
-        if DiceRoller.chance(stone_chance[self.tier]):
+        if game.rng.loot.chance(stone_chance[self.tier]):
             self.is_stone = True
             # List of available stones
             stones = ["Space", "Mind", "Reality", "Power", "Soul", "Time"]
@@ -67,20 +66,20 @@ class Crate:
             if not available_stones:
                 self.is_stone = False
             else:
-                self.stone_type = random.choice(available_stones)
+                self.stone_type = game.rng.loot.choice(available_stones)
                 self.contents = f"{self.stone_type} Stone"
-                self.value = random.randint(5, 10) * 10000 # Update value for stone
+                self.value = game.rng.loot.randint(5, 10) * 10000 # Update value for stone
                 
                 # Dramatic stone discovery
-                if random.random() < 0.5:
+                if game.rng.flavor.random() < 0.5:
                     nova_stone_lines = [
                         "[NOVA] 'Well, that's not in any shipping manifest I've ever seen.'",
                         "[NOVA] 'I'm reading energy signatures that shouldn't exist. Congratulations, you found trouble.'",
                         "[NOVA] 'My sensors are going crazy. Whatever that is, it's not from around here.'",
                         "[NOVA] 'If that thing starts glowing, I'm ejecting you into space.'"
                     ]
-                    print(random.choice(nova_stone_lines))
-                    wait_for_enter()
+                    game.io.print(game.rng.flavor.choice(nova_stone_lines))
+                    game.io.wait_for_enter()
         
         if not self.is_stone:
             # Generate normal contents based on tier
@@ -109,10 +108,10 @@ class Crate:
                     "Temporal Stabilizer",
                     "Strange Device"
                 ]
-            self.contents = random.choice(contents_list)
+            self.contents = game.rng.loot.choice(contents_list)
             
             # Occasional NOVA comment on contents
-            if random.random() < 0.2:
+            if game.rng.flavor.random() < 0.2:
                 if self.tier == "illicit":
                     nova_comments = [
                         "[NOVA] 'That's definitely not legal in most systems.'",
@@ -130,36 +129,36 @@ class Crate:
                         "[NOVA] 'Finally, something normal. I was starting to worry.'",
                         "[NOVA] 'Standard cargo. How refreshingly boring.'"
                     ]
-                print(random.choice(nova_comments))
-                wait_for_enter()
+                game.io.print(game.rng.flavor.choice(nova_comments))
+                game.io.wait_for_enter()
         
         return self.contents, self.value
 
 class Contract:
-    def __init__(self, max_crates):
+    def __init__(self, max_crates, rng):
         self.crates = []
         # First determine distance (sectors to travel)
-        self.distance = DiceRoller.d6() + 2  # 3-8 sectors
+        self.distance = rng.contracts.d6() + 2  # 3-8 sectors
         # Deadline must be >= distance to be possible
-        self.deadline = max(self.distance, DiceRoller.d6() + 4)  # Ensures deadline >= distance
+        self.deadline = max(self.distance, rng.contracts.d6() + 4)  # Ensures deadline >= distance
         self.sectors_traveled = 0
         self.base_reward = 0
         self.reward = 0
-        self._generate_crates(max_crates)
+        self._generate_crates(max_crates, rng)
         self._calculate_reward()
     
     def is_illegal(self):
         """Check if the contract contains any illicit or sealed crates"""
         return any(crate.tier in ['illicit', 'sealed'] for crate in self.crates)
     
-    def _generate_crates(self, max_crates):
+    def _generate_crates(self, max_crates, rng):
         # Generate 1 to max_crates number of crates
-        num_crates = random.randint(1, max_crates)
+        num_crates = rng.contracts.randint(1, max_crates)
         
-        for _ in range(num_crates):
+        # Roll every crate's tier in one batch
+        for roll in rng.contracts.d100(num_crates):
             # Weight the random choice towards legit crates
             # Weight heavily towards legit crates
-            roll = DiceRoller.d100()
             # More balanced distribution:
             # 60% legit, 25% illicit, 15% sealed
             if roll <= 50:  # 60% chance
@@ -169,7 +168,7 @@ class Contract:
             else:  # 15% chance
                 tier = "sealed"
             
-            crate = Crate(tier)
+            crate = Crate(tier, rng)
             self.crates.append(crate)
             self.base_reward += crate.value
     
@@ -219,7 +218,7 @@ class Contract:
         game.player.current_contract = self
         
         # Occasional contract acceptance flavor
-        if random.random() < 0.4:
+        if game.rng.flavor.random() < 0.4:
             if self.is_illegal():
                 contract_warnings = [
                     "The handler's eyes dart around nervously as they hand over the manifest.",
@@ -238,11 +237,11 @@ class Contract:
                     "The paperwork is filed in triplicate. Everything by the book.",
                     "'Safe travels,' the handler says with a smile."
                 ]
-            print(random.choice(contract_warnings if self.is_illegal() else contract_acceptance))
-            wait_for_enter()
+            game.io.print(game.rng.flavor.choice(contract_warnings if self.is_illegal() else contract_acceptance))
+            game.io.wait_for_enter()
         
         # NOVA quips about contract acceptance
-        if random.random() < 0.3:
+        if game.rng.flavor.random() < 0.3:
             if self.is_illegal():
                 nova_illegal_quips = [
                     "[NOVA] 'You sure about this? My insurance doesn't cover acts of stupidity.'",
@@ -256,8 +255,8 @@ class Contract:
                     "[NOVA] 'Finally, something that won't get us shot at.'",
                     "[NOVA] 'I like these boring contracts. They're good for my stress levels.'"
                 ]
-            print(random.choice(nova_illegal_quips if self.is_illegal() else nova_legal_quips))
-            wait_for_enter()
+            game.io.print(game.rng.flavor.choice(nova_illegal_quips if self.is_illegal() else nova_legal_quips))
+            game.io.wait_for_enter()
         
         return True
 
@@ -289,15 +288,15 @@ class Contract:
     def check_deadline(self, game):
         """Handle contract deadline and consequences"""
         if self.deadline <= 0:  # Already at 0, now expires
-            print("\nContract expired! The cartel is not happy...")
-            if random.random() < 0.4:
-                print("[NOVA] 'I tried to warn you about time management.'")
-            wait_for_enter()
-            print("They're coming to collect their cargo...")
-            wait_for_enter()
+            game.io.print("\nContract expired! The cartel is not happy...")
+            if game.rng.flavor.random() < 0.4:
+                game.io.print("[NOVA] 'I tried to warn you about time management.'")
+            game.io.wait_for_enter()
+            game.io.print("They're coming to collect their cargo...")
+            game.io.wait_for_enter()
             
             # Trigger cartel encounter instead of TODO
-            cartel = CartelEncounter(game)
+            cartel = fights.CartelEncounter(game)
             result = cartel.run()
             
             if result == "game_over":
@@ -309,10 +308,10 @@ class Contract:
 
     def handle_arrival(self, game):
         """Handle arrival at destination"""
-        print("\nYou've arrived at your destination!")
+        game.io.print("\nYou've arrived at your destination!")
         
         # Arrival atmosphere
-        if random.random() < 0.4:
+        if game.rng.flavor.random() < 0.4:
             arrival_descriptions = [
                 "The docking clamps engage with a satisfying thunk.",
                 "You can see other cargo haulers loading and unloading nearby.",
@@ -320,45 +319,45 @@ class Contract:
                 "Security scanners sweep your ship as you land.",
                 "A ground crew waves you toward a loading bay."
             ]
-            print(random.choice(arrival_descriptions))
-            wait_for_enter()
+            game.io.print(game.rng.flavor.choice(arrival_descriptions))
+            game.io.wait_for_enter()
 
         
-        if random.random() < 0.25:
+        if game.rng.flavor.random() < 0.25:
             nova_arrival_quips = [
                 "[NOVA] 'Docking complete. Try not to do anything suspicious.'",
                 "[NOVA] 'We made it in one piece. I'm as surprised as you are.'",
                 "[NOVA] 'Time to see if your cargo is what they ordered.'"
             ]
-            print(random.choice(nova_arrival_quips))
-            wait_for_enter()
+            game.io.print(game.rng.flavor.choice(nova_arrival_quips))
+            game.io.wait_for_enter()
 
 
-        print("Opening crates to verify contents...")
-        wait_for_enter()
+        game.io.print("Opening crates to verify contents...")
+        game.io.wait_for_enter()
         
         # Open all crates and reveal contents
         stones_found = []
-        print("\nCrate Contents:")
+        game.io.print("\nCrate Contents:")
         for i, crate in enumerate(self.crates, 1):
-            print(f"\nCrate {i}:")
-            print("Opening seal...")
-            wait_for_enter()
+            game.io.print(f"\nCrate {i}:")
+            game.io.print("Opening seal...")
+            game.io.wait_for_enter()
             
             contents, value = crate.open(self, game)
 
             if crate.is_stone:
-                print("An otherworldly energy pulses through the ground as you open the crate...")
-                wait_for_enter()
-                print(f"Contains the {crate.stone_type} Stone! Value: {value:,} credits")
-                wait_for_enter()
+                game.io.print("An otherworldly energy pulses through the ground as you open the crate...")
+                game.io.wait_for_enter()
+                game.io.print(f"Contains the {crate.stone_type} Stone! Value: {value:,} credits")
+                game.io.wait_for_enter()
                 stones_found.append(crate)
-                game.player.stones_discovered.append(crate.stone_type)
+                game.player.discover_stone(crate.stone_type, "delivery")
 
                 # Each stone adds heat to the player
                 game.player.heat += 5
             else:   
-                print(f"Contains: {contents} | Value: {value:,} credits")
+                game.io.print(f"Contains: {contents} | Value: {value:,} credits")
         
         # Recalculate reward based on actual opened crate values
         self._recalculate_reward_after_opening()
@@ -367,23 +366,23 @@ class Contract:
         if self.deadline > 0:
             bonus_per_day = self.reward * 0.05  # 5% bonus per day early
             total_bonus = int(bonus_per_day * self.deadline)
-            print(f"\nThe seller is impressed that you are {self.deadline} days early and offers a bonus of {total_bonus:,} credits!")
-            wait_for_enter()
+            game.io.print(f"\nThe seller is impressed that you are {self.deadline} days early and offers a bonus of {total_bonus:,} credits!")
+            game.io.wait_for_enter()
 
-            if random.random() < 0.3:
+            if game.rng.flavor.random() < 0.3:
                 nova_time_quips = [
                 "[NOVA] 'Wow, you made it early. I never thought I'd see the day.'",
                 "[NOVA] 'Good work, I guess.Let's try to keep this up.'",
                 "[NOVA] 'Punctuality pays. Who would have thought?'"
                 ]
-                print(random.choice(nova_time_quips))
-                wait_for_enter()
+                game.io.print(game.rng.flavor.choice(nova_time_quips))
+                game.io.wait_for_enter()
             self.reward += total_bonus
         
         # Display payment breakdown
-        print("\n" + "="*50)
-        print("PAYMENT BREAKDOWN")
-        print("="*50)
+        game.io.print("\n" + "="*50)
+        game.io.print("PAYMENT BREAKDOWN")
+        game.io.print("="*50)
         
         # Calculate components for display
         base_crate_value = sum(crate.value for crate in self.crates)
@@ -392,70 +391,70 @@ class Contract:
         base_reward = int(base_crate_value * deadline_multiplier)
         early_bonus = self.reward - base_reward if self.deadline > 0 else 0
         
-        print(f"Crate Values:        {base_crate_value:,} credits")
-        print(f"Time Pressure: x{deadline_multiplier:.2f}")
-        print(f"Base Payment:        {base_reward:,} credits")
+        game.io.print(f"Crate Values:        {base_crate_value:,} credits")
+        game.io.print(f"Time Pressure: x{deadline_multiplier:.2f}")
+        game.io.print(f"Base Payment:        {base_reward:,} credits")
         if early_bonus > 0:
-            print(f"Early Bonus:         +{early_bonus:,} credits")
-        print("-" * 50)
-        print(f"TOTAL PAYMENT:       {self.reward:,} credits")
-        print("="*50)
-        wait_for_enter()
+            game.io.print(f"Early Bonus:         +{early_bonus:,} credits")
+        game.io.print("-" * 50)
+        game.io.print(f"TOTAL PAYMENT:       {self.reward:,} credits")
+        game.io.print("="*50)
+        game.io.wait_for_enter()
         
-        print("\nWhat would you like to do?")
-        print("1. Complete delivery")
-        print("2. Steal the cargo")
+        game.io.print("\nWhat would you like to do?")
+        game.io.print("1. Complete delivery")
+        game.io.print("2. Steal the cargo")
         
         while True:
             try:
-                choice = int(input("\nEnter your choice (1-2): "))
+                choice = int(game.io.input("\nEnter your choice (1-2): "))
                 if choice == 1:
                     # Complete delivery
-                    print("\nThe client accepts the delivery...")
+                    game.io.print("\nThe client accepts the delivery...")
                     
                     # Client dialogue based on what was delivered
-                    if random.random() < 0.3:
+                    if game.rng.flavor.random() < 0.3:
                         if stones_found:
                             client_stone_dialogue = [
                                 "'Excellent work. This will change everything.'",
                                 "'You have no idea what you've just delivered. He will be very pleased.'",
                                 "'The universe is about to shift, thanks to you.'"
                             ]
-                            print(f"\n{random.choice(client_stone_dialogue)}")
+                            game.io.print(f"\n{game.rng.flavor.choice(client_stone_dialogue)}")
                         elif self.is_illegal():
                             client_illegal_dialogue = [
                                 "'Good. No questions asked, as agreed.'",
                                 "'The less you know about this, the better.'",
                                 "'Look, pretend this transaction never happened.'"
                             ]
-                            print(f"\n{random.choice(client_illegal_dialogue)}")
+                            game.io.print(f"\n{game.rng.flavor.choice(client_illegal_dialogue)}")
                         else:
                             client_legal_dialogue = [
                                 "'Perfect condition. Exactly what we ordered.'",
                                 "'Excellent work. We'll use your services again.'",
                                 "'A professional job. Thank you.'"
                             ]
-                            print(f"\n{random.choice(client_legal_dialogue)}")
-                    wait_for_enter()
+                            game.io.print(f"\n{game.rng.flavor.choice(client_legal_dialogue)}")
+                    game.io.wait_for_enter()
                     
                     # If we delivered any stones, track them
                     if stones_found:
-                        print("\nAs you hand over the stones, you feel the weight of your decision...")
-                        wait_for_enter()
-                        print("The universe may never be the same...")
-                        if random.random() < 0.3:
+                        game.io.print("\nAs you hand over the stones, you feel the weight of your decision...")
+                        game.io.wait_for_enter()
+                        game.io.print("The universe may never be the same...")
+                        if game.rng.flavor.random() < 0.3:
                             # INSERT_YOUR_CODE
                             nova_lines = [
                                 "[NOVA] 'I hope you know what you just did.'",
                                 "[NOVA] 'Well, at least we don't have to deal with those on us.'"
                             ]
-                            print(random.choice(nova_lines))
-                        wait_for_enter()
+                            game.io.print(game.rng.flavor.choice(nova_lines))
+                        game.io.wait_for_enter()
                         
                     game.player.credits += self.reward
-                    print(f"You earned {self.reward:,} credits!")
+                    game.io.print(f"You earned {self.reward:,} credits!")
                     
-                    wait_for_enter()
+                    game.io.wait_for_enter()
                     
                     # Clear contract
                     game.player.current_contract = None
@@ -463,9 +462,9 @@ class Contract:
                     
                 elif choice == 2:
                     # Steal cargo
-                    print("\nYou decide to keep the cargo for yourself - the cartel won't be happy about this...")
+                    game.io.print("\nYou decide to keep the cargo for yourself - the cartel won't be happy about this...")
                     
-                    wait_for_enter()
+                    game.io.wait_for_enter()
                     
                     # Major heat increase for stealing
                     game.player.heat += 30
@@ -474,25 +473,25 @@ class Contract:
                     # Add all items to inventory
                     for crate in self.crates:
                         if crate.is_stone:
-                            game.player.stones.append(crate.stone_type)
-                            print(f"\nThe {crate.stone_type} Stone pulses with energy as you pocket it...")
-                            if random.random() < 0.3:
-                                print("[NOVA] 'That thing is giving off readings I can't even classify.'")
-                            wait_for_enter()
+                            game.player.take_stone(crate.stone_type, "theft")
+                            game.io.print(f"\nThe {crate.stone_type} Stone pulses with energy as you pocket it...")
+                            if game.rng.flavor.random() < 0.3:
+                                game.io.print("[NOVA] 'That thing is giving off readings I can't even classify.'")
+                            game.io.wait_for_enter()
                         else:
                             game.player.inventory.append({
-                                'name': crate.contents,
+                                'name': crate.contents or f"Unopened {crate.tier.title()} Crate",
                                 'value': crate.value,
                                 'is_contraband': crate.tier in ['illicit', 'sealed']
                             })
-                            print(f"\nAdded to inventory: {crate.contents}")
-                            wait_for_enter()
+                            game.io.print(f"\nAdded to inventory: {crate.contents}")
+                            game.io.wait_for_enter()
                     
                     # Trigger cartel encounter instead of TODO
                     # 50% chance of cartel encounter
                     game.player.cartel_threat_level += 1  # Increase threat either way
-                    if DiceRoller.chance(0.5):
-                        cartel = CartelEncounter(game)
+                    if game.rng.encounters.chance(0.5):
+                        cartel = fights.CartelEncounter(game)
                         result = cartel.run()
                         if result == "game_over":
                             return "game_over"
@@ -502,7 +501,7 @@ class Contract:
                     break
                     
             except ValueError:
-                print("Invalid choice")
+                game.io.print("Invalid choice")
         
         game.check_for_endings()
         # Contract delivery is complete - let the game loop handle the next day
@@ -513,33 +512,33 @@ class TradeHub:
         self.fuel_price = 50  # Credits per unit
         self.available_contracts = []
     
-    def generate_contracts(self, max_crates):
+    def generate_contracts(self, max_crates, rng):
         """Generate new contracts respecting ship's cargo capacity"""
-        self.available_contracts = [Contract(max_crates) for _ in range(3)]
+        self.available_contracts = [Contract(max_crates, rng) for _ in range(3)]
     
-    def display_contracts(self):
-        print("\nAvailable Contracts:")
+    def display_contracts(self, io):
+        io.print("\nAvailable Contracts:")
         for i, contract in enumerate(self.available_contracts, 1):
-            print(f"\nContract {i}:")
-            print(f"Distance: {contract.distance} sectors")
-            print(f"Deadline: {contract.deadline} days")
+            io.print(f"\nContract {i}:")
+            io.print(f"Distance: {contract.distance} sectors")
+            io.print(f"Deadline: {contract.deadline} days")
             show_reward = True
             for crate in contract.crates:
                 if crate.tier.title() == "Sealed":
                     show_reward = False
             if show_reward:
-                print(f"Reward: {contract.reward:,} credits")
+                io.print(f"Reward: {contract.reward:,} credits")
             else:
-                print("Reward: ???")
+                io.print("Reward: ???")
             
-            print("Cargo:")
+            io.print("Cargo:")
             for crate in contract.crates:
-                print(f"- {crate.tier.title()} Crate")
+                io.print(f"- {crate.tier.title()} Crate")
             
             heat_risk = contract.calculate_heat_risk()
-            print(f"Heat Increase: +{heat_risk}")
+            io.print(f"Heat Increase: +{heat_risk}")
             
-            print("-" * 20)
+            io.print("-" * 20)
     
     def refuel_ship(self, player, ship, amount):
         cost = amount * self.fuel_price
@@ -549,9 +548,9 @@ class TradeHub:
             return True
         return False
     
-    def police_search(self, player):
+    def police_search(self, player, io, rng):
         """Basic police search based on heat level"""
-        if DiceRoller.chance(player.heat / 100):  # Heat is percentage chance of search
-            print("\nPOLICE SEARCH!")
+        if rng.encounters.chance(player.heat / 100):  # Heat is percentage chance of search
+            io.print("\nPOLICE SEARCH!")
             return True
         return False 
\ No newline at end of file
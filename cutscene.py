@@ -0,0 +1,75 @@
+from functools import lru_cache
+
+import narrative
+
+# Cutscene engine.
+#
+# A cutscene is a narrative table entry read as a script (see the top of
+# content/narrative.txt): plain lines are shown one at a time with a pause
+# after each, and @clear, @wait and @print are steps. How a cutscene plays
+# depends on the IO's cutscenes mode:
+#
+#   PLAY      paced by the player, who can type "skip" at any pause to jump
+#             to the end
+#   SKIP      straight to the end: only the @print lines are shown
+#   HEADLESS  nothing at all, and the table isn't even read; the game still
+#             records how it ended
+#
+# Scripted and replaying IOs are headless, so simulated games and replays
+# reach an ending without stepping through narration.
+
+PLAY = "play"
+SKIP = "skip"
+HEADLESS = "headless"
+MODES = (PLAY, SKIP, HEADLESS)
+SKIP_ANSWERS = ("s", "skip")
+
+# Steps
+LINE = "line"
+CLEAR = "clear"
+WAIT = "wait"
+PRINT = "print"
+
+@lru_cache(maxsize=None)
+def script(key):
+    """The steps of a cutscene, as (step, text) pairs"""
+    steps = []
+    for line in narrative.lines(key):
+        if line == "@clear":
+            steps.append((CLEAR, None))
+        elif line == "@wait":
+            steps.append((WAIT, None))
+        elif line.startswith("@print "):
+            steps.append((PRINT, line[len("@print "):]))
+        elif line.startswith("@"):
+            raise narrative.NarrativeError(f"Unknown cutscene step {line!r} in {key}")
+        else:
+            steps.append((LINE, line))
+    return tuple(steps)
+
+def play(io, key, mode=None, **fields):
+    """Play a cutscene on io; fields fill in {placeholders} in its text
+
+    Args:
+        mode: PLAY, SKIP or HEADLESS; defaults to io.cutscenes
+    """
+    if mode is None:
+        mode = io.cutscenes
+    if mode == HEADLESS:
+        return
+    skipping = mode == SKIP
+    for step, text in script(key):
+        if step == PRINT:
+            io.print(text.format(**fields))
+        elif skipping:
+            continue
+        elif step == CLEAR:
+            io.clear()
+        else:
+            if step == LINE:
+                io.print(text.format(**fields))
+            answer = io.wait_for_enter()
+            if answer is not None and answer.strip().lower() in SKIP_ANSWERS:
+                skipping = True
+
+__all__ = ['PLAY', 'SKIP', 'HEADLESS', 'MODES', 'script', 'play']
@@ -0,0 +1,144 @@
+from outcome import GameEnded
+
+# Ending registry.
+#
+# Every ending is a predicate over the player plus a handler that plays it
+# out. Each predicate declares the player fields it reads, and a game's
+# EndingWatch only re-evaluates a predicate after the player reported one of
+# those fields changing (see state.py), so a quiet turn costs one test.
+# Anything else worth watching for (an achievement, say) registers the
+# same way; a handler doesn't have to end the game.
+
+# Player attributes a predicate may depend on; all are in Player.OBSERVED
+FIELDS = ("credits", "stones", "stones_discovered", "rejected_kingpin")
+
+class Ending:
+    """Something the game watches for.
+
+    Args:
+        name: Name of the ending
+        depends: The FIELDS the predicate reads
+        predicate: predicate(player) -> True when the ending is reached
+        handler: handler(game), run when it is; may raise GameEnded
+    """
+
+    def __init__(self, name, depends, predicate, handler):
+        unknown = set(depends) - set(FIELDS)
+        if unknown:
+            raise ValueError(f"Ending {name} depends on unknown fields {sorted(unknown)}")
+        self.name = name
+        self.depends = frozenset(depends)
+        self.predicate = predicate
+        self.handler = handler
+
+# Predicates and handlers are module-level functions, not lambdas, so a
+# game (and its EndingWatch) can be pickled over to advisor workers
+
+def _kingpin(player):
+    return player.credits >= 1000000 and not player.rejected_kingpin
+
+def _holding_stones(player):
+    return len(player.stones) == 6
+
+def _delivered_stones(player):
+    return len(player.stones_discovered) >= 6 and len(player.stones) == 0
+
+def _stones_out_of_play(player):
+    return len(player.stones_discovered) >= 6
+
+def _offer_retirement(game):
+    io = game.io
+    io.print("\nYou've earned 1,000,000 credits!")
+    io.print("Would you like to retire and end the game?")
+    io.print("1. Yes, retire")
+    io.print("2. No, keep playing (more endings...)")
+
+    while True:
+        try:
+            choice = int(io.input("\nEnter choice (1-2): "))
+            if choice == 1:
+                game.play_cutscene("ending.denial")
+                raise GameEnded(game.end_game("DENIAL"))
+            elif choice == 2:
+                io.print("\nThe game continues...")
+                game.player.rejected_kingpin = True
+                io.wait_for_enter()
+                break
+            else:
+                io.print("Invalid choice. Please enter 1 or 2.")
+        except ValueError:
+            io.print("Invalid input. Please enter a number.")
+
+def _choose_destiny(game):
+    io = game.io
+    game.play_cutscene("ending.stones")
+
+    while True:
+        io.print("\nThe stones whisper your destiny. What is your choice?")
+        io.print("1. Ascend to Godhood")
+        io.print("2. Destroy the Stones")
+        choice = io.input("> ").strip()
+
+        if choice == "1":
+            game.play_cutscene("ending.godhood")
+            raise GameEnded(game.end_game("GODHOOD"))
+        elif choice == "2":
+            game.play_cutscene("ending.martyr")
+            raise GameEnded(game.end_game("MARTYR"))
+
+def _harbringer(game):
+    game.play_cutscene("ending.harbringer")
+    raise GameEnded(game.end_game("HARBRINGER"))
+
+def _stalemate(game):
+    game.play_cutscene("ending.stalemate")
+    raise GameEnded(game.end_game("STALEMATE"))
+
+# In the order they are checked
+ENDINGS = [
+    # Kingpin - 1 million credits, unless the player already turned it down
+    Ending("KINGPIN", ("credits", "rejected_kingpin"), _kingpin, _offer_retirement),
+    # Godhood/Martyr - holding all 6 stones
+    Ending("STONES", ("stones",), _holding_stones, _choose_destiny),
+    # Harbringer - delivered all 6 stones
+    Ending("HARBRINGER", ("stones", "stones_discovered"), _delivered_stones, _harbringer),
+    # Compromise - all stones out of play
+    Ending("STALEMATE", ("stones_discovered",), _stones_out_of_play, _stalemate),
+]
+
+class EndingWatch:
+    """One game's view of the registry: which fields changed since the last check
+
+    Args:
+        player: The Player to watch; its change events mark fields dirty
+    """
+
+    def __init__(self, player, endings=None):
+        self.endings = ENDINGS if endings is None else endings
+        self.fields = tuple(name for name in FIELDS if any(name in e.depends for e in self.endings))
+        self._dirty = set(self.fields)  # The first check evaluates everything
+        player.subscribe(self._changed, self.fields)
+
+    def copy(self, player):
+        """A watch over player (a fork's), as far along as this one"""
+        clone = EndingWatch.__new__(EndingWatch)
+        clone.endings = self.endings
+        clone.fields = self.fields
+        clone._dirty = set(self._dirty)
+        player.subscribe(clone._changed, clone.fields)
+        return clone
+
+    def _changed(self, field, old, new, cause):
+        self._dirty.add(field)
+
+    def check(self, game):
+        """Run the handler of every ending a changed field may have reached"""
+        if not self._dirty:  # A quiet turn
+            return
+        # Changes the handlers make are for the next check
+        changed, self._dirty = self._dirty, set()
+        for ending in self.endings:
+            if ending.depends & changed and ending.predicate(game.player):
+                ending.handler(game)
+
+__all__ = ['FIELDS', 'Ending', 'ENDINGS', 'EndingWatch']
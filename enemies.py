@@ -0,0 +1,75 @@
+from enum import Enum
+
+from equipment import DropTable, COMMON, UNCOMMON, RARE, EPIC, LEGENDARY
+
+class EnemyTier(Enum):
+    """What kind of enemy something is; set by the factory that creates it"""
+    LOCAL_DEPUTY = "local_deputy"
+    SECTOR_BADGE = "sector_badge"
+    FEDERATION_RANGER = "federation_ranger"
+    GALACTIC_ENFORCER = "galactic_enforcer"
+    BOUNTY_HUNTER = "bounty_hunter"
+    CARTEL = "cartel"
+    SHADOW = "shadow"
+
+class TierProfile:
+    """Everything the game needs to know about a tier, looked up once per use.
+
+    Args:
+        faction: "police", "bounty", "cartel" or "shadow"
+        drop_table: DropTable rolled when an enemy of this tier is defeated
+        bribe_base: Flat part of the bribe police of this tier ask for
+        bribe_multiplier: Extra credits asked per point of heat
+        bribe_chance: Base chance a bribe is accepted
+        search_modifier: Added to the chance of finding each crate in a search
+        run_damage: (base, die sides) damage taken when running from a patrol
+        escape_factor: Subtracted from the chance of outrunning a patrol
+        kill_heat: Heat gained for killing one during a search
+    """
+
+    def __init__(self, faction, drop_table, bribe_base=100, bribe_multiplier=5, bribe_chance=0.8,
+                 search_modifier=0.2, run_damage=(10, 6), escape_factor=0.1, kill_heat=25):
+        self.faction = faction
+        self.drop_table = drop_table
+        self.bribe_base = bribe_base
+        self.bribe_multiplier = bribe_multiplier
+        self.bribe_chance = bribe_chance
+        self.search_modifier = search_modifier
+        self.run_damage = run_damage
+        self.escape_factor = escape_factor
+        self.kill_heat = kill_heat
+
+# Common-only drops, half the time
+BASIC_DROPS = DropTable(0.5, (COMMON,), (1,))
+
+# Central registry: a new kind of enemy needs one entry here
+ENEMY_TIERS = {
+    EnemyTier.LOCAL_DEPUTY: TierProfile(
+        "police", BASIC_DROPS,
+        bribe_base=100, bribe_multiplier=5, bribe_chance=0.8,  # Very easy to bribe
+        search_modifier=0, run_damage=(10, 6), escape_factor=0.1, kill_heat=12),
+    EnemyTier.SECTOR_BADGE: TierProfile(
+        "police", DropTable(0.5, (COMMON, UNCOMMON), (70, 30)),
+        bribe_base=500, bribe_multiplier=10, bribe_chance=0.7,  # They're corrupt, but greedy
+        search_modifier=0.05, run_damage=(15, 8), escape_factor=0.2, kill_heat=18),
+    EnemyTier.FEDERATION_RANGER: TierProfile(
+        "police", DropTable(0.5, (COMMON, UNCOMMON, RARE), (40, 50, 10)),
+        bribe_base=1000, bribe_multiplier=15, bribe_chance=0.5,  # More legitimate, harder to bribe
+        search_modifier=0.1, run_damage=(20, 10), escape_factor=0.3, kill_heat=20),
+    EnemyTier.GALACTIC_ENFORCER: TierProfile(
+        "police", DropTable(0.5, (COMMON, UNCOMMON, RARE, EPIC), (20, 40, 35, 5)),
+        bribe_base=5000, bribe_multiplier=20, bribe_chance=0.3,  # Elite forces, very difficult to bribe
+        search_modifier=0.15, run_damage=(25, 12), escape_factor=0.35, kill_heat=25),
+    EnemyTier.BOUNTY_HUNTER: TierProfile(
+        "bounty", DropTable(0.2, (UNCOMMON, RARE, EPIC, LEGENDARY), (30, 45, 20, 5)),
+        bribe_base=10000, bribe_multiplier=1000, bribe_chance=0.6,  # Motivated by money
+        search_modifier=0.2, run_damage=(30, 20), escape_factor=0.4, kill_heat=30),
+    EnemyTier.CARTEL: TierProfile("cartel", BASIC_DROPS),
+    EnemyTier.SHADOW: TierProfile("shadow", BASIC_DROPS),
+}
+
+def tier_profile(enemy):
+    """Return the TierProfile for an enemy"""
+    return ENEMY_TIERS[enemy.tier]
+
+__all__ = ['EnemyTier', 'TierProfile', 'ENEMY_TIERS', 'tier_profile']
@@ -1,4 +1,7 @@
-import random
+from bisect import bisect_right
+from itertools import accumulate
+
+from utils import np  # Small batches and those without NumPy bisect one by one
 
 # Rarity levels affect drop rates and shop availability
 COMMON = "Common"
@@ -16,6 +19,10 @@ RARITY_WEIGHTS = {
     LEGENDARY: 1
 }
 
+# Rarities from most to least common, and each one's position in that order
+RARITY_RANKS = (COMMON, UNCOMMON, RARE, EPIC, LEGENDARY)
+RARITY_RANK = {rarity: rank for rank, rarity in enumerate(RARITY_RANKS)}
+
 class Equipment:
     """Base class for all equipment (weapons and armor)"""
     def __init__(self, name, price, is_illegal, rarity):
@@ -78,87 +85,119 @@ ARMORS = [
     Armor("Void Walker Suit", 50, 1600000, True, LEGENDARY),
 ]
 
-def get_random_equipment(equipment_list, include_illegal=True, min_rarity=None):
-    """Get random equipment from list based on rarity weights"""
-    filtered_list = equipment_list
-    
-    # Filter by legality if needed
-    if not include_illegal:
-        filtered_list = [eq for eq in filtered_list if not eq.is_illegal]
-        
-    # Filter by minimum rarity if specified
-    if min_rarity:
-        rarity_ranks = [COMMON, UNCOMMON, RARE, EPIC, LEGENDARY]
-        min_idx = rarity_ranks.index(min_rarity)
-        filtered_list = [eq for eq in filtered_list if rarity_ranks.index(eq.rarity) >= min_idx]
-        
-    if not filtered_list:
-        return None
-    
-    # Calculate weights based on rarity
-    weights = [RARITY_WEIGHTS[eq.rarity] for eq in filtered_list]
-    
-    # Make selection
-    total = sum(weights)
-    r = random.uniform(0, total)
-    running_sum = 0
-    
-    for i, weight in enumerate(weights):
-        running_sum += weight
-        if running_sum >= r:
-            return filtered_list[i]
-    
-    # Default to first item if something goes wrong
-    return filtered_list[0]
+class LootIndex:
+    """Precomputed cumulative-weight tables for equipment drops.
 
-def get_random_weapon(include_illegal=True, min_rarity=None):
-    """Get a random weapon"""
-    return get_random_equipment(WEAPONS, include_illegal, min_rarity)
+    Holds one table per (catalog, include_illegal, min_rarity) combination
+    for each registered catalog, so picking an item is a single bisect
+    instead of re-filtering and re-weighting the catalog on every roll.
+    Call rebuild() after changing a catalog.
+    """
 
-def get_random_armor(include_illegal=True, min_rarity=None):
-    """Get a random armor"""
-    return get_random_equipment(ARMORS, include_illegal, min_rarity)
+    def __init__(self, *catalogs):
+        self.catalogs = list(catalogs)
+        self.tables = {}
+        self.rebuild()
 
-def get_enemy_weapon_drop(enemy_name):
-    """Determine what weapon an enemy might drop based on their type"""
-    # Bounty hunters have better drop chances
-    is_bounty_hunter = any(hunter_name in enemy_name for hunter_name in ["Agent Andrews", "Killer Klakring", "T-Mont the Tyrant", "Garth Vader", "D-Mac the Destroyer"])
-    
+    def rebuild(self):
+        """(Re)build the tables for every registered catalog"""
+        self.tables = {}  # {id(catalog): (catalog, {(include_illegal, min_rarity): table})}
+        for catalog in self.catalogs:
+            tables = {}
+            for include_illegal in (True, False):
+                for min_rarity in (None,) + RARITY_RANKS:
+                    tables[(include_illegal, min_rarity)] = self._build(catalog, include_illegal, min_rarity)
+            self.tables[id(catalog)] = (catalog, tables)
+
+    def _build(self, catalog, include_illegal, min_rarity):
+        min_rank = RARITY_RANK[min_rarity] if min_rarity else 0
+        items = tuple(eq for eq in catalog
+                      if (include_illegal or not eq.is_illegal) and RARITY_RANK[eq.rarity] >= min_rank)
+        cumulative = list(accumulate(RARITY_WEIGHTS[eq.rarity] for eq in items))
+        return [items, cumulative, None]  # The array is made by the first large batch pick
+
+    def table(self, catalog, include_illegal=True, min_rarity=None):
+        """Return [items, cumulative weights, cumulative weights as an array or None]"""
+        known = self.tables.get(id(catalog))
+        if known is None or known[0] is not catalog:
+            # Unregistered catalog: build a table for this pick only
+            return self._build(catalog, include_illegal, min_rarity)
+        return known[1][(include_illegal, min_rarity)]
+
+    def sample(self, rng, catalog, include_illegal=True, min_rarity=None, n=None):
+        """Pick one item (or a list of n) from a catalog, weighted by rarity"""
+        table = self.table(catalog, include_illegal, min_rarity)
+        items, cumulative, cumulative_array = table
+        if not items:
+            return None if n is None else []
+        total = cumulative[-1]
+        if n is None:
+            return items[bisect_right(cumulative, rng.unit() * total)]
+        rolls = rng.unit(n)
+        if not isinstance(rolls, list):
+            if cumulative_array is None:
+                cumulative_array = table[2] = np.array(cumulative)
+            return [items[i] for i in np.searchsorted(cumulative_array, rolls * total, side="right")]
+        return [items[bisect_right(cumulative, roll * total)] for roll in rolls]
+
+def get_random_equipment(equipment_list, rng, include_illegal=True, min_rarity=None, n=None):
+    """Get random equipment from list based on rarity weights
+
+    rng is the DiceRoller to draw from (normally the game's loot stream).
+    With n, a list of n independent picks is returned, rolled as one batch.
+    """
+    return LOOT_INDEX.sample(rng, equipment_list, include_illegal, min_rarity, n)
+
+def get_random_weapon(rng, include_illegal=True, min_rarity=None, n=None):
+    """Get a random weapon (or a list of n)"""
+    return get_random_equipment(WEAPONS, rng, include_illegal, min_rarity, n)
+
+def get_random_armor(rng, include_illegal=True, min_rarity=None, n=None):
+    """Get a random armor (or a list of n)"""
+    return get_random_equipment(ARMORS, rng, include_illegal, min_rarity, n)
+
+class DropTable:
+    """What an enemy can drop when defeated.
+
+    Args:
+        no_drop_chance: Chance of dropping nothing at all
+        rarities: Candidate minimum rarities for the drop
+        weights: Weight of each candidate rarity
+    """
+
+    def __init__(self, no_drop_chance, rarities, weights):
+        self.no_drop_chance = no_drop_chance
+        self.rarities = tuple(rarities)
+        self.weights = tuple(weights)
+
+def get_enemy_weapon_drop(drop_table, rng):
+    """Roll an enemy's DropTable for a weapon or armor drop (or None)"""
     # Chance to drop nothing
-    if not is_bounty_hunter:
-        if random.random() < 0.5:  # 50% chance of no drop for normal enemies
-            return None
-    elif random.random() < 0.2:  # 20% chance of no drop for bounty hunters
+    if rng.random() < drop_table.no_drop_chance:
         return None
     
     # Determine min rarity based on enemy type
-    if is_bounty_hunter:
-        min_rarity = random.choices([UNCOMMON, RARE, EPIC, LEGENDARY], weights=[30, 45, 20, 5])[0]
-    elif "Galactic Enforcer" in enemy_name:
-        min_rarity = random.choices([COMMON, UNCOMMON, RARE, EPIC], weights=[20, 40, 35, 5])[0]
-    elif "Federation Ranger" in enemy_name:
-        min_rarity = random.choices([COMMON, UNCOMMON, RARE], weights=[40, 50, 10])[0]
-    elif "Sector Badge" in enemy_name:
-        min_rarity = random.choices([COMMON, UNCOMMON], weights=[70, 30])[0]
-    else:  # Local Deputy
-        min_rarity = COMMON
+    min_rarity = drop_table.rarities[rng.weighted_choice(drop_table.weights)]
     
     # Get weapon or armor
-    if random.random() < 0.7:  # 70% chance for weapon vs armor
-        return get_random_weapon(include_illegal=True, min_rarity=min_rarity)
+    if rng.random() < 0.7:  # 70% chance for weapon vs armor
+        return get_random_weapon(include_illegal=True, min_rarity=min_rarity, rng=rng)
     else:
-        return get_random_armor(include_illegal=True, min_rarity=min_rarity)
+        return get_random_armor(include_illegal=True, min_rarity=min_rarity, rng=rng)
+
+# Built once at import; see LootIndex.rebuild() for catalogs changed later
+LOOT_INDEX = LootIndex(WEAPONS, ARMORS)
 
 # Export all the classes and functions needed by other files
 __all__ = [
     # Classes
-    'Equipment', 'Weapon', 'Armor',
+    'Equipment', 'Weapon', 'Armor', 'LootIndex', 'DropTable',
     
     # Rarity constants
     'COMMON', 'UNCOMMON', 'RARE', 'EPIC', 'LEGENDARY',
     
     # Collections
-    'WEAPONS', 'ARMORS',
+    'WEAPONS', 'ARMORS', 'LOOT_INDEX',
     
     # Functions
     'get_random_weapon', 'get_random_armor', 'get_enemy_weapon_drop'
@@ -1,10 +1,16 @@
-from utils import DiceRoller, wait_for_enter
 from combat import Combat, LOCAL_DEPUTY, SECTOR_BADGE, FEDERATION_RANGER, GALACTIC_ENFORCER, BountyHunter, Enemy
-import random
+from enemies import EnemyTier, tier_profile
+import narrative
+
+# Patrol slot filled by whichever bounty hunter the roster sends
+RANDOM_HUNTER = "random_hunter"
+
 class PoliceEncounter():
     """Federation police patrol encounter. Difficulty affected by heat."""
     def __init__(self, game):
         self.game = game
+        self.io = game.io
+        self.rng = game.rng
 
     def run(self):
         # Atmospheric opening based on heat level
@@ -27,9 +33,9 @@ class PoliceEncounter():
                 "Your ship registers on someone's scanner at the wrong moment. Lights start flashing behind you.",
                 "The comm channel is buzzing with an official message. You've been flagged for inspection."
             ]
-        wait_for_enter()
-        print(random.choice(atmosphere_lines))
-        wait_for_enter()
+        self.io.wait_for_enter()
+        self.io.print(self.rng.flavor.choice(atmosphere_lines))
+        self.io.wait_for_enter()
 
         # Add a chance for some NOVA lines based on cargo and legality before boarding
         player = self.game.player
@@ -53,7 +59,7 @@ class PoliceEncounter():
                 break
 
         # Chance to trigger a NOVA line (about 40%)
-        if random.random() < 0.5:
+        if self.rng.flavor.random() < 0.5:
             if has_illegal_contract_cargo or has_illegal_inventory:
                 illegal_lines = [
                     "[NOVA] 'Uh, we've got some things on board that would be... hard to explain.'",
@@ -62,22 +68,22 @@ class PoliceEncounter():
                     "[NOVA] 'Just act natural. And hope they don't bring out the scanners.'",
                     "[NOVA] 'I told you that stuff looked suspicious. Now look where we are.'"
                 ]
-                print(random.choice(illegal_lines))
+                self.io.print(self.rng.flavor.choice(illegal_lines))
             elif has_contract_cargo:
                 cargo_lines = [
                     "[NOVA] 'Let's hope they don't get curious about our cargo manifest.'",
                     "[NOVA] 'Smile and wave. Maybe they won't ask about the crates.'",
                     "[NOVA] 'If they open those crates, we might have some explaining to do.'"
                 ]
-                print(random.choice(cargo_lines))
+                self.io.print(self.rng.flavor.choice(cargo_lines))
             else:
                 nervous_lines = [
                     "[NOVA] 'Try not to look guilty. Routine inspection, right?'",
                     "[NOVA] 'Maybe they'll just check our papers and move on.'",
                     "[NOVA] 'Deep breaths. We can get through this.'"
                 ]
-                print(random.choice(nervous_lines))
-            wait_for_enter()
+                self.io.print(self.rng.flavor.choice(nervous_lines))
+            self.io.wait_for_enter()
 
         # Determine patrol type based on heat
         if self.game.player.heat > 85:  # Heat level 5 (81-100): Bounty Hunters
@@ -91,66 +97,87 @@ class PoliceEncounter():
         else:  # Heat level 1 (0-20): Primarily Local Deputies
             enemy_type, patrol_desc = self._select_enemy_by_heat(1)
             
-        print(f"\n{patrol_desc}")
-        wait_for_enter()
+        self.io.print(f"\n{patrol_desc}")
+        self.io.wait_for_enter()
         
         # NOVA quips based on encounter type
-        if random.random() < 0.5:
-            enemy = enemy_type()
-            if any(hunter_name in enemy.name for hunter_name in ["Agent Andrews", "Killer Klakring", "T-Mont the Tyrant", "Garth Vader", "D-Mac the Destroyer"]):
+        if self.rng.flavor.random() < 0.5:
+            enemy = self._spawn(enemy_type)
+            if enemy.tier is EnemyTier.BOUNTY_HUNTER:
                 nova_bounty_quips = [
                     "[NOVA] 'Well, that's not good. Bounty hunters don't usually give warnings.'",
                     "[NOVA] 'I've seen this hunter's work before. It's not pretty.'",
                     "[NOVA] 'They're here for the bounty on your head. No negotiating with them.'",
                     "[NOVA] 'Professional killer, incoming. Hope your life insurance is up to date.'"
                 ]
-                print(random.choice(nova_bounty_quips))
-            elif "Galactic Enforcer" in enemy.name:
+                self.io.print(self.rng.flavor.choice(nova_bounty_quips))
+            elif enemy.tier is EnemyTier.GALACTIC_ENFORCER:
                 nova_enforcer_quips = [
                     "[NOVA] 'Galactic Enforcers. The Federation's finest. This is bad.'",
                     "[NOVA] 'These guys don't mess around. They shoot first and file paperwork later.'",
                     "[NOVA] 'Elite forces. I'd suggest compliance, but you never listen to me anyway.'"
                 ]
-                print(random.choice(nova_enforcer_quips))
-            elif "Federation Ranger" in enemy.name:
+                self.io.print(self.rng.flavor.choice(nova_enforcer_quips))
+            elif enemy.tier is EnemyTier.FEDERATION_RANGER:
                 nova_ranger_quips = [
                     "[NOVA] 'Rangers. Professional, disciplined, and very well-armed.'",
                     "[NOVA] 'These aren't corrupt locals. They actually believe in justice.'",
                     "[NOVA] 'Federation Rangers don't take bribes. Just so you know.'"
                 ]
-                print(random.choice(nova_ranger_quips))
-            elif "Sector Badge" in enemy.name:
+                self.io.print(self.rng.flavor.choice(nova_ranger_quips))
+            elif enemy.tier is EnemyTier.SECTOR_BADGE:
                 nova_badge_quips = [
                     "[NOVA] 'Sector badges. Greedy, but predictable.'",
                     "[NOVA] 'These guys are in it for the credits. Might be negotiable.'",
                     "[NOVA] 'Corrupt enforcement. They'll shake you down if you let them.'"
                 ]
-                print(random.choice(nova_badge_quips))
+                self.io.print(self.rng.flavor.choice(nova_badge_quips))
             else:  # Local Deputy
                 nova_deputy_quips = [
                     "[NOVA] 'Local deputy. Probably bored and looking for excitement.'",
                     "[NOVA] 'Small-time law enforcement. This should be manageable.'",
                     "[NOVA] 'Local authorities. A few credits usually solves this problem.'"
                 ]
-                print(random.choice(nova_deputy_quips))
-            wait_for_enter()
+                self.io.print(self.rng.flavor.choice(nova_deputy_quips))
+            self.io.wait_for_enter()
         
-        print("They're closing in fast...")
-        wait_for_enter()
+        self.io.print("They're closing in fast...")
+        self.io.wait_for_enter()
         
-        print("\nWhat do you do?")
-        print("1. Run for it")
-        print("2. Stop and comply")
+        self.io.print("\nWhat do you do?")
+        self.io.print("1. Run for it")
+        self.io.print("2. Stop and comply")
         
         while True:
-            print("\n> ", end="")
-            choice = input().strip()
+            self.io.print("\n> ", end="")
+            choice = self.io.input().strip()
             if choice == "1":  # Run
                 return self._handle_run(enemy_type)
-            elif choice == "2":  # Stop
+            elif choice == "2":  # Stop; whether to bribe is asked if it comes to that
                 return self._handle_stop(enemy_type)
+            elif choice.lower() == "recommend":
+                self.game.recommend([("Run for it", ("police", "run", enemy_type)),
+                                     ("Stop, let them search", ("police", "stop", enemy_type)),
+                                     ("Stop, offer a bribe", ("police", "bribe", enemy_type))])
             else:
-                print("Invalid choice. Please enter 1 or 2")
+                self.io.print("Invalid choice. Please enter 1 or 2")
+
+    def resolve(self, choice, enemy_type):
+        """Play out a decision at the patrol prompt, as run() would after it
+
+        Args:
+            choice: "run" for it, "stop" and let them search, or "stop" and
+                offer a "bribe" when one is asked for
+            enemy_type: The patrol, as picked by _select_enemy_by_heat
+
+        Returns:
+            What run() returns: None, "escaped" or "game_over"
+        """
+        if choice == "run":
+            return self._handle_run(enemy_type)
+        if choice in ("stop", "bribe"):
+            return self._handle_stop(enemy_type, bribe=choice == "bribe")
+        raise ValueError(f"Unknown patrol decision {choice!r}")
     
     def _select_enemy_by_heat(self, primary_level):
         """Select an enemy based on heat level with weighted probabilities"""
@@ -181,14 +208,14 @@ class PoliceEncounter():
         level_4_distribution = [
             (FEDERATION_RANGER, 25, "A heavily-armed Federation Ranger patrol locks weapons on your ship."),
             (GALACTIC_ENFORCER, 65, "A sleek Galactic Enforcement strike team vessel appears from stealth mode."),
-            (lambda: BountyHunter.get_random_hunter(), 10, "A specialized bounty hunter ship appears, targeting you specifically."),
+            (RANDOM_HUNTER, 10, "A specialized bounty hunter ship appears, targeting you specifically."),
         ]
         
         # Level 5 distribution - high chance of BOUNTY_HUNTER
         level_5_distribution = [
             (FEDERATION_RANGER, 5, "A Federation Ranger patrol stumbles upon your location."),
             (GALACTIC_ENFORCER, 35, "An elite Galactic Enforcement team locks onto your signature."),
-            (lambda: BountyHunter.get_random_hunter(), 60, "A notorious bounty hunter's ship emerges from hyperspace right beside you."),
+            (RANDOM_HUNTER, 60, "A notorious bounty hunter's ship emerges from hyperspace right beside you."),
         ]
         
         # Select the appropriate distribution based on primary_level
@@ -208,22 +235,28 @@ class PoliceEncounter():
         enemy_types, weights, descriptions = zip(*distribution)
         
         # Select enemy type based on weights
-        index = DiceRoller.weighted_choice(weights)
+        index = self.rng.combat.weighted_choice(weights)
         enemy_type = enemy_types[index]
         patrol_desc = descriptions[index]
         
         return enemy_type, patrol_desc
     
+    def _spawn(self, enemy_type):
+        """Create the enemy for a patrol picked by _select_enemy_by_heat"""
+        if enemy_type == RANDOM_HUNTER:
+            return self.game.bounty_roster.get_random_hunter(self.rng.combat)
+        return enemy_type()
+
     def _handle_run(self, enemy_type):
         """Handle attempt to run from authorities"""
-        print("\nYou gun the engines, trying to shake the patrol!")
-        wait_for_enter()
+        self.io.print("\nYou gun the engines, trying to shake the patrol!")
+        self.io.wait_for_enter()
         
         # They shoot at you - damage based on enemy type
-        enemy = enemy_type()
+        enemy = self._spawn(enemy_type)
         
         # Dramatic combat descriptions
-        if random.random() < 0.35:
+        if self.rng.flavor.random() < 0.35:
             combat_descriptions = [
                 "Energy bolts streak past your viewport!",
                 "Your ship shudders under weapons fire!",
@@ -231,86 +264,60 @@ class PoliceEncounter():
                 "Laser bursts light up the space around you!",
                 "The hull groans under the impact of their shots!"
             ]
-            print(random.choice(combat_descriptions))
-            wait_for_enter()
+            self.io.print(self.rng.flavor.choice(combat_descriptions))
+            self.io.wait_for_enter()
         
         # More powerful enemies do more damage when you run
-        if any(hunter_name in enemy.name for hunter_name in ["Agent Andrews", "Killer Klakring", "T-Mont the Tyrant", "Garth Vader", "D-Mac the Destroyer"]):
-            # Bounty hunters do serious damage when you run
-            base_damage = 30
-            damage_variance = DiceRoller.d20()
-        elif "Galactic Enforcer" in enemy.name:
-            base_damage = 25
-            damage_variance = DiceRoller.d12() if hasattr(DiceRoller, 'd12') else DiceRoller.d6() + DiceRoller.d6()
-        elif "Federation Ranger" in enemy.name:
-            base_damage = 20
-            damage_variance = DiceRoller.d10() if hasattr(DiceRoller, 'd10') else DiceRoller.d6() + (DiceRoller.d6() // 2)
-        elif "Sector Badge" in enemy.name:
-            base_damage = 15
-            damage_variance = DiceRoller.d8() if hasattr(DiceRoller, 'd8') else DiceRoller.d6()
-        else:  # Local Deputy
-            base_damage = 10
-            damage_variance = DiceRoller.d6()
-            
-        damage = base_damage + damage_variance
+        profile = tier_profile(enemy)
+        base_damage, damage_die = profile.run_damage
+        damage = base_damage + self.rng.combat.roll(damage_die)
         self.game.player.hp -= damage
-        print(f"\nThey open fire! You take {damage} damage!")
+        self.io.print(f"\nThey open fire! You take {damage} damage!")
         
         # NOVA damage commentary
-        if random.random() < 0.3:
+        if self.rng.flavor.random() < 0.3:
             if damage > 25:
-                print("[NOVA] 'That hurt! Hull integrity is compromised!'")
+                self.io.print("[NOVA] 'That hurt! Hull integrity is compromised!'")
             elif damage > 15:
-                print("[NOVA] 'We're taking heavy fire! This was a bad idea!'")
+                self.io.print("[NOVA] 'We're taking heavy fire! This was a bad idea!'")
             else:
-                print("[NOVA] 'Minor damage. Could be worse.'")
-        wait_for_enter()
+                self.io.print("[NOVA] 'Minor damage. Could be worse.'")
+        self.io.wait_for_enter()
         
         # Check if player is dead
         if self.game.player.hp <= 0:
-            print("Systems failing... emergency ejection activated...")
-            if random.random() < 0.5:
-                print("[NOVA] 'Well, this is embarrassing. See you in the next life.'")
-            wait_for_enter()
-            #print("\nGAME OVER")
-            self.game.game_over = True
+            self.io.print("Systems failing... emergency ejection activated...")
+            if self.rng.flavor.random() < 0.5:
+                self.io.print("[NOVA] 'Well, this is embarrassing. See you in the next life.'")
+            self.io.wait_for_enter()
+            #self.io.print("\nGAME OVER")
+            self.game.end_game("DEATH", f"Shot down by {enemy.name}")
             return "game_over"
         
         # Chance to escape based on ship speed and inversely on enemy strength
-        is_bounty_hunter = any(hunter_name in enemy.name for hunter_name in ["Agent Andrews", "Killer Klakring", "T-Mont the Tyrant", "Garth Vader", "D-Mac the Destroyer"])
-        
-        if is_bounty_hunter:
-            enemy_factor = 0.4  # Very hard to escape
-        elif "Galactic Enforcer" in enemy.name:
-            enemy_factor = 0.35
-        elif "Federation Ranger" in enemy.name:
-            enemy_factor = 0.3
-        elif "Sector Badge" in enemy.name:
-            enemy_factor = 0.2
-        else:  # Local Deputy
-            enemy_factor = 0.1  # Easy to escape
+        enemy_factor = profile.escape_factor
             
         # Significantly increase impact of ship speed on escape chance
         speed_bonus = (self.game.ship.speed - 1) * 0.10  # Each speed level adds 15% escape chance
         escape_chance = max(0.1, 0.3 + speed_bonus - enemy_factor)
         
         # Display escape chance information to player
-        #print(f"\nYour ship's speed rating: {self.game.ship.speed}")
+        #self.io.print(f"\nYour ship's speed rating: {self.game.ship.speed}")
         #escape_percent = int(escape_chance * 100)
-        #print(f"Estimated escape chance: {escape_percent}%")
+        #self.io.print(f"Estimated escape chance: {escape_percent}%")
         
-        if DiceRoller.chance(escape_chance):
-            print("\nYou manage to lose them in an asteroid field!")
-            if random.random() < 0.4:
+        if self.rng.combat.chance(escape_chance):
+            self.io.print("\nYou manage to lose them in an asteroid field!")
+            if self.rng.flavor.random() < 0.4:
                 escape_descriptions = [
                     "Your ship weaves between floating debris, sensors confused.",
                     "The asteroid field's mineral composition scrambles their tracking.",
                     "You cut engines and drift silently among the rocks.",
                     "A lucky jump through a debris field shakes your pursuers."
                 ]
-                print(random.choice(escape_descriptions))
-                wait_for_enter()
-            if random.random() < 0.3:
+                self.io.print(self.rng.flavor.choice(escape_descriptions))
+                self.io.wait_for_enter()
+            if self.rng.flavor.random() < 0.3:
                 nova_escape_quips = [
                     "[NOVA] 'Not bad. I didn't think we'd make it out of that one.'",
                     "[NOVA] 'Running from the law. Again. I should update my resume.'",
@@ -318,32 +325,36 @@ class PoliceEncounter():
                     "[NOVA] 'Well, that was terrifying. Let's not do it again.'",
                     "[NOVA] 'Impressive flying. I take back half the things I said about your piloting.'"
                 ]
-                print(random.choice(nova_escape_quips))
-                wait_for_enter()
+                self.io.print(self.rng.flavor.choice(nova_escape_quips))
+                self.io.wait_for_enter()
             self.game.player.heat += 10  # Heat goes up for running
-            wait_for_enter()
+            self.io.wait_for_enter()
             return None
         else:
-            print("\nThey catch up to you...")
-            if random.random() < 0.3:
+            self.io.print("\nThey catch up to you...")
+            if self.rng.flavor.random() < 0.3:
                 capture_descriptions = [
                     "Their ship's tractor beam locks onto your hull.",
                     "Superior engines bring them alongside your ship.",
                     "A boarding tube extends from their vessel.",
                     "Magnetic grapples secure your ship to theirs."
                 ]
-                print(random.choice(capture_descriptions))
-            wait_for_enter()
+                self.io.print(self.rng.flavor.choice(capture_descriptions))
+            self.io.wait_for_enter()
             return self._handle_stop(enemy_type)
     
-    def _handle_stop(self, enemy_type):
-        """Handle stopping for authorities"""
-        enemy = enemy_type()
+    def _handle_stop(self, enemy_type, bribe=None):
+        """Handle stopping for authorities
+
+        Args:
+            bribe: Whether to offer a bribe if they ask; None asks the player
+        """
+        enemy = self._spawn(enemy_type)
         
-        print(f"\nYou power down your engines as the {enemy.name} approaches...")
+        self.io.print(f"\nYou power down your engines as the {enemy.name} approaches...")
         
         # Atmospheric descriptions of the stop
-        if random.random() < 0.35:
+        if self.rng.flavor.random() < 0.35:
             stop_descriptions = [
                 "Your ship drifts to a halt, engine signatures fading to idle.",
                 "Compliance protocols activate as you surrender control.",
@@ -351,31 +362,31 @@ class PoliceEncounter():
                 "Scanning beams sweep across your hull methodically.",
                 "Communication arrays synchronize for official contact."
             ]
-            print(random.choice(stop_descriptions))
-        wait_for_enter()
+            self.io.print(self.rng.flavor.choice(stop_descriptions))
+        self.io.wait_for_enter()
         
         # Authority dialogue based on enemy type
-        if random.random() < 0.4:
-            is_bounty_hunter = any(hunter_name in enemy.name for hunter_name in ["Agent Andrews", "Killer Klakring", "T-Mont the Tyrant", "Garth Vader", "D-Mac the Destroyer"])
+        if self.rng.flavor.random() < 0.4:
+            is_bounty_hunter = enemy.tier is EnemyTier.BOUNTY_HUNTER
             if is_bounty_hunter:
                 authority_dialogue = [
                     f"'{enemy.name}' opens a comm channel: \"End of the line. You're worth more alive, but dead works too.\"",
                     f"'{enemy.name}' transmits: \"I've been tracking you for days. Time to collect.\"",
                     f"'{enemy.name}' says coldly: \"The bounty didn't specify what condition you had to be in.\""
                 ]
-            elif "Galactic Enforcer" in enemy.name:
+            elif enemy.tier is EnemyTier.GALACTIC_ENFORCER:
                 authority_dialogue = [
                     "\"This is Galactic Enforcement. Prepare for immediate inspection.\"",
                     "\"By Federation authority, you will submit to search and seizure.\"",
                     "\"Galactic Enforcement priority intercept. Compliance is mandatory.\""
                 ]
-            elif "Federation Ranger" in enemy.name:
+            elif enemy.tier is EnemyTier.FEDERATION_RANGER:
                 authority_dialogue = [
                     "\"Federation Ranger patrol. You are subject to lawful inspection.\"",
                     "\"This is Ranger Command. We're conducting routine enforcement operations.\"",
                     "\"Federal jurisdiction applies. Prepare for boarding and inspection.\""
                 ]
-            elif "Sector Badge" in enemy.name:
+            elif enemy.tier is EnemyTier.SECTOR_BADGE:
                 authority_dialogue = [
                     "\"Sector enforcement here. Time for a little... tax collection.\"",
                     "\"This sector requires additional fees. Let's discuss your options.\"",
@@ -387,187 +398,132 @@ class PoliceEncounter():
                     "\"This is deputy patrol. Standard inspection protocols apply.\"",
                     "\"Local enforcement. Let's keep this simple and everybody goes home happy.\""
                 ]
-            print(random.choice(authority_dialogue))
-            wait_for_enter()
+            self.io.print(self.rng.flavor.choice(authority_dialogue))
+            self.io.wait_for_enter()
         
         # Try to bribe first - all types are bribable but with different conditions
         is_bribable = True
         
         # Galactic Enforcers are harder to bribe but still possible
-        if "Galactic Enforcer" in enemy.name:
-            print("\nThe Galactic Enforcers are here on official business. Only an enormous bribe might work.")
-            wait_for_enter()
+        if enemy.tier is EnemyTier.GALACTIC_ENFORCER:
+            self.io.print("\nThe Galactic Enforcers are here on official business. Only an enormous bribe might work.")
+            self.io.wait_for_enter()
         # For bounty hunters, mention the bounty directly
-        elif any(hunter_name in enemy.name for hunter_name in ["Agent Andrews", "Killer Klakring", "T-Mont the Tyrant", "Garth Vader", "D-Mac the Destroyer"]):
-            print("\nThe bounty hunter eyes you coldly. \"I could take the bounty... or something better.\"")
-            if random.random() < 0.3:
-                print("[NOVA] 'Bounty hunters are mercenaries. Everything has a price.'")
-            wait_for_enter()
+        elif enemy.tier is EnemyTier.BOUNTY_HUNTER:
+            self.io.print("\nThe bounty hunter eyes you coldly. \"I could take the bounty... or something better.\"")
+            if self.rng.flavor.random() < 0.3:
+                self.io.print("[NOVA] 'Bounty hunters are mercenaries. Everything has a price.'")
+            self.io.wait_for_enter()
             
-        if is_bribable and self._attempt_bribe(enemy):
+        if is_bribable and self._attempt_bribe(enemy, bribe):
             return None
             
         # If bribe fails or player can't afford it, they search the ship
         return self._handle_search(enemy)
     
-    def _attempt_bribe(self, enemy):
-        """Try to bribe the authorities"""
+    def _attempt_bribe(self, enemy, offer=None):
+        """Try to bribe the authorities; offer=None asks the player whether to"""
         # Bribe amount scales with heat and enemy type
-        base_bribe = 100
-        
         # Different enemies have different bribe preferences
-        is_bounty_hunter = any(hunter_name in enemy.name for hunter_name in ["Agent Andrews", "Killer Klakring", "T-Mont the Tyrant", "Garth Vader", "D-Mac the Destroyer"])
-        
-        if is_bounty_hunter:
-            # Bounty hunters require massive bribes based on heat
-            bribe_multiplier = 1000
-            base_bribe = 10000
-            base_bribe_chance = 0.6  # Motivated by money
-        elif "Galactic Enforcer" in enemy.name:
-            bribe_multiplier = 20
-            base_bribe = 5000
-            base_bribe_chance = 0.3  # Elite forces, very difficult to bribe
-        elif "Federation Ranger" in enemy.name:
-            bribe_multiplier = 15
-            base_bribe = 1000
-            base_bribe_chance = 0.5  # More legitimate, harder to bribe
-        elif "Sector Badge" in enemy.name:
-            bribe_multiplier = 10
-            base_bribe = 500
-            base_bribe_chance = 0.7  # They're corrupt, but greedy
-        else:  # Local Deputy
-            bribe_multiplier = 5
-            base_bribe = 100
-            base_bribe_chance = 0.8  # Very easy to bribe
+        profile = tier_profile(enemy)
+        is_bounty_hunter = enemy.tier is EnemyTier.BOUNTY_HUNTER
+        bribe_multiplier = profile.bribe_multiplier
+        base_bribe = profile.bribe_base
+        base_bribe_chance = profile.bribe_chance
         
         bribe_amount = base_bribe + (self.game.player.heat * bribe_multiplier)
         
         if is_bounty_hunter:
-            print(f"\n{enemy.name} glances around furtively...")
+            self.io.print(f"\n{enemy.name} glances around furtively...")
         else:
-            print(f"\nThe {enemy.name} glances around furtively...")
+            self.io.print(f"\nThe {enemy.name} glances around furtively...")
         
         # Bribe setup dialogue
-        if random.random() < 0.35:
+        if self.rng.flavor.random() < 0.35:
             if is_bounty_hunter:
-                bribe_setup = [
-                    "\"The bounty's worth a lot... but I'm always open to negotiation.\"",
-                    "\"Credits talk louder than justice sometimes.\"",
-                    "\"I could forget I saw you... for the right price.\""
-                ]
-            elif "Galactic Enforcer" in enemy.name:
-                bribe_setup = [
-                    "\"This never happened. Understood?\"",
-                    "\"I have expenses that Federation pay doesn't cover.\"",
-                    "\"Sometimes regulations... need interpretation.\""
-                ]
-            elif "Sector Badge" in enemy.name:
-                bribe_setup = [
-                    "\"Sector fees are always negotiable.\"",
-                    "\"I'm sure we can work out a mutually beneficial arrangement.\"",
-                    "\"The official rate is high, but there's always a discount available.\""
-                ]
+                setup = "bribe.setup.bounty_hunter"
+            elif enemy.tier is EnemyTier.GALACTIC_ENFORCER:
+                setup = "bribe.setup.galactic_enforcer"
+            elif enemy.tier is EnemyTier.SECTOR_BADGE:
+                setup = "bribe.setup.sector_badge"
             else:
-                bribe_setup = [
-                    "\"Maybe we can handle this quietly.\"",
-                    "\"Paperwork is such a hassle, don't you think?\"",
-                    "\"Sometimes a small administrative fee makes problems disappear.\""
-                ]
-            print(random.choice(bribe_setup))
-            wait_for_enter()
+                setup = "bribe.setup.default"
+            self.io.print(self.rng.flavor.choice(narrative.lines(setup)))
+            self.io.wait_for_enter()
         
-        print(f"You could try to bribe them...")
-        wait_for_enter()
+        self.io.print(f"You could try to bribe them...")
+        self.io.wait_for_enter()
         if bribe_amount > self.game.player.credits:
             if is_bounty_hunter:
-                print(f"\nYou don't have enough to match the bounty ({bribe_amount} credits).")
-                wait_for_enter()
+                self.io.print(f"\nYou don't have enough to match the bounty ({bribe_amount} credits).")
+                self.io.wait_for_enter()
             else:
-                print(f"\nYou don't have enough to bribe them ({bribe_amount} credits).")
-            if random.random() < 0.3:
-                print("[NOVA] 'Being broke has its disadvantages. Who knew?'")
-            wait_for_enter()
+                self.io.print(f"\nYou don't have enough to bribe them ({bribe_amount} credits).")
+            if self.rng.flavor.random() < 0.3:
+                self.io.print("[NOVA] 'Being broke has its disadvantages. Who knew?'")
+            self.io.wait_for_enter()
             return False
     
-        print(f"1. Offer {bribe_amount:,} credits bribe")
-        print("2. Let them search")
-        
-        while True:
-            print("\n> ", end="")
-            choice = input().strip()
-            if choice == "1":
-                # Chance of accepting bribe decreases with heat
-                bribe_chance = base_bribe_chance - (self.game.player.heat / 200)
-                
-                if is_bounty_hunter:
-                    # Bounty hunters are more likely to accept big bribes
-                    bribe_chance = min(0.95, bribe_chance + 0.2)
-                    
-                if DiceRoller.chance(bribe_chance):
-                    if is_bounty_hunter:
-                        success_dialogue = [
-                            f"{enemy.name} counts your credits with a grin. \"Pleasure doing business.\"",
-                            f"{enemy.name} pockets the credits. \"I never saw you. We understand each other?\"",
-                            f"{enemy.name} smiles coldly. \"The bounty can wait. This is better.\""
-                        ]
-                        print(f"\n{random.choice(success_dialogue)}")
-                    else:
-                        success_dialogue = [
-                            "They accept your credits with a knowing smile...",
-                            "\"Administrative fee processed. Have a safe flight.\"",
-                            "The credits disappear quickly. \"What inspection? I don't see any problems here.\""
-                        ]
-                        print(random.choice(success_dialogue))
-                    if random.random() < 0.3:
-                        print("[NOVA] 'Money talks. And apparently, it speaks their language fluently.'")
-                    wait_for_enter()
-                    self.game.player.credits -= bribe_amount
-                    
-                    # Heat reduction based on enemy type
-                    if is_bounty_hunter:
-                        heat_reduction = 3  # Bounty hunters can reduce heat more
-                    else:
-                        heat_reduction = 1  # Normal heat reduction
-                        
-                    self.game.player.heat -= heat_reduction
-                    return True
+        if offer is None:
+            self.io.print(f"1. Offer {bribe_amount:,} credits bribe")
+            self.io.print("2. Let them search")
+            while offer is None:
+                self.io.print("\n> ", end="")
+                choice = self.io.input().strip()
+                if choice in ("1", "2"):
+                    offer = choice == "1"
                 else:
-                    if is_bounty_hunter:
-                        failure_dialogue = [
-                            f"{enemy.name} pockets your credits and draws a weapon anyway!",
-                            # INSERT_YOUR_CODE
-                            f"{enemy.name} takes your credits, then levels their weapon at you. \"Nothing personal, {self.game.player.name}. Business is business.\"",
-                            f"{enemy.name} grins, pocketing your bribe. \"Business is business, {self.game.player.name}. Now I'll get paid twice.\"",
-                            f"{enemy.name} takes your money, then immediately goes for their blaster. \"You didn't really think that would work, did you?\"",
-                        ]
-                        print(f"\n{random.choice(failure_dialogue)}")
-                    else:
-                        failure_dialogue = [
-                            "They pocket your credits... and search anyway!",
-                            "\"Thanks for the donation. Now prepare to be searched.\"",
-                            "\"Credits accepted. But I still have quotas to meet.\""
-                        ]
-                        print(random.choice(failure_dialogue))
-                    if random.random() < 0.3:
-                        print("[NOVA] 'Well, that backfired spectacularly.'")
-                    wait_for_enter()
-                    self.game.player.credits -= bribe_amount
-                    self.game.player.heat += 5  # Failed bribe increases heat
-                    return False
-            elif choice == "2":
-                return False
+                    self.io.print("Invalid choice. Please enter 1 or 2")
+        if not offer:
+            return False
+
+        # Chance of accepting bribe decreases with heat
+        bribe_chance = base_bribe_chance - (self.game.player.heat / 200)
+
+        if is_bounty_hunter:
+            # Bounty hunters are more likely to accept big bribes
+            bribe_chance = min(0.95, bribe_chance + 0.2)
+
+        if self.rng.combat.chance(bribe_chance):
+            if is_bounty_hunter:
+                line = self.rng.flavor.choice(narrative.lines("bribe.success.bounty_hunter"))
+                self.io.print("\n" + line.format(enemy=enemy.name, name=self.game.player.name))
             else:
-                print("Invalid choice. Please enter 1 or 2")
-        
+                self.io.print(self.rng.flavor.choice(narrative.lines("bribe.success.default")))
+            if self.rng.flavor.random() < 0.3:
+                self.io.print("[NOVA] 'Money talks. And apparently, it speaks their language fluently.'")
+            self.io.wait_for_enter()
+            self.game.player.credits -= bribe_amount
+
+            # Heat reduction based on enemy type
+            if is_bounty_hunter:
+                heat_reduction = 3  # Bounty hunters can reduce heat more
+            else:
+                heat_reduction = 1  # Normal heat reduction
+
+            self.game.player.heat -= heat_reduction
+            return True
+        else:
+            if is_bounty_hunter:
+                line = self.rng.flavor.choice(narrative.lines("bribe.failure.bounty_hunter"))
+                self.io.print("\n" + line.format(enemy=enemy.name, name=self.game.player.name))
+            else:
+                self.io.print(self.rng.flavor.choice(narrative.lines("bribe.failure.default")))
+            if self.rng.flavor.random() < 0.3:
+                self.io.print("[NOVA] 'Well, that backfired spectacularly.'")
+            self.io.wait_for_enter()
+            self.game.player.credits -= bribe_amount
+            self.game.player.heat += 5  # Failed bribe increases heat
+            return False
 
     def _handle_search(self, enemy):
         """Handle ship search and potential combat"""
         # INSERT_YOUR_CODE
-        is_bounty_hunter = any(hunter_name in enemy.name for hunter_name in ["Agent Andrews", "Killer Klakring", "T-Mont the Tyrant", "Garth Vader", "D-Mac the Destroyer"])
+        is_bounty_hunter = enemy.tier is EnemyTier.BOUNTY_HUNTER
 
         if is_bounty_hunter:
-            print(f"\n{enemy.name} sneers: \"I'm not here for your cargo. I'm here for you. Dead or alive.\"")
-            wait_for_enter()
+            self.io.print(f"\n{enemy.name} sneers: \"I'm not here for your cargo. I'm here for you. Dead or alive.\"")
+            self.io.wait_for_enter()
             combat = Combat(self.game, enemy)
             result = combat.run()
             if result == "defeat":
@@ -576,39 +532,34 @@ class PoliceEncounter():
                 self.game.player.heat += 10  # Big heat increase for fighting and running
             else:  # victory
                 if is_bounty_hunter:
-                    print(f"\nYou've eliminated {enemy.name}. One less hunter on your trail.")
-                    BountyHunter.mark_eliminated(enemy.name)
-                    heat_increase = 30
-                    if random.random() < 0.3:
-                        print("[NOVA] 'One bounty hunter down. Unfortunately, there are always more where they came from.'")
-                elif "Local Deputy" in enemy.name:
-                    heat_increase = 12
-                    print("\nKilling a local deputy will be noticed in this system...")
-                    if random.random() < 0.3:
-                        print("[NOVA] 'Local law enforcement won't forget this. We should probably avoid this system for a while.'")
-                elif "Sector Badge" in enemy.name:
-                    heat_increase = 18
-                    print("\nThe sector badges will be looking for revenge...")
-                    if random.random() < 0.3:
-                        print("[NOVA] 'Sector badges hold grudges. Expect company next time we're in their territory.'")
-                elif "Federation Ranger" in enemy.name:
-                    heat_increase = 20
-                    print("\nThe Federation will not take kindly to losing a Ranger...")
-                    if random.random() < 0.3:
-                        print("[NOVA] 'Rangers are elite forces. The Federation will escalate their response after this.'")
+                    self.io.print(f"\nYou've eliminated {enemy.name}. One less hunter on your trail.")
+                    self.game.bounty_roster.mark_eliminated(enemy.name)
+                    if self.rng.flavor.random() < 0.3:
+                        self.io.print("[NOVA] 'One bounty hunter down. Unfortunately, there are always more where they came from.'")
+                elif enemy.tier is EnemyTier.LOCAL_DEPUTY:
+                    self.io.print("\nKilling a local deputy will be noticed in this system...")
+                    if self.rng.flavor.random() < 0.3:
+                        self.io.print("[NOVA] 'Local law enforcement won't forget this. We should probably avoid this system for a while.'")
+                elif enemy.tier is EnemyTier.SECTOR_BADGE:
+                    self.io.print("\nThe sector badges will be looking for revenge...")
+                    if self.rng.flavor.random() < 0.3:
+                        self.io.print("[NOVA] 'Sector badges hold grudges. Expect company next time we're in their territory.'")
+                elif enemy.tier is EnemyTier.FEDERATION_RANGER:
+                    self.io.print("\nThe Federation will not take kindly to losing a Ranger...")
+                    if self.rng.flavor.random() < 0.3:
+                        self.io.print("[NOVA] 'Rangers are elite forces. The Federation will escalate their response after this.'")
                 else:
-                    heat_increase = 25
-                    print("\nEliminating a Galactic Enforcer... The Federation will hunt you to the ends of space!")
-                    if random.random() < 0.3:
-                        print("[NOVA] 'Galactic Enforcers don't just disappear. We're going to have the entire Federation after us now.'")
-                self.game.player.heat += heat_increase
-                wait_for_enter()
+                    self.io.print("\nEliminating a Galactic Enforcer... The Federation will hunt you to the ends of space!")
+                    if self.rng.flavor.random() < 0.3:
+                        self.io.print("[NOVA] 'Galactic Enforcers don't just disappear. We're going to have the entire Federation after us now.'")
+                self.game.player.heat += tier_profile(enemy).kill_heat
+                self.io.wait_for_enter()
             return None
         
-        print(f"\nThe {enemy.name} begins searching your ship...")
+        self.io.print(f"\nThe {enemy.name} begins searching your ship...")
         
         # Search atmosphere
-        if random.random() < 0.35:
+        if self.rng.flavor.random() < 0.35:
             search_descriptions = [
                 "Heavy boots clank through your ship's corridors.",
                 "Scanners beep methodically as they probe every compartment.",
@@ -616,17 +567,17 @@ class PoliceEncounter():
                 "Detection equipment sweeps the cargo bay systematically.",
                 "They work with professional efficiency, missing nothing."
             ]
-            print(random.choice(search_descriptions))
+            self.io.print(self.rng.flavor.choice(search_descriptions))
         
-        if random.random() < 0.3:
+        if self.rng.flavor.random() < 0.3:
             nova_search_quips = [
                 "[NOVA] 'They're being very thorough. I hope you hid everything properly.'",
                 "[NOVA] 'Professional search pattern. These guys know what they're doing.'",
                 "[NOVA] 'If they find something, just remember this was your idea.'",
                 "[NOVA] 'Scanning... scanning... this is making me nervous.'"
             ]
-            print(random.choice(nova_search_quips))
-        wait_for_enter()
+            self.io.print(self.rng.flavor.choice(nova_search_quips))
+        self.io.wait_for_enter()
 
         def is_illegal_item(item):
             return (
@@ -638,6 +589,7 @@ class PoliceEncounter():
                 ))
             )
 
+        search_mod = tier_profile(enemy).search_modifier
         manifest = []  # List of (source, item) tuples
         found_crate = False
 
@@ -645,54 +597,44 @@ class PoliceEncounter():
         if self.game.player.current_contract:
             for i, crate in enumerate(self.game.player.current_contract.crates):
                 base_search_chance = 0.3
-                if "Local Deputy" in enemy.name:
-                    search_mod = 0
-                elif "Sector Badge" in enemy.name:
-                    search_mod = 0.05
-                elif "Federation Ranger" in enemy.name:
-                    search_mod = 0.1
-                elif "Galactic Enforcer" in enemy.name:
-                    search_mod = 0.15
-                else:
-                    search_mod = 0.2
                 search_chance = base_search_chance + (self.game.player.heat / 100) + search_mod
-                if DiceRoller.chance(search_chance):
-                    print(f"\nThey find a {crate.tier} crate...")
-                    wait_for_enter()
+                if self.rng.combat.chance(search_chance):
+                    self.io.print(f"\nThey find a {crate.tier} crate...")
+                    self.io.wait_for_enter()
                     if crate.tier == "legit":
-                        print("They mark it as cleared.")
-                        wait_for_enter()
+                        self.io.print("They mark it as cleared.")
+                        self.io.wait_for_enter()
                     elif crate.tier == "illicit":
-                        print("Contraband detected!")
-                        if random.random() < 0.4:
+                        self.io.print("Contraband detected!")
+                        if self.rng.flavor.random() < 0.4:
                             contraband_reactions = [
                                 "\"Well, well, what do we have here?\"",
                                 "\"This is definitely not legal in Federation space.\"",
                                 "\"Illegal goods. You're in serious trouble.\"",
                                 "\"Contraband smuggling. That's a felony.\""
                             ]
-                            print(random.choice(contraband_reactions))
-                        wait_for_enter()
+                            self.io.print(self.rng.flavor.choice(contraband_reactions))
+                        self.io.wait_for_enter()
                         manifest.append(('crate', crate))
                         found_crate = True
                     else:  # sealed
-                        if DiceRoller.chance(0.5):
-                            print("They crack it open... Contraband!")
-                            if random.random() < 0.3:
-                                print("\"Sealed cargo always makes me suspicious. Let's see... yep, highly illegal It's over, buddy.\"")
-                            wait_for_enter()
+                        if self.rng.combat.chance(0.5):
+                            self.io.print("They crack it open... Contraband!")
+                            if self.rng.flavor.random() < 0.3:
+                                self.io.print("\"Sealed cargo always makes me suspicious. Let's see... yep, highly illegal It's over, buddy.\"")
+                            self.io.wait_for_enter()
                             manifest.append(('crate', crate))
                             found_crate = True
                         else:
-                            print("They crack it open... It's legal cargo.")
-                            if random.random() < 0.25:
-                                print("\"Hmm. Sealed, but legitimate. I guess you got lucky.\"")
-                            wait_for_enter()
+                            self.io.print("They crack it open... It's legal cargo.")
+                            if self.rng.flavor.random() < 0.25:
+                                self.io.print("\"Hmm. Sealed, but legitimate. I guess you got lucky.\"")
+                            self.io.wait_for_enter()
                 else:
-                    print(f"They didn't find crate #{i + 1}...")
-                    if random.random() < 0.2:
-                        print("[NOVA] 'Lucky. That one would have been problematic.'")
-                    wait_for_enter()
+                    self.io.print(f"They didn't find crate #{i + 1}...")
+                    if self.rng.flavor.random() < 0.2:
+                        self.io.print("[NOVA] 'Lucky. That one would have been problematic.'")
+                    self.io.wait_for_enter()
 
         # 2. Search player inventory
         for idx, item in enumerate(getattr(self.game.player, 'inventory', [])):
@@ -716,47 +658,47 @@ class PoliceEncounter():
 
         if manifest:
             # Present manifest and single choice
-            print(f"\nThe {enemy.name} confronts you with a manifest of illegal items they intend to confiscate:")
+            self.io.print(f"\nThe {enemy.name} confronts you with a manifest of illegal items they intend to confiscate:")
             
             # Confrontation dialogue
-            if random.random() < 0.4:
+            if self.rng.flavor.random() < 0.4:
                 confrontation_lines = [
                     "\"Well, this is interesting. Care to explain?\"",
                     "\"Looks like we've got ourselves a smuggler.\"",
                     "\"These items are all highly illegal. You're under arrest.\"",
                     "\"Contraband smuggling is a serious federal offense.\""
                 ]
-                print(random.choice(confrontation_lines))
-                wait_for_enter()
+                self.io.print(self.rng.flavor.choice(confrontation_lines))
+                self.io.wait_for_enter()
             
             for source, item in manifest:
                 if source == 'crate':
-                    print(f"- Contract Crate: {getattr(item, 'tier', str(item))}")
+                    self.io.print(f"- Contract Crate: {getattr(item, 'tier', str(item))}")
                 elif source == 'inventory':
-                    print(f"- Inventory: {item['name'] if isinstance(item, dict) else getattr(item, 'name', str(item))}")
+                    self.io.print(f"- Inventory: {item['name'] if isinstance(item, dict) else getattr(item, 'name', str(item))}")
                 elif source == 'weapon':
-                    print(f"- Weapon: {item.name}")
+                    self.io.print(f"- Weapon: {item.name}")
                 elif source == 'armor':
-                    print(f"- Armor: {item.name}")
+                    self.io.print(f"- Armor: {item.name}")
                 elif source == 'combat_item':
-                    print(f"- Combat Item: {item.name}")
-            wait_for_enter()
-            print("\nWhat do you do?")
-            print("1. Comply and hand over all items")
-            print("2. Refuse")
+                    self.io.print(f"- Combat Item: {item.name}")
+            self.io.wait_for_enter()
+            self.io.print("\nWhat do you do?")
+            self.io.print("1. Comply and hand over all items")
+            self.io.print("2. Refuse")
             while True:
-                print("\n> ", end="")
-                choice = input().strip()
+                self.io.print("\n> ", end="")
+                choice = self.io.input().strip()
                 if choice == "1":
                     # Compliance dialogue
-                    if random.random() < 0.3:
+                    if self.rng.flavor.random() < 0.3:
                         compliance_reactions = [
                             "\"Smart choice. Cooperation is always appreciated.\"",
                             "\"Thank you for your compliance. This will be noted.\"",
                             "\"Wise decision. Violence never solves anything.\""
                         ]
-                        print(random.choice(compliance_reactions))
-                        wait_for_enter()
+                        self.io.print(self.rng.flavor.choice(compliance_reactions))
+                        self.io.wait_for_enter()
                     
                     # Confiscate all items
                     # INSERT_YOUR_CODE
@@ -779,16 +721,16 @@ class PoliceEncounter():
                     if found_crate and self.game.player.current_contract:
                         self.game.player.current_contract.crates.clear()
                         self.game.player.current_contract = None
-                        print("\nAll your contract cargo is confiscated. Your contract has failed!")
-                        if random.random() < 0.3:
-                            print("[NOVA] 'Well, there goes our paycheck. Hope it was worth it, because the cartel's going to be pissed.'")
-                        wait_for_enter()
-                        print("\nYou hand over the item(s) and the authorities let you go, but the cartel will not be pleased...")
-                        wait_for_enter()
+                        self.io.print("\nAll your contract cargo is confiscated. Your contract has failed!")
+                        if self.rng.flavor.random() < 0.3:
+                            self.io.print("[NOVA] 'Well, there goes our paycheck. Hope it was worth it, because the cartel's going to be pissed.'")
+                        self.io.wait_for_enter()
+                        self.io.print("\nYou hand over the item(s) and the authorities let you go, but the cartel will not be pleased...")
+                        self.io.wait_for_enter()
                         self.game.player.cartel_threat_level += 1
-                        if random.random() < 0.25:
-                            print("[NOVA] 'Could have been worse. At least we're still breathing.'")
-                            wait_for_enter()
+                        if self.rng.flavor.random() < 0.25:
+                            self.io.print("[NOVA] 'Could have been worse. At least we're still breathing.'")
+                            self.io.wait_for_enter()
 
                         for source, item in manifest:
                             if source == 'inventory':
@@ -808,11 +750,11 @@ class PoliceEncounter():
                         
 
                         # Chance of immediate cartel retaliation
-                        if DiceRoller.chance(0.5):  # 50% chance of cartel encounter
-                            print("\nAs you leave the checkpoint, a ship with Syndicate markings appears on your radar...")
-                            if random.random() < 0.3:
-                                print("[NOVA] 'Oh great. From bad to worse. Get ready!'")
-                            wait_for_enter()
+                        if self.rng.combat.chance(0.5):  # 50% chance of cartel encounter
+                            self.io.print("\nAs you leave the checkpoint, a ship with Syndicate markings appears on your radar...")
+                            if self.rng.flavor.random() < 0.3:
+                                self.io.print("[NOVA] 'Oh great. From bad to worse. Get ready!'")
+                            self.io.wait_for_enter()
                             cartel = CartelEncounter(self.game)
                             result = cartel.run()
                             if result == "game_over":
@@ -820,18 +762,18 @@ class PoliceEncounter():
                     
                     return None
                 elif choice == "2":
-                    print(f"\nYou refuse to comply!")
-                    if random.random() < 0.4:
+                    self.io.print(f"\nYou refuse to comply!")
+                    if self.rng.flavor.random() < 0.4:
                         refusal_reactions = [
                             "\"So you want to do this the hard way? Fine by me.\"",
                             "\"Resisting arrest? Bad choice, friend.\"",
                             "\"I was hoping you'd say that. I need the target practice.\"",
                             "\"Alright, if that's how you want it!\""
                         ]
-                        print(random.choice(refusal_reactions))
-                    if random.random() < 0.3:
-                        print("[NOVA] 'Here we go again. Try not to get us killed this time.'")
-                    wait_for_enter()
+                        self.io.print(self.rng.flavor.choice(refusal_reactions))
+                    if self.rng.flavor.random() < 0.3:
+                        self.io.print("[NOVA] 'Here we go again. Try not to get us killed this time.'")
+                    self.io.wait_for_enter()
                     # Start combat
                     combat = Combat(self.game, enemy)
                     result = combat.run()
@@ -840,49 +782,44 @@ class PoliceEncounter():
                     elif result == "escaped":
                         self.game.player.heat += 10  # Big heat increase for fighting and running
                     else:  # victory
-                        is_bounty_hunter = any(hunter_name in enemy.name for hunter_name in ["Agent Andrews", "Killer Klakring", "T-Mont the Tyrant", "Garth Vader", "D-Mac the Destroyer"])
+                        is_bounty_hunter = enemy.tier is EnemyTier.BOUNTY_HUNTER
                         if is_bounty_hunter:
-                            print(f"\nYou've eliminated {enemy.name}. One less hunter on your trail.")
-                            BountyHunter.mark_eliminated(enemy.name)
-                            heat_increase = 30
-                            if random.random() < 0.3:
-                                print("[NOVA] 'One bounty hunter down. Unfortunately, there are always more where they came from.'")
-                        elif "Local Deputy" in enemy.name:
-                            heat_increase = 12
-                            print("\nKilling a local deputy will be noticed in this system...")
-                            if random.random() < 0.3:
-                                print("[NOVA] 'Local law enforcement won't forget this. We should probably avoid this system for a while.'")
-                        elif "Sector Badge" in enemy.name:
-                            heat_increase = 18
-                            print("\nThe sector badges will be looking for revenge...")
-                            if random.random() < 0.3:
-                                print("[NOVA] 'Sector badges hold grudges. Expect company next time we're in their territory.'")
-                        elif "Federation Ranger" in enemy.name:
-                            heat_increase = 20
-                            print("\nThe Federation will not take kindly to losing a Ranger...")
-                            if random.random() < 0.3:
-                                print("[NOVA] 'Rangers are elite forces. The Federation will escalate their response after this.'")
+                            self.io.print(f"\nYou've eliminated {enemy.name}. One less hunter on your trail.")
+                            self.game.bounty_roster.mark_eliminated(enemy.name)
+                            if self.rng.flavor.random() < 0.3:
+                                self.io.print("[NOVA] 'One bounty hunter down. Unfortunately, there are always more where they came from.'")
+                        elif enemy.tier is EnemyTier.LOCAL_DEPUTY:
+                            self.io.print("\nKilling a local deputy will be noticed in this system...")
+                            if self.rng.flavor.random() < 0.3:
+                                self.io.print("[NOVA] 'Local law enforcement won't forget this. We should probably avoid this system for a while.'")
+                        elif enemy.tier is EnemyTier.SECTOR_BADGE:
+                            self.io.print("\nThe sector badges will be looking for revenge...")
+                            if self.rng.flavor.random() < 0.3:
+                                self.io.print("[NOVA] 'Sector badges hold grudges. Expect company next time we're in their territory.'")
+                        elif enemy.tier is EnemyTier.FEDERATION_RANGER:
+                            self.io.print("\nThe Federation will not take kindly to losing a Ranger...")
+                            if self.rng.flavor.random() < 0.3:
+                                self.io.print("[NOVA] 'Rangers are elite forces. The Federation will escalate their response after this.'")
                         else:
-                            heat_increase = 25
-                            print("\nEliminating a Galactic Enforcer... The Federation will hunt you to the ends of space!")
-                            if random.random() < 0.3:
-                                print("[NOVA] 'Galactic Enforcers don't just disappear. We're going to have the entire Federation after us now.'")
-                        self.game.player.heat += heat_increase
-                        wait_for_enter()
+                            self.io.print("\nEliminating a Galactic Enforcer... The Federation will hunt you to the ends of space!")
+                            if self.rng.flavor.random() < 0.3:
+                                self.io.print("[NOVA] 'Galactic Enforcers don't just disappear. We're going to have the entire Federation after us now.'")
+                        self.game.player.heat += tier_profile(enemy).kill_heat
+                        self.io.wait_for_enter()
                     return None
                 else:
-                    print("Invalid choice. Please enter 1 or 2")
+                    self.io.print("Invalid choice. Please enter 1 or 2")
         else:
-            print(f"\nThe {enemy.name} finds nothing suspicious.")
-            if random.random() < 0.35:
+            self.io.print(f"\nThe {enemy.name} finds nothing suspicious.")
+            if self.rng.flavor.random() < 0.35:
                 clean_search_reactions = [
                     "\"Everything checks out. You're free to go.\"",
                     "\"Clean ship. Safe travels, citizen.\"",
                     "\"No violations found. Carry on.\"",
                     "\"Ship passes inspection. Have a good flight.\""
                 ]
-                print(random.choice(clean_search_reactions))
-            if random.random() < 0.25:
+                self.io.print(self.rng.flavor.choice(clean_search_reactions))
+            if self.rng.flavor.random() < 0.25:
                 player = getattr(self, "game", None)
                 if player:
                     player = getattr(self.game, "player", None)
@@ -907,11 +844,69 @@ class PoliceEncounter():
                             "[NOVA] 'We got lucky. If they'd looked a little harder, we'd be in a cell right now.'",
                             "[NOVA] 'That was a miracle. Next time we might not be so lucky.'"
                         ]
-                        print(random.choice(nova_lucky_lines))
-            wait_for_enter()
+                        self.io.print(self.rng.flavor.choice(nova_lucky_lines))
+            self.io.wait_for_enter()
             self.game.player.heat = max(0, self.game.player.heat - 1)  # Small heat reduction for clean search
             return None
 
+def generate_cartel_enemies(threat_level):
+    """Cartel enemies the player fights in turn at a given threat level"""
+    enemies = []
+    
+    # Base enemy stats
+    base_hp = 60
+    base_min_damage = 10
+    base_max_damage = 20
+    base_credits = 150
+    
+    # Threat level 0-1: Single weak enemy
+    if threat_level <= 1:
+        enemies.append(Enemy(name="Cartel Thug", 
+                           hp=base_hp + (5 * threat_level), 
+                           min_damage=base_min_damage + threat_level, 
+                           max_damage=base_max_damage + (2 * threat_level),
+                           credits_reward=base_credits + (50 * threat_level),
+                           tier=EnemyTier.CARTEL))
+    
+    # Threat level 2-3: One medium enemy
+    elif threat_level <= 3:
+        enemies.append(Enemy(name="Cartel Enforcer", 
+                           hp=base_hp + 15 + (5 * threat_level), 
+                           min_damage=base_min_damage + 3 + threat_level, 
+                           max_damage=base_max_damage + 5 + (2 * threat_level),
+                           credits_reward=base_credits + 100 + (50 * threat_level),
+                           tier=EnemyTier.CARTEL))
+    
+    # Threat level 4-5: Two medium enemies
+    elif threat_level <= 5:
+        for i in range(2):
+            enemies.append(Enemy(name=f"Cartel Enforcer {i+1}", 
+                               hp=base_hp + 20 + (5 * threat_level), 
+                               min_damage=base_min_damage + 5 + threat_level, 
+                               max_damage=base_max_damage + 8 + (2 * threat_level),
+                               credits_reward=base_credits + 150 + (50 * threat_level),
+                               tier=EnemyTier.CARTEL))
+    
+    # Threat level 6+: One strong enemy and one medium enemy
+    else:
+        # Strong enemy
+        enemies.append(Enemy(name="Cartel Lieutenant", 
+                           hp=base_hp * 2 + (8 * threat_level), 
+                           min_damage=base_min_damage + 8 + (2 * threat_level), 
+                           max_damage=base_max_damage + 15 + (3 * threat_level),
+                           credits_reward=base_credits * 2 + (75 * threat_level),
+                           tier=EnemyTier.CARTEL))
+        
+        # Medium backup
+        enemies.append(Enemy(name="Cartel Enforcer", 
+                           hp=base_hp + 25 + (5 * threat_level), 
+                           min_damage=base_min_damage + 5 + threat_level, 
+                           max_damage=base_max_damage + 10 + (2 * threat_level),
+                           credits_reward=base_credits + 150 + (50 * threat_level),
+                           tier=EnemyTier.CARTEL))
+    
+    return enemies
+
 class CartelEncounter():
     """Cartel encounter - triggered when you steal cargo or fail a contract.
     Difficulty scales with cartel_threat_level."""
@@ -936,28 +931,30 @@ class CartelEncounter():
     
     def __init__(self, game):
         self.game = game
+        self.io = game.io
+        self.rng = game.rng
         self.player = game.player
         self.threat_level = self.player.cartel_threat_level
     
     def run(self):
-        print("\nA ship with Syndicate markings intercepts you...")
-        wait_for_enter()
+        self.io.print("\nA ship with Syndicate markings intercepts you...")
+        self.io.wait_for_enter()
         
         # Pick a random intro dialogue
         dialogue_index = min(self.threat_level, len(self.INTRO_DIALOGUES)-1)
-        print(f"\nCartel Enforcer: {self.INTRO_DIALOGUES[dialogue_index]}")
-        wait_for_enter()
+        self.io.print(f"\nCartel Enforcer: {self.INTRO_DIALOGUES[dialogue_index]}")
+        self.io.wait_for_enter()
         
         # Present options
-        print("\nWhat do you do?")
-        print("1. Fight your way out")
-        print("2. Try to run for it")
-        print("3. Attempt to bluff your way out")
-        print("4. Surrender and beg for mercy")
+        self.io.print("\nWhat do you do?")
+        self.io.print("1. Fight your way out")
+        self.io.print("2. Try to run for it")
+        self.io.print("3. Attempt to bluff your way out")
+        self.io.print("4. Surrender and beg for mercy")
         
         while True:
-            print("\n> ", end="")
-            choice = input().strip()
+            self.io.print("\n> ", end="")
+            choice = self.io.input().strip()
             if choice == "1":  # Fight
                 return self._handle_fight()
             elif choice == "2":  # Run
@@ -967,40 +964,40 @@ class CartelEncounter():
             elif choice == "4":  # Surrender
                 return self._handle_surrender()
             else:
-                print("Invalid choice. Please enter 1-4")
+                self.io.print("Invalid choice. Please enter 1-4")
     
     def _handle_fight(self):
         """Handle direct combat with the cartel"""
-        print("\nYou draw your weapon...")
-        wait_for_enter()
+        self.io.print("\nYou draw your weapon...")
+        self.io.wait_for_enter()
         
         # Create cartel enemies based on threat level
         enemies = self._generate_cartel_enemies()
         
         for enemy in enemies:
-            print(f"A {enemy.name} steps forward...")
-            wait_for_enter()
+            self.io.print(f"A {enemy.name} steps forward...")
+            self.io.wait_for_enter()
             
             # Start combat
             combat = Combat(self.game, enemy)
             result = combat.run()
             
             if result == "defeat":
-                print("\nThe cartel has eliminated you...")
-                wait_for_enter()
+                self.io.print("\nThe cartel has eliminated you...")
+                self.io.wait_for_enter()
                 return "game_over"
             elif result == "escaped":
                 self.player.heat += 15
                 self.player.cartel_threat_level += 1
-                print("\nYou've escaped the cartel... for now. But they won't forget this.")
-                wait_for_enter()
+                self.io.print("\nYou've escaped the cartel... for now. But they won't forget this.")
+                self.io.wait_for_enter()
                 return None
             
             # If we're here, the player defeated this enemy, continue to the next one
         
         # If player defeats all enemies
-        print("\nYou've eliminated the cartel enforcers, but word of this will spread quickly.")
-        wait_for_enter()
+        self.io.print("\nYou've eliminated the cartel enforcers, but word of this will spread quickly.")
+        self.io.wait_for_enter()
         
         # Major heat and threat level increase for defeating cartel
         self.player.heat += 20
@@ -1010,8 +1007,8 @@ class CartelEncounter():
     
     def _handle_run(self):
         """Handle escape attempt"""
-        print("\nYou gun the engines, trying to outrun the cartel ship!")
-        wait_for_enter()
+        self.io.print("\nYou gun the engines, trying to outrun the cartel ship!")
+        self.io.wait_for_enter()
         
         # Increasing difficulty with threat level
         escape_penalty = min(0.35, 0.05 * self.threat_level)
@@ -1023,13 +1020,13 @@ class CartelEncounter():
         
         # Convert to percentage for display
         #escape_percent = int(escape_chance * 100)
-        #print(f"Your ship's speed rating: {self.game.ship.speed}")
-        #print(f"Estimated escape chance: {escape_percent}%")
-        #wait_for_enter()
+        #self.io.print(f"Your ship's speed rating: {self.game.ship.speed}")
+        #self.io.print(f"Estimated escape chance: {escape_percent}%")
+        #self.io.wait_for_enter()
         
-        if DiceRoller.chance(escape_chance):
-            print("\nYou manage to slip away into an asteroid field!")
-            wait_for_enter()
+        if self.rng.combat.chance(escape_chance):
+            self.io.print("\nYou manage to slip away into an asteroid field!")
+            self.io.wait_for_enter()
             
             # Running increases heat and threat level
             self.player.heat += 15
@@ -1037,8 +1034,8 @@ class CartelEncounter():
             
             return None
         else:
-            print("\nTheir ship is faster - they cut you off!")
-            wait_for_enter()
+            self.io.print("\nTheir ship is faster - they cut you off!")
+            self.io.wait_for_enter()
             
             # Failed escape leads to combat
             return self._handle_fight()
@@ -1046,9 +1043,9 @@ class CartelEncounter():
     def _handle_bluff(self):
         """Handle bluff attempt"""
         # Random bluff dialogue
-        bluff_index = random.randint(0, len(self.BLUFF_OPTIONS)-1)
-        print(f"\nYou try to talk your way out: {self.BLUFF_OPTIONS[bluff_index]}")
-        wait_for_enter()
+        bluff_index = self.rng.combat.randint(0, len(self.BLUFF_OPTIONS)-1)
+        self.io.print(f"\nYou try to talk your way out: {self.BLUFF_OPTIONS[bluff_index]}")
+        self.io.wait_for_enter()
         
         # Bluff becomes much harder with higher threat level
         base_bluff_chance = 0.5  # 50% base chance
@@ -1056,18 +1053,18 @@ class CartelEncounter():
         final_chance = max(0.05, base_bluff_chance - threat_penalty)  # Minimum 5% chance
         
         # Roll for success
-        if DiceRoller.chance(final_chance):
-            print("\nThe cartel enforcer narrows their eyes...")
-            wait_for_enter()
-            print("\"Fine. But the boss will hear about this. Don't cross us again.\"")
-            wait_for_enter()
+        if self.rng.combat.chance(final_chance):
+            self.io.print("\nThe cartel enforcer narrows their eyes...")
+            self.io.wait_for_enter()
+            self.io.print("\"Fine. But the boss will hear about this. Don't cross us again.\"")
+            self.io.wait_for_enter()
             
             # Successful bluff still increases heat a bit
             self.player.heat += 5
             return None
         else:
-            print("\nThe cartel enforcer laughs. \"Nice try. Get them!\"")
-            wait_for_enter()
+            self.io.print("\nThe cartel enforcer laughs. \"Nice try. Get them!\"")
+            self.io.wait_for_enter()
             
             # Failed bluff leads to combat with penalty
             self.player.cartel_threat_level += 1
@@ -1075,35 +1072,35 @@ class CartelEncounter():
     
     def _handle_surrender(self):
         """Handle surrender attempt"""
-        print("\nYou raise your hands. \"I surrender! Take what you want!\"")
-        wait_for_enter()
+        self.io.print("\nYou raise your hands. \"I surrender! Take what you want!\"")
+        self.io.wait_for_enter()
         
         # Chance they accept surrender decreases with threat level
         acceptance_chance = max(0.1, 0.7 - (0.1 * self.threat_level))  # 10% decrease per level, minimum 10%
         
-        if DiceRoller.chance(acceptance_chance):
-            print("\nThe cartel enforcer gestures to his men to take your cargo...")
-            wait_for_enter()
+        if self.rng.combat.chance(acceptance_chance):
+            self.io.print("\nThe cartel enforcer gestures to his men to take your cargo...")
+            self.io.wait_for_enter()
             
             # They take your cargo
             if self.game.player.current_contract:
                 self.game.player.current_contract = None
-                print("They confiscate all contract cargo and mark the contract as failed.")
+                self.io.print("They confiscate all contract cargo and mark the contract as failed.")
             
             # Take some credits too as penalty
             penalty = min(self.player.credits, 2000 * (1 + self.threat_level))
             self.player.credits -= penalty
-            print(f"They also take {penalty} credits as \"compensation\".")
-            wait_for_enter()
+            self.io.print(f"They also take {penalty} credits as \"compensation\".")
+            self.io.wait_for_enter()
             
             # Even surrender increases heat
             self.player.heat += 15
-            print("\n\"Don't cross us again. Next time we won't be so merciful.\"")
-            wait_for_enter()
+            self.io.print("\n\"Don't cross us again. Next time we won't be so merciful.\"")
+            self.io.wait_for_enter()
             return None
         else:
-            print("\nThe cartel enforcer smirks. \"Too late for that. Make an example of them.\"")
-            wait_for_enter()
+            self.io.print("\nThe cartel enforcer smirks. \"Too late for that. Make an example of them.\"")
+            self.io.wait_for_enter()
             
             # They attack anyway
             self.player.cartel_threat_level += 1
@@ -1111,53 +1108,4 @@ class CartelEncounter():
     
     def _generate_cartel_enemies(self):
         """Generate cartel enemies based on threat level"""
-        enemies = []
-        
-        # Base enemy stats
-        base_hp = 60
-        base_min_damage = 10
-        base_max_damage = 20
-        base_credits = 150
-        
-        # Threat level 0-1: Single weak enemy
-        if self.threat_level <= 1:
-            enemies.append(Enemy(name="Cartel Thug", 
-                               hp=base_hp + (5 * self.threat_level), 
-                               min_damage=base_min_damage + self.threat_level, 
-                               max_damage=base_max_damage + (2 * self.threat_level),
-                               credits_reward=base_credits + (50 * self.threat_level)))
-        
-        # Threat level 2-3: One medium enemy
-        elif self.threat_level <= 3:
-            enemies.append(Enemy(name="Cartel Enforcer", 
-                               hp=base_hp + 15 + (5 * self.threat_level), 
-                               min_damage=base_min_damage + 3 + self.threat_level, 
-                               max_damage=base_max_damage + 5 + (2 * self.threat_level),
-                               credits_reward=base_credits + 100 + (50 * self.threat_level)))
-        
-        # Threat level 4-5: Two medium enemies
-        elif self.threat_level <= 5:
-            for i in range(2):
-                enemies.append(Enemy(name=f"Cartel Enforcer {i+1}", 
-                                   hp=base_hp + 20 + (5 * self.threat_level), 
-                                   min_damage=base_min_damage + 5 + self.threat_level, 
-                                   max_damage=base_max_damage + 8 + (2 * self.threat_level),
-                                   credits_reward=base_credits + 150 + (50 * self.threat_level)))
-        
-        # Threat level 6+: One strong enemy and one medium enemy
-        else:
-            # Strong enemy
-            enemies.append(Enemy(name="Cartel Lieutenant", 
-                               hp=base_hp * 2 + (8 * self.threat_level), 
-                               min_damage=base_min_damage + 8 + (2 * self.threat_level), 
-                               max_damage=base_max_damage + 15 + (3 * self.threat_level),
-                               credits_reward=base_credits * 2 + (75 * self.threat_level)))
-            
-            # Medium backup
-            enemies.append(Enemy(name="Cartel Enforcer", 
-                               hp=base_hp + 25 + (5 * self.threat_level), 
-                               min_damage=base_min_damage + 5 + self.threat_level, 
-                               max_damage=base_max_damage + 10 + (2 * self.threat_level),
-                               credits_reward=base_credits + 150 + (50 * self.threat_level)))
-        
-        return enemies
+        return generate_cartel_enemies(self.threat_level)
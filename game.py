@@ -1,17 +1,39 @@
-import random
 import time
 import math
 
-from utils import DiceRoller, wait_for_enter
+from utils import GameRNG, lazy_import
+from state import Observable
+from game_io import TerminalIO
+from outcome import GameResult, GameEnded
+from endings import EndingWatch
 from contracts import TradeHub, Contract
-from flavor import get_random_travel_quote, get_random_nova_quote
-from trade_hub_gameplay import handle_trade_hub
-from encounters import handle_random_encounter
 from equipment import WEAPONS, ARMORS
-from combat import MEDKIT, SHIELD, STUN_GRENADE
+from combat import MEDKIT, SHIELD, STUN_GRENADE, BountyRoster
+
+# Subsystems a new game doesn't touch until well after the title screen;
+# each loads on first use (see --profile-import)
+flavor = lazy_import("flavor")
+trade_hub_gameplay = lazy_import("trade_hub_gameplay")
+encounters = lazy_import("encounters")
+speculate = lazy_import("speculate")
+render = lazy_import("render")
+narrative = lazy_import("narrative")
+cutscene = lazy_import("cutscene")
+
+def _copy(obj):
+    """Shallow copy, without copy.copy()'s reduce machinery"""
+    clone = object.__new__(obj.__class__)
+    clone.__dict__ = obj.__dict__.copy()
+    return clone
+
+class Player(Observable):
+    OBSERVED = ("hp", "max_hp", "credits", "heat", "stones", "stones_discovered",
+                "cartel_threat_level", "rejected_kingpin")
+    __slots__ = ("name", "base_damage", "armor", "weapon", "armor_item", "inventory", "items",
+                 "current_contract", "illegal_activity_today") + tuple("_" + field for field in OBSERVED)
 
-class Player:
     def __init__(self):
+        super().__init__()
         # Basic stats
         self.name = ""
         self.hp = 100
@@ -49,9 +71,17 @@ class Player:
         
         # Natural healing - much reduced
         if self.hp > self.max_hp / 2:
-            self.hp = min(self.max_hp, self.hp + 3)  # Only 3 HP per day when healthy
+            self.update("healing", hp=min(self.max_hp, self.hp + 3))  # Only 3 HP per day when healthy
         else:
-            self.hp = min(self.max_hp, self.hp + 1)  # Only 1 HP when badly hurt
+            self.update("healing", hp=min(self.max_hp, self.hp + 1))  # Only 1 HP when badly hurt
+
+    def discover_stone(self, stone, cause=None):
+        """Record a stone the player has found, whether or not they keep it"""
+        self.update(cause, stones_discovered=self.stones_discovered + [stone])
+
+    def take_stone(self, stone, cause=None):
+        """Add a stone to the ones the player holds"""
+        self.update(cause, stones=self.stones + [stone])
             
     def add_item(self, item):
         """Add a combat item to inventory"""
@@ -65,21 +95,21 @@ class Player:
         """Equip a new armor"""
         self.armor_item = armor
         
-    def use_item_from_inventory(self):
+    def use_item_from_inventory(self, io):
         """Use an item from inventory outside of combat"""
         if not self.items:
-            print("\nNo items available to use.")
-            wait_for_enter()
+            io.print("\nNo items available to use.")
+            io.wait_for_enter()
             return False
             
         # Show available items
-        print("\nAvailable items:")
+        io.print("\nAvailable items:")
         for i, item in enumerate(self.items, 1):
-            print(f"{i}. {item.name} - {item.description}")
-        print("\n0. Cancel")
+            io.print(f"{i}. {item.name} - {item.description}")
+        io.print("\n0. Cancel")
         
         try:
-            choice = int(input("\nChoose item to use"))
+            choice = int(io.input("\nChoose item to use"))
             if choice == 0:
                 return False
                 
@@ -87,50 +117,50 @@ class Player:
                 item = self.items[choice - 1]
                 
                 # Special case for medkit outside of combat
-                if item.name == "Medkit":
+                if item.item_id == "medkit":
                     heal_amount = 30
                     old_hp = self.hp
                     self.hp = min(self.max_hp, self.hp + heal_amount)
                     actual_heal = self.hp - old_hp
-                    print(f"\nUsed medkit! Healed {actual_heal} HP.")
+                    io.print(f"\nUsed medkit! Healed {actual_heal} HP.")
                     self.items.remove(item)
-                    wait_for_enter()
+                    io.wait_for_enter()
                     return True
                 else:
-                    print("\nThis item can only be used during combat.")
-                    wait_for_enter()
+                    io.print("\nThis item can only be used during combat.")
+                    io.wait_for_enter()
                     return False
         except ValueError:
-            print("\nInvalid choice.")
-            wait_for_enter()
+            io.print("\nInvalid choice.")
+            io.wait_for_enter()
             return False
         
-    def view_equipment(self):
+    def view_equipment(self, io):
         """Display current equipment details"""
-        print("\n=== EQUIPMENT ===")
+        io.print("\n=== EQUIPMENT ===")
         
         # Weapon info
         if self.weapon:
-            print("\n")
-            print(f"\nWeapon: {self.weapon}")
+            io.print("\n")
+            io.print(f"\nWeapon: {self.weapon}")
         else:
-            print("\nWeapon: None (Using bare hands)")
+            io.print("\nWeapon: None (Using bare hands)")
             
         # Armor info
         if self.armor_item:
-            print(f"\nArmor: {self.armor_item}")
+            io.print(f"\nArmor: {self.armor_item}")
         else:
-            print("\nArmor: None")
+            io.print("\nArmor: None")
             
         # Display total attack power
         total_damage = self.get_total_damage()
-        print(f"\nTotal Attack: {total_damage} damage")
+        io.print(f"\nTotal Attack: {total_damage} damage")
         
         # Display total defense
         armor_defense = self.armor_item.defense if self.armor_item else 0
-        print(f"Total Defense: {armor_defense} protection")
+        io.print(f"Total Defense: {armor_defense} protection")
         
-        wait_for_enter()
+        io.wait_for_enter()
         return True
             
     def is_alive(self):
@@ -141,8 +171,12 @@ class Player:
         weapon_damage = self.weapon.damage if self.weapon else 0
         return self.base_damage + weapon_damage
 
-class Ship:
+class Ship(Observable):
+    OBSERVED = ("fuel", "max_fuel", "speed", "max_cargo")
+    __slots__ = ("cargo",) + tuple("_" + field for field in OBSERVED)
+
     def __init__(self):
+        super().__init__()
         self.fuel = 0  # Start with no fuel
         self.max_fuel = 10  # Initial fuel tank size
         self.speed = 1  # Initial speed
@@ -150,12 +184,20 @@ class Ship:
         self.max_cargo = 3  # Start with 3 cargo slots
 
 class Game:
-    def __init__(self):
+    def __init__(self, io=None, seed=None, epoch=0):
+        self.io = io if io is not None else TerminalIO()
+        self.rng = GameRNG(seed, epoch)  # Seeded random streams; the same seed replays the same game
         self.player = Player()
         self.ship = Ship()
         self.day = 0  # Start at day 0
         self.game_over = False
+        self.result = None  # GameResult, set once the game ends
         self.current_hub = TradeHub()
+        self.bounty_roster = BountyRoster()  # Bounty hunters still hunting this player
+        self.advisor = None  # Advisor behind the "recommend" command, created on first use
+        self.speculator = None  # Speculator rolling ahead while the player reads (see speculate.py)
+        self.ending_watch = EndingWatch(self.player)  # Which endings need another look
+        self.trip = None  # (sectors, encounter) while a trip is under way
         
         # Give player starting equipment
         # self.player.weapon = WEAPONS[0]  # Mining Laser
@@ -166,158 +208,87 @@ class Game:
         # self.player.add_item(SHIELD())
 
     def display_status(self):
-        # Clear screen with newlines
-        print("\n")
-        
-        # Top box with day
-        print("╔" + "═" * 78 + "╗")
-        day_text = f" Day {self.day} "
-        padding = 78 - len(day_text)
-        left_pad = padding // 2
-        right_pad = padding - left_pad
-        print("║" + " " * left_pad + day_text + " " * right_pad + "║")
-        print("╚" + "═" * 78 + "╝")
-        print()
-        
-        # Contract status
-        if self.player.current_contract:
-            print("Current Contract:")
-            print(f"• {len(self.player.current_contract.crates)} crates")
-            print(f"• {self.player.current_contract.deadline} days remaining")
-            print()
-            print("Progress:")
-            progress_map = self.player.current_contract.get_progress_map()
-            print(f"  {progress_map}")
-            print()
-        
-        # Cargo hold display
-        print("\nCargo Hold:")
-        
-        # Fill slots with crate info
-        slots = ["EMPTY"] * self.ship.max_cargo
-        if self.player.current_contract:
-            for i, crate in enumerate(self.player.current_contract.crates):
-                slots[i] = crate.tier.upper()
-        
-        # Print each slot with consistent brackets and spacing
-        display = "  "  # Initial margin
-        for slot in slots:
-            display += f"[{slot}]  "  # Add 2 spaces after each slot
-        print(display)
-        print()
-        
-        # Stats with ASCII bars
-        print("Status:")
-        # Health bar
-        health_blocks = int((self.player.hp / self.player.max_hp) * 20)
-        print(f"  Health:[{'█' * health_blocks}{'░' * (20 - health_blocks)}] {self.player.hp}/{self.player.max_hp}")
-        
-        # Fuel bar
-        fuel_blocks = int((self.ship.fuel / self.ship.max_fuel) * 20)
-        print(f"  Fuel:  [{'█' * fuel_blocks}{'░' * (20 - fuel_blocks)}] {self.ship.fuel}/{self.ship.max_fuel}")
-        
-        # Heat bar
-        heat_blocks = int((min(self.player.heat, 100) / 100) * 20)
-        print(f"  Heat:  [{'█' * heat_blocks}{'░' * (20 - heat_blocks)}] {self.player.heat}")
-        
-        # Cartel Threat Level bar (only display if above 0)
-        if self.player.cartel_threat_level > 0:
-            threat_level = min(self.player.cartel_threat_level, 10)
-            threat_blocks = int((threat_level / 10) * 20)
-            print(f"  Cartel Threat:[{'█' * threat_blocks}{'░' * (20 - threat_blocks)}] {self.player.cartel_threat_level}/10")
-        
-        # Credits
-        print("")
-        print(f"  Credits: {self.player.credits:,}")
-        
-        # Equipment and Items
-        if self.player.armor_item:
-            print(f"\nArmor: {self.player.armor_item.name} +{self.player.armor_item.defense} defense")
-            
-        if self.player.weapon:
-            print(f"Weapon: {self.player.weapon.name} +{self.player.weapon.damage} damage")
-            
-        if self.player.items:
-            print("\nItems:")
-            for item in self.player.items:
-                print(f"• {item.name}")
-
-        # Display stones if any
-        if self.player.stones:
-            print("\nInfinity Stones:")
-            for stone in self.player.stones:
-                print(f"• {stone} Stone")
-            
-        # Display inventory if any
-        if self.player.inventory:
-            print("\nCargo Inventory:")
-            for item in self.player.inventory:
-                contraband_mark = "⚠ " if item['is_contraband'] else "  "
-                print(f"{contraband_mark}{item['name']:<25} {item['value']:>5,} credits")
-        
-        print()
-        
-        wait_for_enter()
+        self.io.frame(render.status_lines(self))
+        self.io.wait_for_enter()
+
+    def play_cutscene(self, key):
+        """Play a cutscene however the IO plays them (see cutscene.py)"""
+        cutscene.play(self.io, key, day=self.day)
+
+    def narrate(self, key):
+        """Print a narrative entry a line at a time, waiting after each"""
+        for line in narrative.lines(key):
+            self.io.print(line)
+            self.io.wait_for_enter()
 
     def get_player_choice(self):
-        print("\nWhat would you like to do?")
-        print("1. Travel")
-        print("2. Lay Low")
+        self.io.print("\nWhat would you like to do?")
+        self.io.print("1. Travel")
+        self.io.print("2. Lay Low")
         if self.player.items:
-            print("3. Use Item")
-        # print("4. View Equipment")
-        #print("5. Quit")
+            self.io.print("3. Use Item")
+        # self.io.print("4. View Equipment")
+        #self.io.print("5. Quit")
         
-        print("\n> ", end="")
+        self.io.print("\n> ", end="")
         while True:
             try:
-                choice = int(input())
+                answer = self.io.input()
+                if answer.strip().lower() == "save":
+                    self.save()
+                    self.io.print("\n> ", end="")
+                    continue
+                if answer.strip().lower() == "recommend":
+                    self.recommend([("Travel", ("daily", 1)), ("Lay Low", ("daily", 2))])
+                    self.io.print("\n> ", end="")
+                    continue
+                choice = int(answer)
                 if 1 <= choice <= 4:
                     return choice
             except ValueError:
                 pass
-            print("Please enter a valid choice (1-3)")
-            print("\n> ", end="")
+            self.io.print("Please enter a valid choice (1-3)")
+            self.io.print("\n> ", end="")
 
     def travel_action(self):
         """Handle travel action"""
         if self.ship.fuel < 1:
-            print("\n⚠ Not enough fuel to travel!")
-            wait_for_enter()
+            self.io.print("\n⚠ Not enough fuel to travel!")
+            self.io.wait_for_enter()
             return False
             
         # Calculate how far we can travel based on ship speed
         max_sectors = self.ship.speed
         
         if max_sectors > 1:
-            print(f"\nYour ship can travel up to {max_sectors} sectors with its current speed!")
-            print("How many sectors do you want to travel?")
+            self.io.print(f"\nYour ship can travel up to {max_sectors} sectors with its current speed!")
+            self.io.print("How many sectors do you want to travel?")
             
             try:
-                sectors_choice = int(input("\nEnter choice: "))
+                sectors_choice = int(self.io.input("\nEnter choice: "))
                 if max(1, round(sectors_choice/2)) > self.ship.fuel:
-                    print("\nNot enough fuel to travel that far! Defaulting to 1 sector.")  
-                    wait_for_enter()
+                    self.io.print("\nNot enough fuel to travel that far! Defaulting to 1 sector.")  
+                    self.io.wait_for_enter()
                     sectors_to_travel = 1
                 elif sectors_choice < 1 or sectors_choice > max_sectors:
-                    print("\nInvalid choice. Defaulting to 1 sector.")
-                    wait_for_enter()
+                    self.io.print("\nInvalid choice. Defaulting to 1 sector.")
+                    self.io.wait_for_enter()
                     sectors_to_travel = 1
                 else:
                     sectors_to_travel = sectors_choice
             except ValueError:
-                print("\nInvalid input. Defaulting to 1 sector.")
-                wait_for_enter()
+                self.io.print("\nInvalid input. Defaulting to 1 sector.")
+                self.io.wait_for_enter()
                 sectors_to_travel = 1
         else:
             sectors_to_travel = 1
             
-        print(f"\nYou set course for {sectors_to_travel} sector(s) ahead...")
-        wait_for_enter()
+        self.io.print(f"\nYou set course for {sectors_to_travel} sector(s) ahead...")
+        self.io.wait_for_enter()
         
-        self.ship.fuel -= max(1, round(sectors_to_travel/2))  # Always uses 1 fuel regardless of distance
+        self.ship.update("travel", fuel=self.ship.fuel - max(1, round(sectors_to_travel/2)))  # Always uses 1 fuel regardless of distance
         
-        print(f"Fuel used: {max(1, round(sectors_to_travel/2))}")
+        self.io.print(f"Fuel used: {max(1, round(sectors_to_travel/2))}")
         # Random Encounter Phase - chance increases with distance traveled
         # Base chance is 100% for 1 sector, reduced for multi-sector travel
         # Encounter chance increases with distance traveled
@@ -326,13 +297,25 @@ class Game:
         encounter_chance = 0.5 + (0.5 * (sectors_to_travel / max_sectors))
 
         
-        if DiceRoller.chance(encounter_chance):
-            encounter_type = handle_random_encounter(self)
+        encounter = speculate.precomputed(self, "trip", encounter_chance, self.player.heat,
+                                self.player.cartel_threat_level, len(self.player.stones))
+        self.trip = (sectors_to_travel, encounter)
+        if encounter is not None:
+            encounter_type = encounters.run_encounter(self, encounter)
         else:
-            print("\nYou travel through empty space without incident...")
-            wait_for_enter()
+            self.io.print("\nYou travel through empty space without incident...")
+            self.io.wait_for_enter()
             encounter_type = None
-        
+        return self.finish_trip(encounter_type)
+
+    def finish_trip(self, encounter_type):
+        """The rest of a trip once its encounter is over: progress towards the destination
+
+        An advisor that forks the game during the encounter calls this to play
+        the trip out (see advisor.apply_option).
+        """
+        sectors_to_travel = self.trip[0]
+        self.trip = None
         # Progress towards destination if we have a contract
         if self.player.current_contract:
             # Check if we're about to overshoot the destination
@@ -340,8 +323,8 @@ class Game:
             
             if sectors_to_travel > remaining_distance:
                 actual_travel = remaining_distance
-                #print(f"\nYou reach your destination after {actual_travel} sector(s)!")
-                #wait_for_enter()
+                #self.io.print(f"\nYou reach your destination after {actual_travel} sector(s)!")
+                #self.io.wait_for_enter()
             else:
                 actual_travel = sectors_to_travel
             
@@ -350,16 +333,16 @@ class Game:
             
             if encounter_type == "planet_landing":
                 lost_progress = True
-                # print("\nThe detour costs you valuable time...")
-                wait_for_enter()
+                # self.io.print("\nThe detour costs you valuable time...")
+                self.io.wait_for_enter()
             elif encounter_type == "hazard_avoided":
                 lost_progress = True
-                # print("\nThe detour costs you valuable time...")
-                wait_for_enter()
+                # self.io.print("\nThe detour costs you valuable time...")
+                self.io.wait_for_enter()
             elif encounter_type == "tractor_beam_dungeon":
                 lost_progress = True
-                #print("\nThe detour costs you valuable time...")
-                wait_for_enter()
+                #self.io.print("\nThe detour costs you valuable time...")
+                self.io.wait_for_enter()
             
             if not lost_progress:
                 self.player.current_contract.sectors_traveled += actual_travel
@@ -367,282 +350,9 @@ class Game:
         return True
 
     def check_for_endings(self):
-        # Check for Kingpin ending - 1 million credits
-        if self.player.credits >= 1000000 and not self.player.rejected_kingpin:
-            print("\nYou've earned 1,000,000 credits!")
-            print("Would you like to retire and end the game?")
-            print("1. Yes, retire")
-            print("2. No, keep playing (more endings...)")
-            
-            while True:
-                try:
-                    choice = int(input("\nEnter choice (1-2): "))
-                    if choice == 1:
-                        for _ in range(50):
-                            print()
-                        print("One million credits.")
-                        wait_for_enter()
-                        print("The number glows on your account display, pulsing like a heartbeat.")
-                        wait_for_enter()
-                        print("You could buy a fleet. A moon. Hell, a small army.")
-                        wait_for_enter()
-                        print("Instead, you buy silence.")
-                        wait_for_enter()
-                        print("You blow your credits on a sleek ship with no transponder. A private moon with no name.")
-                        wait_for_enter()
-                        print("No debt. No enemies. No conscience.")
-                        wait_for_enter()
-                        print("You turned off the signal relays. You stopped listening to the screams.")
-                        wait_for_enter()
-                        print("The Stones? Someone else's problem now.")
-                        wait_for_enter()
-                        print("You never looked back as the galaxy burned.")
-                        wait_for_enter()
-                        print("While civilizations fell and the sky turned red with cosmic fire...")
-                        wait_for_enter()
-                        print("you poured yourself another drink.")
-                        wait_for_enter()
-                        print("The ice clinked against crystal as distant suns went dark.")
-                        wait_for_enter()
-                        print("To peace. To ignorance. To the luxury of not caring.")
-                        wait_for_enter()
-                        print("To dying last, in comfort, while the universe crumbled.")
-                        wait_for_enter()
-                        print("Your final thought, as the darkness finally reached your door:")
-                        wait_for_enter()
-                        print("'At least I got mine.'")
-                        wait_for_enter()
-                        print("\nYou achieved the DENIAL Ending!")
-                        self.game_over = True
-                        print("Game Over!")
-                        print(f"You survived {self.day} days.")
-                        quit()
-                    elif choice == 2:
-                        print("\nThe game continues...")
-                        self.player.rejected_kingpin = True
-                        wait_for_enter()
-                        break
-                    else:
-                        print("Invalid choice. Please enter 1 or 2.")
-                except ValueError:
-                    print("Invalid input. Please enter a number.")
-        
-        # Check for Godhood/Martyr ending - player has all 6 stones
-        if len(self.player.stones) == 6:
+        """Play out any ending reached since the last check (see endings.py)"""
+        self.ending_watch.check(self)
 
-            for _ in range(50):
-                print()
-                
-            print("The six stones pulse in your cargo hold...")
-            wait_for_enter()
-            print("Their combined energy begins to tear at the fabric of space-time itself.")
-            wait_for_enter()
-            print("You feel infinite power coursing through your veins, rewriting your DNA.")
-            wait_for_enter()
-            print("The universe holds its breath, waiting for your decision...")
-            wait_for_enter()
-            print("Reality bends around you. You could reshape existence itself.")
-            wait_for_enter()
-            print("Or end the cycle forever.")
-            wait_for_enter()
-            print("NOVA's voice trembles: '[NOVA] I... I can feel them calling to you. What will you choose?'")
-            wait_for_enter()
-            
-            while True:
-                print("\nThe stones whisper your destiny. What is your choice?")
-                print("1. Ascend to Godhood")
-                print("2. Destroy the Stones")
-                choice = input("> ").strip()
-                
-                if choice == "1":
-                    print("You held onto the Stones.")
-                    wait_for_enter()
-                    print("All of them. Their power flows into you like molten starlight.")
-                    wait_for_enter()
-                    print("Your body transcends flesh. Your mind expands beyond mortal comprehension.")
-                    wait_for_enter()
-                    print("Time bends to your will. Memory becomes clay in your hands.")
-                    wait_for_enter()
-                    print("The laws of physics rewrite themselves at your whim.")
-                    wait_for_enter()
-                    print("The Cartel calls you a thief. Their fleets burn at your glance.")
-                    wait_for_enter()
-                    print("The Federation calls you a threat. Their worlds kneel before your presence.")
-                    wait_for_enter()
-                    print("Neither can stop you. Nothing can.")
-                    wait_for_enter()
-                    print("But power is a prison of its own making.")
-                    wait_for_enter()
-                    print("You have no allies - for who could stand beside a god?")
-                    wait_for_enter()
-                    print("No safe port - everywhere you go, reality warps and breaks.")
-                    wait_for_enter()
-                    print("No sleep - immortal minds don't rest, they only endure.")
-                    wait_for_enter()
-                    print("Only power. Endless, crushing, isolating power.")
-                    wait_for_enter()
-                    print("You are not human anymore. You are not even alive.")
-                    wait_for_enter()
-                    print("You are something... greater. A force of nature.")
-                    wait_for_enter()
-                    print("Or perhaps something far, far worse.")
-                    wait_for_enter()
-                    print("As eons pass and galaxies die, you realize the truth:")
-                    wait_for_enter()
-                    print("Gods don't rule the universe. They are imprisoned by it.")
-                    wait_for_enter()
-                    print("\nYou achieved the GODHOOD Ending!")
-                    self.game_over = True
-                    print("Game Over!")
-                    print(f"You survived {self.day} days.")
-                    quit()
-
-                    
-                elif choice == "2":
-                    print("You channel their combined power one final time.")
-                    wait_for_enter()
-                    print("The stones rise from your cargo hold, orbiting around you like miniature suns, their energy building.")
-                    wait_for_enter()
-                    print("You feel the power tearing you apart from the inside.")
-                    wait_for_enter()
-                    print("Your body becomes a conduit for forces beyond mortal comprehension.")
-                    wait_for_enter()
-                    print("The stones resonate, their harmony turning into a death song.")
-                    wait_for_enter()
-                    print("Then they shatter. Reality crumbles.")
-                    wait_for_enter()
-                    print("Their energy tears through you, through space, through time itself.")
-                    wait_for_enter()
-                    print("You feel your consciousness fragmenting across dimensions.")
-                    wait_for_enter()
-                    print("But as your mortal form dissolves, you smile.")
-                    wait_for_enter()
-                    print("The cycle is broken. The game is over.")
-                    wait_for_enter()
-                    print("No one will ever wield this power again.")
-                    wait_for_enter()
-                    print("Your sacrifice echoes across the cosmos as a final act of defiance.")
-                    wait_for_enter()
-                    print("In your last moment, you hear NOVA whisper: '[NOVA] Thank you.'")
-                    wait_for_enter()
-                    print("The universe is free.")
-                    wait_for_enter()
-                    print("\nYou achieved the MARTYR Ending!")
-                    self.game_over = True
-                    print("Game Over!")
-                    print(f"You survived {self.day} days.")
-                    quit()
-        
-        # Check for Harbringer ending - delivered all 6 stones
-        if len(self.player.stones_discovered) >= 6 and len(self.player.stones) == 0:
-            
-            for _ in range(50):
-                print()
-
-            print("You hand over the final stone, its surface pulsing with a light that seems to come from nowhere.")
-            wait_for_enter()
-            print("His eyes widen as you present the final stone. His hands tremble - not with fear, but with anticipation.")
-            wait_for_enter()
-            print("He laughs, a sound that chills your blood. 'At last... you have no idea what you've done.'")
-            wait_for_enter()
-            print("One by one, He places the stones into a massive gauntlet, each slot pulsing with otherworldly energy as the stones lock into place.")
-            wait_for_enter()
-            print("The room shakes. Reality itself seems to warp and bend around Him.")
-            wait_for_enter()
-            print("You try to step back, but your body is frozen - paralyzed by the gravity of the situation.")
-            wait_for_enter()
-            print("He raises His hand, now encased in the completed gauntlet. Power radiates from Him, distorting the air.")
-            wait_for_enter()
-            print("He turns to you, eyes burning with cosmic fire. 'You... fool. You have delivered the universe into My grasp.'")
-            wait_for_enter()
-            print("NOVA's voice crackles in your ear, barely a whisper: '[NOVA] ...I don't like this. Something's wrong. Very wrong.'")
-            wait_for_enter()
-            print("You feel every eye in the room - no, in the galaxy - turn toward you. The weight of destiny presses down.")
-            wait_for_enter()
-            print("A presence, ancient and immense, brushes against your mind. You sense hunger. Purpose. Judgment.")
-            wait_for_enter()
-            print("Suddenly, all light seems to drain from the universe...")
-            wait_for_enter()
-            for _ in range(50):
-                print()
-            wait_for_enter()
-            print("Everything goes black.")
-            wait_for_enter()
-            print("The universe is silent.")
-            wait_for_enter()
-            print("Your body feels weightless, disconnected from reality itself.")
-            wait_for_enter()
-            print("A voice echoes through your mind:")
-            wait_for_enter()
-            print("\"WHAT... HAVE... YOU... DONE...\"")
-            wait_for_enter()
-            print("Visions of cosmic horror flood your consciousness:")
-            wait_for_enter()
-            print("Half of all life, snuffed out in an instant...")
-            wait_for_enter()
-            print("The very fabric of existence, remade in His image...")
-            wait_for_enter()
-            print("As the universe collapses into His fist, you realize your role in this cosmic tragedy.")
-            wait_for_enter()
-            print("Your name was etched into the last breath of a dying universe...")
-            wait_for_enter()
-            print("As the fool who brought Him the keys to unlimited power.")
-            wait_for_enter()
-            print("\n You achieved the HARBRINGER Ending!")
-            wait_for_enter()
-            self.game_over = True
-            print("Game Over!")
-            print(f"You survived {self.day} days.")
-            quit()
-        
-        # Check for Compromise ending - all stones out of play
-        if len(self.player.stones_discovered) >= 6:
-            for _ in range(50):
-                print()
-                
-            print("The galaxy holds its breath.")
-            wait_for_enter()
-            print("No one knows where the Stones are anymore.")
-            wait_for_enter()
-            print("One's buried in the heart of a dying sun, its power feeding nuclear fire.")
-            wait_for_enter()
-            print("One's locked in a vault that exists between dimensions—only you know the way.")
-            wait_for_enter()
-            print("One vanished during a smuggling run, lost to the void between stars.")
-            wait_for_enter()
-            print("The others... scattered to the cosmic winds by your careful hand.")
-            wait_for_enter()
-            print("No one won the great game.")
-            wait_for_enter()
-            print("No one lost everything.")
-            wait_for_enter()
-            print("You kept the galaxy from tipping into chaos or tyranny.")
-            wait_for_enter()
-            print("But no one thanks the one who balanced the scale.")
-            wait_for_enter()
-            print("Heroes get statues. Villains get legends.")
-            wait_for_enter()
-            print("You get to fade into the static of history.")
-            wait_for_enter()
-            print("Unseen. Unsung. Undefeated.")
-            wait_for_enter()
-            print("The cosmic forces rage and scheme, but their game pieces are gone.")
-            wait_for_enter()
-            print("They'll have to find someone else to play their deadly game...")
-            wait_for_enter()
-            print("But hey - at least you're still breathing, right?")
-            wait_for_enter()
-            print("In a universe full of gods and monsters, sometimes survival is victory enough.")
-            wait_for_enter()
-            print("NOVA's voice whispers one last time: '[NOVA] Not bad for a smuggler.'")
-            wait_for_enter()
-            print("\n You achieved the STALEMATE Ending!")
-            self.game_over = True
-            print("Game Over!")
-            print(f"You survived {self.day} days.")
-            quit()
-            
-        
     def play_turn(self):
         # Start of day
         self.check_for_endings()
@@ -650,25 +360,23 @@ class Game:
         self.player.start_new_day()  # Reset daily flags
         self.display_status()
 
-        quote = get_random_nova_quote(self)
+        quote = flavor.get_random_nova_quote(self)
         if quote:
-            print(quote)
-            wait_for_enter()
+            self.io.print(quote)
+            self.io.wait_for_enter()
 
         if self.player.current_contract:
             if self.player.current_contract.is_at_destination():
                 result = self.player.current_contract.handle_arrival(self)
                 if result == "game_over":
-                    self.game_over = True
+                    self.end_game("DEATH")
                     return
                 # After contract completion, automatically visit trade hub
-                print("\nAfter completing your delivery, you head to the local trade hub...")
-                wait_for_enter()
-                handle_trade_hub(self)
+                self.io.print("\nAfter completing your delivery, you head to the local trade hub...")
+                self.io.wait_for_enter()
+                trade_hub_gameplay.handle_trade_hub(self)
                 # Contract arrival (including trade hub visit) counts as the day's action
-                self.day += 1
-                if not self.player.illegal_activity_today:
-                    self.player.heat = max(0, self.player.heat - DiceRoller.d6())
+                self.end_day()
                 return  # End the day after contract completion
             else:
                 # Contract deadline always ticks down
@@ -678,49 +386,58 @@ class Game:
         
         while True:  # Keep asking for actions until the day ends
             choice = self.get_player_choice()
-            
-            # Player Action Phase
-            action_taken = False
-            if choice == 1:  # Travel
-                action_taken = self.travel_action()
-            elif choice == 2:  # Lay Low
-                print("\nFinding a quiet spot to lay low...")
-                wait_for_enter()
-                print("Heat signature reducing...")
-                wait_for_enter()                # Reduce heat by a random percentage (20% to 40%) of current heat
-                if self.player.heat > 0:
-                    percent = random.uniform(0.05, 0.15)
-                    heat_reduction = max(1, int(self.player.heat * percent))
-                    self.player.heat = max(0, self.player.heat - heat_reduction)
-                else:
-                    print("Your heat is already at zero.")
-                wait_for_enter()
-                action_taken = True
-            elif choice == 3:  # Use Item
-                self.player.use_item_from_inventory()
-                # Don't set action_taken for using items since it doesn't end the day
-
-            if action_taken:
-                self.day += 1
-                # Reduce heat by 1 at day end if no illegal actions
-                if not self.player.illegal_activity_today:
-                    self.player.heat = max(0, self.player.heat - DiceRoller.d6())
-                break  # End the day after an action is taken
-            if self.player.hp <= 0:
-                print("\nYou died!")
-                wait_for_enter()
-                self.game_over = True
-                break
-            if self.ship.fuel <= 0:
-                print("\nYou ran out of fuel!")
-                wait_for_enter()
-                self.game_over = True
+            if self.perform_daily_action(choice):
                 break
 
+    def end_day(self):
+        """Close the day once its action is done"""
+        self.day += 1
+        # Reduce heat at day end if no illegal actions
+        if not self.player.illegal_activity_today:
+            self.player.update("day end", heat=max(0, self.player.heat - self.rng.encounters.d6()))
+
+    def perform_daily_action(self, choice):
+        """Carry out one choice from the daily menu; True once the day is over"""
+        # Player Action Phase
+        action_taken = False
+        if choice == 1:  # Travel
+            action_taken = self.travel_action()
+        elif choice == 2:  # Lay Low
+            self.io.print("\nFinding a quiet spot to lay low...")
+            self.io.wait_for_enter()
+            self.io.print("Heat signature reducing...")
+            self.io.wait_for_enter()                # Reduce heat by a random percentage (20% to 40%) of current heat
+            if self.player.heat > 0:
+                percent = self.rng.encounters.uniform(0.05, 0.15)
+                heat_reduction = max(1, int(self.player.heat * percent))
+                self.player.update("lay low", heat=max(0, self.player.heat - heat_reduction))
+            else:
+                self.io.print("Your heat is already at zero.")
+            self.io.wait_for_enter()
+            action_taken = True
+        elif choice == 3:  # Use Item
+            self.player.use_item_from_inventory(self.io)
+            # Don't set action_taken for using items since it doesn't end the day
+
+        if action_taken:
+            self.end_day()
+            return True  # End the day after an action is taken
+        if self.player.hp <= 0:
+            self.io.print("\nYou died!")
+            self.io.wait_for_enter()
+            self.end_game("DEATH", "Wounds")
+            return True
+        if self.ship.fuel <= 0:
+            self.io.print("\nYou ran out of fuel!")
+            self.io.wait_for_enter()
+            self.end_game("STRANDED")
+            return True
+        return False
+
     def initial_setup(self):
         """Handle the initial trade hub visit before the game starts"""
 
-        print(""" __  .__   __.  _______  __  .__   __.  __  .___________.____    ____      ______      __    __   _______     _______.___________.    __   __   __  
+        self.io.print(""" __  .__   __.  _______  __  .__   __.  __  .___________.____    ____      ______      __    __   _______     _______.___________.    __   __   __  
 |  | |  \ |  | |   ____||  | |  \ |  | |  | |           |\   \  /   /     /  __  \    |  |  |  | |   ____|   /       |           |   |  | |  | |  | 
 |  | |   \|  | |  |__   |  | |   \|  | |  | `---|  |----` \   \/   /     |  |  |  |   |  |  |  | |  |__     |   (----`---|  |----`   |  | |  | |  | 
 |  | |  . `  | |   __|  |  | |  . `  | |  |     |  |       \_    _/      |  |  |  |   |  |  |  | |   __|     \   \       |  |        |  | |  | |  | 
@@ -728,85 +445,243 @@ class Game:
 |__| |__| \__| |__|     |__| |__| \__| |__|     |__|         |__|         \_____\_____\\______/  |_______|_______/        |__|        |__| |__| |__| 
                                                                                                                                                     """)
 
-        print("""  __  .__                 .___             __                         .__       .___
+        self.io.print("""  __  .__                 .___             __                         .__       .___
 _/  |_|  |__   ____     __| _/____ _______|  | __ __  _  _____________|  |    __| _/
 \   __\  |  \_/ __ \   / __ |\__  \\_  __ \  |/ / \ \/ \/ /  _ \_  __ \  |   / __ | 
  |  | |   Y  \  ___/  / /_/ | / __ \|  | \/    <   \     (  <_> )  | \/  |__/ /_/ | 
  |__| |___|  /\___  > \____ |(____  /__|  |__|_ \   \/\_/ \____/|__|  |____/\____ | 
            \/     \/       \/     \/           \/                                \/ """)
-        print("v 0.0.1")
-        wait_for_enter()
+        self.io.print("v 0.0.1")
+        self.io.wait_for_enter()
 
 
-        print("Boot sequence initializing...")
-        wait_for_enter()
-        print("System online. Reactor stable. Navigational Operations and Voice Assistant (N.O.V.A) now loading..")
-        wait_for_enter()
+        self.io.print("Boot sequence initializing...")
+        self.io.wait_for_enter()
+        self.io.print("System online. Reactor stable. Navigational Operations and Voice Assistant (N.O.V.A) now loading..")
+        self.io.wait_for_enter()
 
-        print("[NOVA] 'Boot systems nominal. Welcome back...?'\n")
+        self.io.print("[NOVA] 'Boot systems nominal. Welcome back...?'\n")
         
         while True:
-            name = input("Enter your name: ").strip()
+            name = self.io.input("Enter your name: ").strip()
             if name:
                 if name == "motherlode":
-                    print("You found a secret...")
-                    wait_for_enter()
+                    self.io.print("You found a secret...")
+                    self.io.wait_for_enter()
                     self.player.credits = 999999
                 elif name == "5starwanted":
-                    print("You found a secret...")
-                    wait_for_enter()
+                    self.io.print("You found a secret...")
+                    self.io.wait_for_enter()
                     self.player.credits = 999999
                     self.player.heat = 100
                 elif name == "catchmeifucan":
-                    print("You found a secret...")
-                    wait_for_enter()
+                    self.io.print("You found a secret...")
+                    self.io.wait_for_enter()
                     self.player.credits = 999999
                     self.player.cartel_threat_level = 10
                 elif name == "need4speed":
-                    print("You found a secret...")
-                    wait_for_enter()
+                    self.io.print("You found a secret...")
+                    self.io.wait_for_enter()
                     self.ship.speed = 5
                     self.ship.max_fuel = 20
                     self.ship.fuel = 20
                     self.ship.cargo = 5
                 elif name == "idkfa":
-                    print("You found a secret...")
-                    wait_for_enter()
+                    self.io.print("You found a secret...")
+                    self.io.wait_for_enter()
                     self.player.equip_weapon(WEAPONS[9])
                     self.player.equip_armor(ARMORS[9])
                 else:
                     self.player.name = name
                     break
-            print("Please enter a valid name.")
-        print(f"[NOVA] 'Welcome back, {self.player.name}. Did we survive the last job or just blackout again?'")
-        wait_for_enter()
+            self.io.print("Please enter a valid name.")
+        self.io.print(f"[NOVA] 'Welcome back, {self.player.name}. Did we survive the last job or just blackout again?'")
+        self.io.wait_for_enter()
 
-        print("The cockpit lights flicker on. The metal hull creaks...")
-        wait_for_enter()
+        self.io.print("The cockpit lights flicker on. The metal hull creaks...")
+        self.io.wait_for_enter()
 
-        print("[NOVA] 'Cargo bay's empty. Fuel's low. And you still owe three favors and a crate of contraband to some dangerous people...'\n")
+        self.io.print("[NOVA] 'Cargo bay's empty. Fuel's low. And you still owe three favors and a crate of contraband to some dangerous people...'\n")
         
-        print("[NOVA] Our first stop: the closest Trade Hub. Time to gear up.")
+        self.io.print("[NOVA] Our first stop: the closest Trade Hub. Time to gear up.")
 
-        wait_for_enter()
+        self.io.wait_for_enter()
         
-        handle_trade_hub(self)
+        trade_hub_gameplay.handle_trade_hub(self)
         
 
-    def play(self):
-        self.initial_setup()
-        
-        while not self.game_over:
-            self.play_turn()
+    def fork(self, io=None, reseed=None):
+        """Return an independent copy of the game for exploring a what-if branch.
+
+        Only what play changes in place is copied: player, ship, hub,
+        contracts and their crates, and the bounty roster. Equipment and
+        items are shared, and RNG streams are shared copy-on-write, so a
+        fork rolls exactly what this game would unless given a new seed.
+
+        Args:
+            io: IO for the fork (defaults to this game's)
+            reseed: Seed for different luck in the fork
+        """
+        game = _copy(self)
+        game.io = io if io is not None else self.io
+        game.rng = self.rng.fork(reseed)
+
+        copies = {}  # An accepted contract can also still be on the hub board; keep them one object
+        def copy_contract(contract):
+            if contract is None:
+                return None
+            clone = copies.get(id(contract))
+            if clone is None:
+                clone = copies[id(contract)] = _copy(contract)
+                clone.crates = [_copy(crate) for crate in contract.crates]
+            return clone
+
+        hub = game.current_hub = _copy(self.current_hub)
+        hub.available_contracts = [copy_contract(contract) for contract in hub.available_contracts]
 
-        print("Everything goes dark..")
-        wait_for_enter()
+        player = game.player = self.player.copy()  # Observed lists are replaced, never changed, so they're shared
+        player.items = player.items[:]
+        player.inventory = player.inventory[:]
+        player.current_contract = copy_contract(player.current_contract)
+
+        ship = game.ship = self.ship.copy()
+        if isinstance(ship.cargo, list):
+            ship.cargo = ship.cargo[:]
+
+        game.bounty_roster = _copy(self.bounty_roster)
+        game.ending_watch = self.ending_watch.copy(player)
+        game.speculator = None  # Its rolls ahead belong to this game's streams
+        return game
+
+    def end_game(self, ending, cause_of_death=None):
+        """Record how the game ended and return the GameResult.
+
+        The first ending recorded wins, so a death reported deep inside an
+        encounter isn't overwritten by the caller that notices it later.
+        """
+        self.game_over = True
+        if self.result is None:
+            self.result = GameResult(ending, self.day, self.player.credits, cause_of_death)
+        return self.result
+
+    def recommend(self, options):
+        """Have NOVA weigh the options at a decision point (the "recommend" command)
+
+        Args:
+            options: [(label, option)] as described in advisor.py
+        """
+        if self.io.replaying:
+            return None  # Advice doesn't change the game, so replays skip the thinking
+        from advisor import Advisor
+        if self.advisor is None:
+            self.advisor = Advisor()
+        return self.advisor.recommend(self, options)
+
+    def save(self, path=None):
+        """Write the game to a save file (by default one named after the player)"""
+        from savegame import save_game, save_path
+        if self.io.replaying:
+            return  # Replays must not overwrite real save files
+        path = path or save_path(self.player.name)
+        save_game(self, path)
+        self.io.print(f"\n[NOVA] 'Flight log saved to {path}.'")
+
+    def play(self, setup=True):
+        """Play until the game ends and return its GameResult
+
+        Args:
+            setup: Run the intro and naming first; False for a loaded game
+        """
+        try:
+            if setup:
+                self.initial_setup()
+
+            while not self.game_over:
+                self.play_turn()
+        except GameEnded as ended:
+            return ended.result
+
+        self.io.print("Everything goes dark..")
+        self.io.wait_for_enter()
             
-        print("\nGame Over!")
+        self.io.print("\nGame Over!")
         
-        print(f"You survived {self.day} days")
-        wait_for_enter()
+        self.io.print(f"You survived {self.day} days")
+        self.io.wait_for_enter()
+        return self.end_game("DEATH" if self.player.hp <= 0 else "GAME_OVER")
 
 if __name__ == "__main__":
-    game = Game()
-    game.play()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Infinity Quest III: The Dark World")
+    parser.add_argument("--simulate", type=int, metavar="N", help="play N automated games and report the results")
+    parser.add_argument("--workers", type=int, default=1, metavar="K", help="processes to spread simulated games across")
+    parser.add_argument("--seed", type=int, default=0, help="first seed used by --simulate")
+    parser.add_argument("--max-days", type=int, default=365, help="stop simulated games that run longer than this")
+    parser.add_argument("--policy", choices=("sensible", "random"), default="sensible",
+                        help="who plays simulated games: a careful pilot, or uniformly random menu picks")
+    parser.add_argument("--sweep", type=int, metavar="FIGHTS", help="fight every loadout against every enemy FIGHTS times and report win rates")
+    parser.add_argument("--load", metavar="PATH", help="continue a saved game (type 'save' at the daily prompt to save)")
+    parser.add_argument("--saves", action="store_true", help="list saved games")
+    parser.add_argument("--record", metavar="PATH", help="write a replay file of this session")
+    parser.add_argument("--replay", metavar="PATH", help="rebuild a recorded game headlessly and report where it ended")
+    parser.add_argument("--until-day", type=int, metavar="DAY", help="with --replay, fast-forward to DAY and keep playing from there")
+    parser.add_argument("--ansi", action="store_true", help="redraw the status screen in place, sending only the lines that changed")
+    parser.add_argument("--cutscenes", choices=("play", "skip"), default="play",
+                        help="'skip' jumps to the end of every cutscene (type 'skip' at any pause to skip just one)")
+    parser.add_argument("--advisor-workers", type=int, default=0, metavar="K", help="processes NOVA's 'recommend' command thinks with")
+    parser.add_argument("--build-narrative", action="store_true", help="pack content/narrative.txt into the table the game reads")
+    parser.add_argument("--profile-import", action="store_true", help="report what each module costs to import at startup and on first use")
+    args = parser.parse_args()
+
+    if args.advisor_workers:
+        import advisor
+        advisor.DEFAULT_WORKERS = args.advisor_workers
+
+    if args.build_narrative:
+        from narrative import SOURCE, TABLE, build
+        print(f"Packed {build():,} entries from {SOURCE} into {TABLE}")
+    elif args.profile_import:
+        from startup import profile_import
+        profile_import()
+    elif args.simulate:
+        from simulate import simulate
+        simulate(args.simulate, args.workers, args.seed, args.max_days, args.policy)
+    elif args.saves:
+        from savegame import list_saves
+        for header in list_saves():
+            print(f"{header.path}: {header.name}, day {header.day}, {header.credits:,} credits, "
+                  f"HP {header.hp}/{header.max_hp}, heat {header.heat}, {header.stones} stones")
+    elif args.load:
+        from savegame import load_game
+        terminal = TerminalIO(args.ansi, args.cutscenes)
+        game = load_game(args.load, terminal)
+        speculate.Speculator(game).attach(terminal)
+        game.play(setup=False)
+    elif args.replay:
+        from replay import Replay, play_back
+        if args.until_day is not None:
+            play_back(Replay.load(args.replay), until_day=args.until_day, then=TerminalIO(args.ansi, args.cutscenes))
+        else:
+            game = play_back(Replay.load(args.replay))
+            print(game.result or f"Replay ended on day {game.day} with {game.player.credits:,} credits")
+    elif args.sweep:
+        from sweep import sweep
+        print(sweep(fights=args.sweep, seed=args.seed).format())
+    elif args.record:
+        from game_io import AnswerLogIO
+        from replay import Replay
+        terminal = TerminalIO(args.ansi, args.cutscenes)
+        io = AnswerLogIO(terminal)
+        game = Game(io)
+        speculate.Speculator(game).attach(terminal)
+        try:
+            game.play()
+        finally:
+            # Also written when the player bails out with Ctrl-C
+            Replay(game.rng.seed, io.answers).save(args.record)
+    else:
+        terminal = TerminalIO(args.ansi, args.cutscenes)
+        game = Game(terminal)
+        speculate.Speculator(game).attach(terminal)
+        game.play()
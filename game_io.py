@@ -0,0 +1,287 @@
+import sys
+from itertools import zip_longest
+
+CLEAR_SCREEN = "\x1b[2J\x1b[H"  # ANSI: erase the screen, cursor to the top left
+
+class ScriptExhausted(EOFError):
+    """Raised when a scripted IO runs out of answers and has no fallback"""
+
+
+class GameIO:
+    """Base class for the game's input/output backend.
+
+    Every subsystem talks to the player through the IO owned by the Game
+    (game.io) instead of calling print()/input() directly, so a game can be
+    driven by a terminal, a script or a bot.
+    """
+    replaying = False  # True while a ReplayIO is feeding recorded answers
+    on_idle = None  # Called by blocking IOs just before they wait for the player
+    cutscenes = "play"  # How cutscenes play: "play", "skip" or "headless" (see cutscene.py)
+
+
+    def print(self, *args, sep=" ", end="\n"):
+        """Show text to the player (same signature as print)"""
+        raise NotImplementedError
+
+    def input(self, prompt=""):
+        """Ask the player for a line of text"""
+        raise NotImplementedError
+
+    def wait_for_enter(self):
+        """Pause until the player is ready to continue.
+
+        Returns what the player typed, for IOs that read it, else None.
+        """
+        raise NotImplementedError
+
+    def frame(self, lines):
+        """Show a whole screen, given as a list of lines, in one go"""
+        self.print("\n".join(lines))
+
+    def clear(self):
+        """Clear the screen before a big moment"""
+        self.print("\n" * 49)
+
+
+class TerminalIO(GameIO):
+    """Interactive IO backed by stdin/stdout.
+
+    Frames are written with a single write. With ansi=True the screen is
+    cleared with ANSI codes instead of newlines, and when the last frame is
+    still on screen (nothing has scrolled it away) only the lines that
+    changed are rewritten, in place. cutscenes="skip" jumps straight to the
+    end of every cutscene.
+    """
+
+    def __init__(self, ansi=False, cutscenes="play"):
+        self.ansi = ansi
+        self.cutscenes = cutscenes
+        self._frame = None  # Lines of the last frame, while it is still on screen
+        self._lines_since_frame = 0  # Screen rows written since, wrapped lines included
+        self._columns = 80
+
+    def _count(self, text):
+        if self._frame is not None:
+            self._lines_since_frame += sum(1 + len(line) // self._columns for line in text.split("\n")[:-1])
+
+    def print(self, *args, sep=" ", end="\n"):
+        text = sep.join(str(arg) for arg in args) + end
+        sys.stdout.write(text)
+        self._count(text)
+
+    def input(self, prompt=""):
+        self._count(prompt + "\n")  # The player's Enter
+        return input(prompt)
+
+    def wait_for_enter(self):
+        if self.on_idle is not None:
+            self.on_idle()
+        return self.input("\n...\n")
+
+    def frame(self, lines):
+        import shutil  # Only a terminal needs it, and only once it draws
+        self._columns, rows = shutil.get_terminal_size()
+        previous = self._frame
+        if self.ansi and previous is not None and len(previous) + self._lines_since_frame < rows:
+            # The old frame is still at the top of the screen: patch it
+            out = [f"\x1b[{row};1H{line}\x1b[K"
+                   for row, (line, old) in enumerate(zip_longest(lines, previous, fillvalue=None), 1)
+                   if line is not None and line != old]
+            out.append(f"\x1b[{len(lines) + 1};1H\x1b[J")  # Wipe whatever was printed below it
+        elif self.ansi:
+            out = [CLEAR_SCREEN, "\n".join(lines), "\n"]
+        else:
+            out = ["\n".join(lines), "\n"]
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+        fits = len(lines) < rows and all(len(line) < self._columns for line in lines)
+        self._frame = lines if self.ansi and fits else None  # A frame that scrolls or wraps can't be patched
+        self._lines_since_frame = 0
+
+    def clear(self):
+        if self.ansi:
+            sys.stdout.write(CLEAR_SCREEN)
+            self._frame = None
+        else:
+            self.print("\n" * 49)
+
+
+class ScriptedIO(GameIO):
+    """Non-blocking IO that discards output and answers prompts from a script.
+
+    Args:
+        answers: Iterable of answers returned in order by input()
+        policy: Optional callable(prompt, recent_output) -> str used once the
+            scripted answers run out. recent_output is the list of lines
+            printed since the previous prompt.
+        max_inputs: Optional cap on the number of prompts answered, so a
+            runaway game can't loop forever
+
+    With neither answers nor policy this is a null IO: any prompt raises
+    ScriptExhausted. Cutscenes are headless.
+    """
+    cutscenes = "headless"  # Nobody is watching: cutscenes show nothing (see cutscene.py)
+
+    def __init__(self, answers=(), policy=None, max_inputs=None):
+        self.answers = iter(answers)
+        self.policy = policy
+        self.max_inputs = max_inputs
+        self.inputs_given = 0
+        self._recent = []
+
+    def print(self, *args, sep=" ", end="\n"):
+        # Output is only kept (cheaply) when a policy needs to read the menu
+        if self.policy is not None:
+            if len(args) == 1 and type(args[0]) is str:
+                self._recent.append(args[0])  # Nearly every call
+            else:
+                self._recent.append(sep.join(str(arg) for arg in args))
+
+    def input(self, prompt=""):
+        if self.max_inputs is not None and self.inputs_given >= self.max_inputs:
+            raise ScriptExhausted(f"Input budget of {self.max_inputs} prompts used up")
+        self.inputs_given += 1
+
+        answer = next(self.answers, None)
+        if answer is None:
+            if self.policy is None:
+                raise ScriptExhausted(f"No scripted answer for prompt {prompt!r}")
+            answer = self.policy(prompt, self._recent)
+        self._recent = []
+        return answer
+
+    def wait_for_enter(self):
+        pass
+
+
+class RecordingIO(GameIO):
+    """Wraps another IO and records everything that passes through it.
+
+    transcript holds ("out", text), ("in", prompt, answer) and ("wait",)
+    entries in order; inputs holds just the answers. Cutscenes play in full,
+    whatever the inner IO does with them, so they end up in the transcript.
+    """
+
+    def __init__(self, inner=None):
+        self.inner = inner if inner is not None else TerminalIO()
+        self.transcript = []
+        self.inputs = []
+
+    def print(self, *args, sep=" ", end="\n"):
+        self.transcript.append(("out", sep.join(str(arg) for arg in args) + end))
+        self.inner.print(*args, sep=sep, end=end)
+
+    def input(self, prompt=""):
+        answer = self.inner.input(prompt)
+        self.transcript.append(("in", prompt, answer))
+        self.inputs.append(answer)
+        return answer
+
+    def wait_for_enter(self):
+        self.transcript.append(("wait",))
+        return self.inner.wait_for_enter()
+
+    def frame(self, lines):
+        self.transcript.append(("out", "\n".join(lines) + "\n"))
+        self.inner.frame(lines)
+
+    def clear(self):
+        self.transcript.append(("out", "\n" * 50))
+        self.inner.clear()
+
+    def output_text(self):
+        """Return everything printed so far as a single string"""
+        return "".join(entry[1] for entry in self.transcript if entry[0] == "out")
+
+
+class AnswerLogIO(GameIO):
+    """Wraps another IO and keeps just the answers given, for replay files"""
+
+    def __init__(self, inner=None):
+        self.inner = inner if inner is not None else TerminalIO()
+        self.answers = []
+
+    def print(self, *args, sep=" ", end="\n"):
+        self.inner.print(*args, sep=sep, end=end)
+
+    def input(self, prompt=""):
+        answer = self.inner.input(prompt)
+        self.answers.append(answer)
+        return answer
+
+    @property
+    def cutscenes(self):
+        return self.inner.cutscenes
+
+    def wait_for_enter(self):
+        return self.inner.wait_for_enter()
+
+    def frame(self, lines):
+        self.inner.frame(lines)
+
+    def clear(self):
+        self.inner.clear()
+
+
+class ReplayIO(GameIO):
+    """Feeds recorded answers back into a game without showing anything.
+
+    Once the answers run out (or the game reaches until_day, if given) it
+    hands over to the `then` IO, so a replay can fast-forward to a point and
+    continue live from there. Without `then`, ScriptExhausted is raised.
+
+    Args:
+        answers: Recorded answers, in prompt order
+        game: The game being replayed; only needed for until_day
+        then: IO to continue with after the replay
+        until_day: Stop replaying when the game reaches this day
+    """
+
+    def __init__(self, answers, game=None, then=None, until_day=None):
+        self.answers = list(answers)
+        self.position = 0
+        self.game = game
+        self.then = then
+        self.until_day = until_day
+        self.replaying = True
+
+    def _still_replaying(self):
+        if self.replaying and (self.position >= len(self.answers) or
+                               (self.until_day is not None and self.game is not None and self.game.day >= self.until_day)):
+            self.replaying = False
+        return self.replaying
+
+    def print(self, *args, sep=" ", end="\n"):
+        if not self._still_replaying() and self.then is not None:
+            self.then.print(*args, sep=sep, end=end)
+
+    def input(self, prompt=""):
+        if self._still_replaying():
+            answer = self.answers[self.position]
+            self.position += 1
+            return answer
+        if self.then is None:
+            raise ScriptExhausted(f"Replay ended at prompt {prompt!r}")
+        return self.then.input(prompt)
+
+    @property
+    def cutscenes(self):
+        # Recorded cutscenes aren't shown again
+        if not self._still_replaying() and self.then is not None:
+            return self.then.cutscenes
+        return "headless"
+
+    def wait_for_enter(self):
+        if not self._still_replaying() and self.then is not None:
+            return self.then.wait_for_enter()
+
+    def frame(self, lines):
+        if not self._still_replaying() and self.then is not None:
+            self.then.frame(lines)
+
+    def clear(self):
+        if not self._still_replaying() and self.then is not None:
+            self.then.clear()
+
+
+__all__ = ['GameIO', 'TerminalIO', 'ScriptedIO', 'RecordingIO', 'AnswerLogIO', 'ReplayIO', 'ScriptExhausted']
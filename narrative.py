@@ -0,0 +1,188 @@
+import mmap
+import os
+import struct
+import zlib
+from bisect import bisect_left
+
+# Narrative string table.
+#
+# Long-form text (ending cutscenes, tractor beam rooms, shop intros, bribe
+# dialogue) is written in content/narrative.txt and packed by build() into
+# content/narrative.bin, which the game memory-maps and reads by key. Only
+# the entries that are asked for get decoded, and every process hosting a
+# game shares the same pages of the file. The table is rebuilt whenever the
+# text is newer than it; a build is also available as --build-narrative.
+#
+# Source format: "== key" starts an entry and each following line is one
+# line of it, with \n standing for a newline. Blank lines and lines
+# starting with # are skipped. Lines may hold str.format fields such as
+# {name}, filled in by the caller.
+#
+# Table layout, little-endian:
+#
+#   header    HEADER
+#   index     ENTRY per key, sorted by the key's UTF-8 bytes; offsets are
+#             from the start of the keys or data
+#   keys      the keys, back to back
+#   data      each entry's lines joined with NUL, zlib-compressed when that
+#             saves at least a quarter
+
+CONTENT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "content")
+SOURCE = os.path.join(CONTENT_DIR, "narrative.txt")
+TABLE = os.path.join(CONTENT_DIR, "narrative.bin")
+
+TABLE_MAGIC = b"IQ3N"
+TABLE_VERSION = 1
+# magic, version, entries
+HEADER = struct.Struct("<4sHI")
+# key offset, key length, data offset, data length, compressed
+ENTRY = struct.Struct("<IHII?")
+SEPARATOR = "\0"
+
+class NarrativeError(Exception):
+    """Raised when the narrative source or table can't be read"""
+
+def parse(text):
+    """{key: (line, ...)} from narrative source text"""
+    entries = {}
+    lines = None
+    for number, raw in enumerate(text.splitlines(), 1):
+        if not raw.strip() or raw.startswith("#"):
+            continue
+        if raw.startswith("== "):
+            key = raw[3:].strip()
+            if key in entries:
+                raise NarrativeError(f"Line {number}: duplicate key {key!r}")
+            lines = entries[key] = []
+        elif lines is None:
+            raise NarrativeError(f"Line {number}: text before the first key")
+        else:
+            lines.append(raw.replace("\\n", "\n"))
+    return {key: tuple(lines) for key, lines in entries.items()}
+
+def pack(entries):
+    """Serialize {key: lines} to table bytes"""
+    ordered = sorted((key.encode("utf-8"), lines) for key, lines in entries.items())
+    keys = bytearray()
+    data = bytearray()
+    index = bytearray()
+    for key, lines in ordered:
+        payload = SEPARATOR.join(lines).encode("utf-8")
+        packed = zlib.compress(payload, 9)
+        compressed = len(packed) * 4 <= len(payload) * 3
+        if not compressed:
+            packed = payload
+        index += ENTRY.pack(len(keys), len(key), len(data), len(packed), compressed)
+        keys += key
+        data += packed
+    return HEADER.pack(TABLE_MAGIC, TABLE_VERSION, len(ordered)) + bytes(index) + bytes(keys) + bytes(data)
+
+def build(source=SOURCE, target=TABLE):
+    """Pack the narrative source into a table file; returns the entry count"""
+    with open(source, encoding="utf-8") as f:
+        entries = parse(f.read())
+    temp = f"{target}.{os.getpid()}.tmp"  # Games starting together may all rebuild
+    with open(temp, "wb") as f:
+        f.write(pack(entries))
+    os.replace(temp, target)  # Processes with the old table mapped keep reading it
+    return len(entries)
+
+class NarrativeTable:
+    """Lines of text by key, read from a packed table (bytes or an mmap)"""
+
+    def __init__(self, buffer):
+        if len(buffer) < HEADER.size:
+            raise NarrativeError("File is too short to be a narrative table")
+        magic, version, count = HEADER.unpack_from(buffer)
+        if magic != TABLE_MAGIC:
+            raise NarrativeError("Not a narrative table")
+        if version != TABLE_VERSION:
+            raise NarrativeError(f"Unsupported narrative table version {version}")
+        self._buffer = buffer
+        self._count = count
+        self._keys_at = HEADER.size + count * ENTRY.size
+        last = self._entry(count - 1) if count else None
+        self._data_at = self._keys_at + (last[0] + last[1] if last else 0)
+        self._cache = {}
+
+    def __len__(self):
+        return self._count
+
+    # bisect over the index in place, without building a list of keys
+    def __getitem__(self, i):
+        key_offset, key_length = self._entry(i)[:2]
+        start = self._keys_at + key_offset
+        return self._buffer[start:start + key_length]
+
+    def _entry(self, i):
+        return ENTRY.unpack_from(self._buffer, HEADER.size + i * ENTRY.size)
+
+    def _find(self, key):
+        encoded = key.encode("utf-8")
+        i = bisect_left(self, encoded)
+        if i < self._count and self[i] == encoded:
+            return i
+        return None
+
+    def __contains__(self, key):
+        return key in self._cache or self._find(key) is not None
+
+    def lines(self, key):
+        """The lines of an entry, as a tuple"""
+        lines = self._cache.get(key)
+        if lines is None:
+            i = self._find(key)
+            if i is None:
+                raise KeyError(key)
+            _, _, data_offset, data_length, compressed = self._entry(i)
+            start = self._data_at + data_offset
+            payload = self._buffer[start:start + data_length]
+            if compressed:
+                payload = zlib.decompress(payload)
+            lines = self._cache[key] = tuple(payload.decode("utf-8").split(SEPARATOR))
+        return lines
+
+    def text(self, key):
+        """An entry as one newline-joined string"""
+        return "\n".join(self.lines(key))
+
+def open_table(source=SOURCE, target=TABLE):
+    """Map the table, rebuilding it first if the source is newer.
+
+    When the table can't be written (a read-only install, say) it is
+    packed in memory instead.
+    """
+    try:
+        stale = os.path.getmtime(source) > os.path.getmtime(target)
+    except OSError:
+        stale = os.path.exists(source)  # No table yet, or only a table
+    if stale:
+        try:
+            build(source, target)
+        except OSError:
+            with open(source, encoding="utf-8") as f:
+                return NarrativeTable(pack(parse(f.read())))
+    try:
+        with open(target, "rb") as f:
+            return NarrativeTable(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    except (OSError, ValueError) as e:
+        raise NarrativeError(f"Can't open narrative table {target}: {e}") from e
+
+_table = None
+
+def table():
+    """The game's narrative table, opened on first use"""
+    global _table
+    if _table is None:
+        _table = open_table()
+    return _table
+
+def lines(key):
+    """The lines of a narrative entry"""
+    return table().lines(key)
+
+def has(key):
+    """Whether the narrative table has an entry"""
+    return key in table()
+
+__all__ = ['NarrativeError', 'NarrativeTable', 'build', 'lines', 'has', 'open_table', 'table']
@@ -0,0 +1,96 @@
+from functools import lru_cache
+
+from combat import BountyHunter, LOCAL_DEPUTY, SECTOR_BADGE, FEDERATION_RANGER, GALACTIC_ENFORCER
+
+# Exact fight odds for a player who attacks every round.
+#
+# The player's damage is fixed, so the fight lasts ceil(enemy_hp / damage)
+# rounds if the player survives, and the enemy gets one swing fewer than
+# that. Each swing is uniform in [min_damage, max_damage] minus armor, so the
+# fight is an absorbing Markov chain over the player's HP: we push the HP
+# distribution through the enemy's swings and collect the mass that hits 0.
+
+class FightOdds:
+    """Exact outcome of a straight fight (attack every round, no items).
+
+    Args:
+        victory: Probability the enemy dies first
+        defeat: Probability the player dies first
+        expected_hp: Expected HP left, given victory
+        expected_turns: Expected number of rounds until the fight ends
+    """
+
+    def __init__(self, victory, defeat, expected_hp, expected_turns):
+        self.victory = victory
+        self.defeat = defeat
+        self.expected_hp = expected_hp
+        self.expected_turns = expected_turns
+
+    def __repr__(self):
+        return (f"FightOdds(victory={self.victory:.4f}, defeat={self.defeat:.4f}, "
+                f"expected_hp={self.expected_hp:.1f}, expected_turns={self.expected_turns:.2f})")
+
+def _hit_distribution(min_damage, max_damage, armor):
+    """Return [(damage after armor, probability)] for one enemy swing"""
+    sides = max_damage - min_damage + 1
+    pmf = {}
+    for raw in range(min_damage, max_damage + 1):
+        damage = max(0, raw - armor)
+        pmf[damage] = pmf.get(damage, 0.0) + 1.0 / sides
+    return sorted(pmf.items())
+
+@lru_cache(maxsize=4096)
+def fight_odds(player_hp, player_damage, armor, enemy_hp, min_damage, max_damage):
+    """Exact FightOdds for one (loadout, enemy, HP) combination; memoized"""
+    if player_hp <= 0:
+        return FightOdds(0.0, 1.0, 0.0, 0.0)  # Already dead: lost before the first turn
+    hits = _hit_distribution(min_damage, max_damage, armor)
+
+    if player_damage <= 0:
+        # The enemy never goes down; the player dies eventually unless nothing gets through armor
+        if all(damage == 0 for damage, _ in hits):
+            return FightOdds(0.0, 0.0, float(player_hp), float("inf"))
+        return FightOdds(0.0, 1.0, 0.0, float("inf"))
+
+    rounds = -(-enemy_hp // player_damage)  # Player attacks needed to win
+    hp_probability = [0.0] * (player_hp + 1)  # P(player has exactly this HP and is alive)
+    hp_probability[player_hp] = 1.0
+    defeat = 0.0
+    turns = 0.0
+
+    for round_number in range(1, rounds):  # The enemy swings back after every attack but the last
+        next_probability = [0.0] * (player_hp + 1)
+        for hp in range(1, player_hp + 1):
+            p = hp_probability[hp]
+            if not p:
+                continue
+            for damage, q in hits:
+                if hp - damage <= 0:
+                    defeat += p * q
+                    turns += round_number * p * q
+                else:
+                    next_probability[hp - damage] += p * q
+        hp_probability = next_probability
+
+    victory = sum(hp_probability)
+    turns += rounds * victory
+    expected_hp = sum(hp * p for hp, p in enumerate(hp_probability)) / victory if victory else 0.0
+    return FightOdds(victory, defeat, expected_hp, turns)
+
+def odds_against(player, enemy):
+    """FightOdds for the player's current HP and gear against an Enemy instance"""
+    armor = player.armor_item.defense if player.armor_item else 0
+    return fight_odds(max(0, player.hp), player.get_total_damage(), armor,
+                      enemy.hp, enemy.min_damage, enemy.max_damage)
+
+def loadout_odds(enemy_factory, weapon=None, armor_item=None, hp=100, base_damage=10):
+    """FightOdds for a loadout against a fresh enemy from one of the enemy factories"""
+    enemy = enemy_factory()
+    damage = base_damage + (weapon.damage if weapon else 0)
+    armor = armor_item.defense if armor_item else 0
+    return fight_odds(hp, damage, armor, enemy.hp, enemy.min_damage, enemy.max_damage)
+
+# Every enemy factory with fixed stats, for balance tables
+ENEMY_FACTORIES = [LOCAL_DEPUTY, SECTOR_BADGE, FEDERATION_RANGER, GALACTIC_ENFORCER] + list(BountyHunter.HUNTERS)
+
+__all__ = ['FightOdds', 'fight_odds', 'odds_against', 'loadout_odds', 'ENEMY_FACTORIES']
@@ -0,0 +1,31 @@
+class GameResult:
+    """Final outcome of a finished game.
+
+    Args:
+        ending: Ending id ("DEATH", "STRANDED", "DENIAL", "GODHOOD", "MARTYR",
+            "HARBRINGER", "STALEMATE", ...)
+        day: Day the game ended on
+        credits: Credits held when the game ended
+        cause_of_death: What killed the player, or None if they survived
+    """
+
+    def __init__(self, ending, day, credits, cause_of_death=None):
+        self.ending = ending
+        self.day = day
+        self.credits = credits
+        self.cause_of_death = cause_of_death
+
+    def __repr__(self):
+        return (f"GameResult(ending={self.ending!r}, day={self.day}, "
+                f"credits={self.credits}, cause_of_death={self.cause_of_death!r})")
+
+
+class GameEnded(Exception):
+    """Raised to unwind out of a game the moment it ends; caught by Game.play()"""
+
+    def __init__(self, result):
+        super().__init__(result.ending)
+        self.result = result
+
+
+__all__ = ['GameResult', 'GameEnded']
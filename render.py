@@ -0,0 +1,86 @@
+from functools import lru_cache
+
+# The daily status screen, built as a list of lines and handed to
+# io.frame() in one piece, so a terminal can write it in a single call (or
+# only the lines that changed since the last one; see TerminalIO).
+
+WIDTH = 78
+BOX_TOP = "╔" + "═" * WIDTH + "╗"
+BOX_BOTTOM = "╚" + "═" * WIDTH + "╝"
+BAR_LENGTH = 20
+
+@lru_cache(maxsize=128)
+def day_banner(day):
+    """The boxed day header, three lines"""
+    day_text = f" Day {day} "
+    left_pad = (WIDTH - len(day_text)) // 2
+    return (BOX_TOP, "║" + " " * left_pad + day_text.ljust(WIDTH - left_pad) + "║", BOX_BOTTOM)
+
+@lru_cache(maxsize=BAR_LENGTH + 1)
+def bar(blocks):
+    """A [█████░░░░░] bar with `blocks` of BAR_LENGTH filled"""
+    return "[" + "█" * blocks + "░" * (BAR_LENGTH - blocks) + "]"
+
+def status_lines(game):
+    """Every line of the daily status screen"""
+    player, ship = game.player, game.ship
+    contract = player.current_contract
+    lines = ["", ""]  # Clear screen with newlines
+    lines.extend(day_banner(game.day))
+    lines.append("")
+
+    # Contract status
+    if contract:
+        lines.append("Current Contract:")
+        lines.append(f"• {len(contract.crates)} crates")
+        lines.append(f"• {contract.deadline} days remaining")
+        lines.append("")
+        lines.append("Progress:")
+        lines.append(f"  {contract.get_progress_map()}")
+        lines.append("")
+
+    # Cargo hold, one bracketed slot per cargo space
+    slots = ["EMPTY"] * ship.max_cargo
+    if contract:
+        for i, crate in enumerate(contract.crates):
+            slots[i] = crate.tier.upper()
+    lines.append("")
+    lines.append("Cargo Hold:")
+    lines.append("  " + "".join(f"[{slot}]  " for slot in slots))
+    lines.append("")
+
+    # Stats with ASCII bars
+    lines.append("Status:")
+    lines.append(f"  Health:{bar(int((player.hp / player.max_hp) * BAR_LENGTH))} {player.hp}/{player.max_hp}")
+    lines.append(f"  Fuel:  {bar(int((ship.fuel / ship.max_fuel) * BAR_LENGTH))} {ship.fuel}/{ship.max_fuel}")
+    lines.append(f"  Heat:  {bar(int((min(player.heat, 100) / 100) * BAR_LENGTH))} {player.heat}")
+    if player.cartel_threat_level > 0:  # Only shown once the cartel is after you
+        threat_level = min(player.cartel_threat_level, 10)
+        lines.append(f"  Cartel Threat:{bar(int((threat_level / 10) * BAR_LENGTH))} {player.cartel_threat_level}/10")
+    lines.append("")
+    lines.append(f"  Credits: {player.credits:,}")
+
+    # Equipment and Items
+    if player.armor_item:
+        lines.append("")
+        lines.append(f"Armor: {player.armor_item.name} +{player.armor_item.defense} defense")
+    if player.weapon:
+        lines.append(f"Weapon: {player.weapon.name} +{player.weapon.damage} damage")
+    if player.items:
+        lines.append("")
+        lines.append("Items:")
+        lines.extend(f"• {item.name}" for item in player.items)
+    if player.stones:
+        lines.append("")
+        lines.append("Infinity Stones:")
+        lines.extend(f"• {stone} Stone" for stone in player.stones)
+    if player.inventory:
+        lines.append("")
+        lines.append("Cargo Inventory:")
+        for item in player.inventory:
+            contraband_mark = "⚠ " if item['is_contraband'] else "  "
+            lines.append(f"{contraband_mark}{item['name']:<25} {item['value']:>5,} credits")
+    lines.append("")
+    return lines
+
+__all__ = ['day_banner', 'bar', 'status_lines']
@@ -0,0 +1,74 @@
+import struct
+import zlib
+
+from game_io import ReplayIO, ScriptExhausted
+
+# Replay file: a small header (magic, version, seed, number of answers)
+# followed by the answers, newline-joined and zlib-compressed. Every random
+# roll in a game comes from GameRNG(seed), so seed + answers rebuild the run
+# exactly.
+
+REPLAY_MAGIC = b"IQ3R"
+REPLAY_VERSION = 1
+HEADER = struct.Struct("<4sHqI")
+
+class ReplayError(Exception):
+    """Raised when a replay file can't be read"""
+
+class Replay:
+    """A game's seed and every answer given to its prompts, in order"""
+
+    def __init__(self, seed, answers):
+        self.seed = seed
+        self.answers = list(answers)
+
+    def dumps(self):
+        body = zlib.compress("\n".join(self.answers).encode("utf-8"), 9)
+        return HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.seed, len(self.answers)) + body
+
+    @classmethod
+    def loads(cls, data):
+        if len(data) < HEADER.size:
+            raise ReplayError("File is too short to be a replay")
+        magic, version, seed, count = HEADER.unpack_from(data)
+        if magic != REPLAY_MAGIC:
+            raise ReplayError("Not a replay file")
+        if version != REPLAY_VERSION:
+            raise ReplayError(f"Unsupported replay version {version}")
+        try:
+            answers = zlib.decompress(data[HEADER.size:]).decode("utf-8").split("\n") if count else []
+        except (zlib.error, UnicodeDecodeError) as e:
+            raise ReplayError(f"Corrupt replay file: {e}") from e
+        if len(answers) != count:
+            raise ReplayError(f"Replay should hold {count} answers but has {len(answers)}")
+        return cls(seed, answers)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(self.dumps())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.loads(f.read())
+
+def play_back(replay, until_day=None, then=None):
+    """Rebuild a game from a replay and return it.
+
+    Without `then` the replay runs headlessly until its answers run out (or
+    until_day is reached) and the game is returned in that state; its
+    result is set if the recorded game ended. With `then`, play continues
+    live on that IO once the replay is done.
+    """
+    from game import Game
+
+    io = ReplayIO(replay.answers, then=then, until_day=until_day)
+    game = Game(io, seed=replay.seed)
+    io.game = game
+    try:
+        game.play()
+    except ScriptExhausted:
+        pass  # Reached the end of the recording
+    return game
+
+__all__ = ['Replay', 'ReplayError', 'play_back']
@@ -0,0 +1,304 @@
+import os
+import struct
+import time
+
+from equipment import WEAPONS, ARMORS
+from combat import BountyRoster, create_item
+from contracts import Contract, Crate
+
+# Binary save format, little-endian throughout:
+#
+#   header    HEADER, then the player's name; readable on its own for save slot lists
+#   player    PLAYER
+#   ship      SHIP, then the cargo
+#   game      GAME
+#   lists     items, stones, stones discovered (one code byte each),
+#             inventory entries, hub contracts, current contract
+#
+# Equipment is stored as its index in WEAPONS / ARMORS, combat items and
+# stones as their index in ITEM_CODES / STONES, so those tables may only
+# ever be appended to. Anything else that changes the layout must bump
+# SAVE_VERSION.
+#
+# The RNG streams themselves aren't saved, only the seed and epoch: a loaded
+# game continues on the streams of the next epoch. That keeps the format
+# clear of DiceRoller internals (buffers, refill sizes, NumPy state) and
+# still makes every load of a save play out the same way, but a loaded game
+# doesn't roll what the game would have rolled had it never been saved.
+
+SAVE_MAGIC = b"IQ3S"
+SAVE_VERSION = 2
+SAVE_DIR = "saves"
+SAVE_EXTENSION = ".sav"
+
+ITEM_CODES = ("medkit", "shield", "grenade")
+STONES = ("Space", "Mind", "Reality", "Power", "Soul", "Time")
+CRATE_TIERS = ("legit", "illicit", "sealed")
+NONE16 = 0xFFFF
+NONE8 = 0xFF
+
+# magic, version, rng epoch, day, credits, hp, max_hp, heat, stones, saved at, seed
+HEADER = struct.Struct("<4sHHIqiiiBdq")
+# base damage, armor, weapon, armor item, illegal activity today, cartel threat, rejected kingpin
+PLAYER = struct.Struct("<iiHH?i?")
+# fuel, max fuel, speed, max cargo
+SHIP = struct.Struct("<iiii")
+# cargo: a count then names, or NONE16 then this number (the need4speed code sets one)
+CARGO_NUMBER = struct.Struct("<i")
+# game over, eliminated hunters mask, hub fuel price, current contract (0 none, 1 inline, 2+ hub contract)
+GAME = struct.Struct("<?IiB")
+# distance, deadline, sectors traveled, base reward, reward, crates
+CONTRACT = struct.Struct("<iiiqqB")
+# tier, flags (1 opened, 2 stone), stone, value
+CRATE = struct.Struct("<BBBq")
+# value, contraband
+INVENTORY = struct.Struct("<q?")
+COUNT8 = struct.Struct("<B")
+COUNT16 = struct.Struct("<H")
+
+class SaveError(Exception):
+    """Raised when a save file can't be read"""
+
+class SaveHeader:
+    """The summary at the front of every save file"""
+
+    def __init__(self, version, epoch, name, day, credits, hp, max_hp, heat, stones, saved_at, seed, path=None):
+        self.version = version
+        self.epoch = epoch
+        self.name = name
+        self.day = day
+        self.credits = credits
+        self.hp = hp
+        self.max_hp = max_hp
+        self.heat = heat
+        self.stones = stones
+        self.saved_at = saved_at
+        self.seed = seed
+        self.path = path
+
+    def __repr__(self):
+        return (f"SaveHeader(name={self.name!r}, day={self.day}, credits={self.credits}, "
+                f"hp={self.hp}/{self.max_hp}, heat={self.heat}, stones={self.stones})")
+
+def _parse_header(data, path=None):
+    """Returns the SaveHeader and the offset just past it"""
+    if len(data) < HEADER.size:
+        raise SaveError("File is too short to be a save")
+    magic, version, epoch, day, credits, hp, max_hp, heat, stones, saved_at, seed = HEADER.unpack_from(data)
+    if magic != SAVE_MAGIC:
+        raise SaveError("Not a save file")
+    if version != SAVE_VERSION:
+        raise SaveError(f"Unsupported save version {version}")
+    start = HEADER.size + COUNT16.size
+    end = start + COUNT16.unpack_from(data, HEADER.size)[0] if len(data) >= start else None
+    if end is None or len(data) < end:
+        raise SaveError("File is too short to be a save")
+    name = data[start:end].decode("utf-8", "replace")
+    return SaveHeader(version, epoch, name, day, credits, hp, max_hp, heat, stones, saved_at, seed, path), end
+
+# --- Writing ------------------------------------------------------------------
+
+def _pack_str(out, text):
+    if text is None:
+        out += COUNT16.pack(NONE16)
+        return
+    data = text.encode("utf-8")
+    out += COUNT16.pack(len(data))
+    out += data
+
+def _pack_codes(out, values, table):
+    out += COUNT8.pack(len(values))
+    out += bytes(table.index(value) for value in values)
+
+def _pack_contract(out, contract):
+    out += CONTRACT.pack(contract.distance, contract.deadline, contract.sectors_traveled,
+                         contract.base_reward, contract.reward, len(contract.crates))
+    for crate in contract.crates:
+        flags = (1 if crate.is_opened else 0) | (2 if crate.is_stone else 0)
+        stone = STONES.index(crate.stone_type) if crate.stone_type else NONE8
+        out += CRATE.pack(CRATE_TIERS.index(crate.tier), flags, stone, crate.value)
+        _pack_str(out, crate.contents)
+
+def dumps(game):
+    """Serialize a game to bytes"""
+    player, ship, hub = game.player, game.ship, game.current_hub
+    out = bytearray()
+    out += HEADER.pack(SAVE_MAGIC, SAVE_VERSION, game.rng.epoch, game.day, player.credits,
+                       player.hp, player.max_hp, player.heat, len(player.stones), time.time(), game.rng.seed)
+    _pack_str(out, player.name)
+
+    weapon = WEAPONS.index(player.weapon) if player.weapon else NONE16
+    armor_item = ARMORS.index(player.armor_item) if player.armor_item else NONE16
+    out += PLAYER.pack(player.base_damage, player.armor, weapon, armor_item,
+                       player.illegal_activity_today, player.cartel_threat_level, player.rejected_kingpin)
+    out += SHIP.pack(ship.fuel, ship.max_fuel, ship.speed, ship.max_cargo)
+    if isinstance(ship.cargo, list):
+        out += COUNT16.pack(len(ship.cargo))
+        for name in ship.cargo:
+            _pack_str(out, name)
+    else:
+        out += COUNT16.pack(NONE16)
+        out += CARGO_NUMBER.pack(ship.cargo)
+
+    contract = player.current_contract
+    if contract is None:
+        contract_ref = 0
+    elif contract in hub.available_contracts:
+        contract_ref = 2 + hub.available_contracts.index(contract)
+    else:
+        contract_ref = 1
+    out += GAME.pack(game.game_over, game.bounty_roster.eliminated, hub.fuel_price, contract_ref)
+
+    _pack_codes(out, [item.item_id for item in player.items], ITEM_CODES)
+    _pack_codes(out, player.stones, STONES)
+    _pack_codes(out, player.stones_discovered, STONES)  # May repeat a stone that was found twice
+
+    out += COUNT16.pack(len(player.inventory))
+    for entry in player.inventory:
+        _pack_str(out, entry["name"])
+        out += INVENTORY.pack(entry["value"], entry["is_contraband"])
+
+    out += COUNT8.pack(len(hub.available_contracts))
+    for hub_contract in hub.available_contracts:
+        _pack_contract(out, hub_contract)
+    if contract_ref == 1:
+        _pack_contract(out, contract)
+    return bytes(out)
+
+# --- Reading ------------------------------------------------------------------
+
+class _Reader:
+    def __init__(self, data, offset):
+        self.data = data
+        self.offset = offset
+
+    def read(self, layout):
+        values = layout.unpack_from(self.data, self.offset)
+        self.offset += layout.size
+        return values
+
+    def count8(self):
+        return self.read(COUNT8)[0]
+
+    def count16(self):
+        return self.read(COUNT16)[0]
+
+    def str(self):
+        length = self.count16()
+        if length == NONE16:
+            return None
+        text = self.data[self.offset:self.offset + length].decode("utf-8")
+        self.offset += length
+        return text
+
+    def codes(self, table):
+        count = self.count8()
+        values = [table[code] for code in self.data[self.offset:self.offset + count]]
+        self.offset += count
+        return values
+
+    def contract(self):
+        # Built without __init__, which would roll a brand new contract
+        contract = Contract.__new__(Contract)
+        (contract.distance, contract.deadline, contract.sectors_traveled,
+         contract.base_reward, contract.reward, crates) = self.read(CONTRACT)
+        contract.crates = []
+        for _ in range(crates):
+            crate = Crate.__new__(Crate)
+            tier, flags, stone, crate.value = self.read(CRATE)
+            crate.tier = CRATE_TIERS[tier]
+            crate.is_opened = bool(flags & 1)
+            crate.is_stone = bool(flags & 2)
+            crate.stone_type = STONES[stone] if stone != NONE8 else None
+            crate.contents = self.str()
+            contract.crates.append(crate)
+        return contract
+
+def loads(data, io=None):
+    """Rebuild a Game from bytes written by dumps()
+
+    The game continues from the saved seed on the next RNG epoch (see the
+    notes on the format above), so loading the same save always plays out
+    the same way.
+    """
+    from game import Game
+
+    header, offset = _parse_header(data)
+    game = Game(io, seed=header.seed, epoch=header.epoch + 1)
+    game.day = header.day
+    player, ship, hub = game.player, game.ship, game.current_hub
+    player.name = header.name
+    player.credits, player.hp, player.max_hp, player.heat = header.credits, header.hp, header.max_hp, header.heat
+
+    try:
+        reader = _Reader(data, offset)
+        (player.base_damage, player.armor, weapon, armor_item, player.illegal_activity_today,
+         player.cartel_threat_level, player.rejected_kingpin) = reader.read(PLAYER)
+        player.weapon = WEAPONS[weapon] if weapon != NONE16 else None
+        player.armor_item = ARMORS[armor_item] if armor_item != NONE16 else None
+        ship.fuel, ship.max_fuel, ship.speed, ship.max_cargo = reader.read(SHIP)
+        cargo = reader.count16()
+        ship.cargo = reader.read(CARGO_NUMBER)[0] if cargo == NONE16 else [reader.str() for _ in range(cargo)]
+        game.game_over, eliminated, hub.fuel_price, contract_ref = reader.read(GAME)
+        game.bounty_roster = BountyRoster(eliminated)
+
+        player.items = [create_item(item_id) for item_id in reader.codes(ITEM_CODES)]
+        player.stones = reader.codes(STONES)
+        player.stones_discovered = reader.codes(STONES)
+        for _ in range(reader.count16()):
+            name = reader.str()
+            value, is_contraband = reader.read(INVENTORY)
+            player.inventory.append({"name": name, "value": value, "is_contraband": is_contraband})
+
+        hub.available_contracts = [reader.contract() for _ in range(reader.count8())]
+        if contract_ref == 1:
+            player.current_contract = reader.contract()
+        elif contract_ref >= 2:
+            player.current_contract = hub.available_contracts[contract_ref - 2]
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise SaveError(f"Corrupt save file: {e}") from e
+    return game
+
+# --- Files --------------------------------------------------------------------
+
+def save_path(name, directory=SAVE_DIR):
+    """Default save file for a player name"""
+    safe = "".join(c if c.isalnum() or c in "-_" else "_" for c in name) or "player"
+    return os.path.join(directory, safe + SAVE_EXTENSION)
+
+def save_game(game, path):
+    """Write a game to a save file"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(dumps(game))
+
+def load_game(path, io=None):
+    """Read a game back from a save file"""
+    with open(path, "rb") as f:
+        return loads(f.read(), io)
+
+def read_header(path):
+    """Read only the header of a save file"""
+    with open(path, "rb") as f:
+        data = f.read(HEADER.size + COUNT16.size)
+        if len(data) == HEADER.size + COUNT16.size:
+            data += f.read(COUNT16.unpack_from(data, HEADER.size)[0])  # The name
+        return _parse_header(data, path)[0]
+
+def list_saves(directory=SAVE_DIR):
+    """Headers of every readable save in a directory, newest first"""
+    if not os.path.isdir(directory):
+        return []
+    headers = []
+    for filename in os.listdir(directory):
+        if filename.endswith(SAVE_EXTENSION):
+            try:
+                headers.append(read_header(os.path.join(directory, filename)))
+            except (OSError, SaveError):
+                continue
+    return sorted(headers, key=lambda header: -header.saved_at)
+
+__all__ = ['SaveError', 'SaveHeader', 'SAVE_VERSION', 'dumps', 'loads', 'save_path',
+           'save_game', 'load_game', 'read_header', 'list_saves']
@@ -1,17 +1,17 @@
-from utils import DiceRoller, wait_for_enter
 from equipment import (
     WEAPONS, ARMORS, get_random_weapon, get_random_armor,
     COMMON, UNCOMMON, RARE, EPIC, LEGENDARY
 )
 from combat import MEDKIT, SHIELD, STUN_GRENADE
 from fights import CartelEncounter, PoliceEncounter
+from outcome import GameEnded
+import narrative
 
-import random
 
-def generate_black_market_atmosphere():
+def generate_black_market_atmosphere(rng):
     """Generate black market atmosphere similar to trade hub system"""
     market_types = ["underground", "smuggler_den", "pirate_outpost", "shadow_bazaar"]
-    market_type = random.choice(market_types)
+    market_type = rng.choice(market_types)
     
     market_visual = {
         "underground": [
@@ -132,8 +132,10 @@ def generate_black_market_atmosphere():
 
 class Shop:
     """Base class for all shop types"""
-    def __init__(self, name):
+    def __init__(self, name, io, rng):
         self.name = name
+        self.io = io
+        self.rng = rng
         self.inventory = {
             'weapons': [],
             'armor': [],
@@ -143,17 +145,17 @@ class Shop:
     def display_inventory(self, category, player):
         """Display items of a specific category with enhanced atmospheric formatting"""
         if not self.inventory[category]:
-            print(f"\nNo {category} available in stock.")
-            wait_for_enter()
+            self.io.print(f"\nNo {category} available in stock.")
+            self.io.wait_for_enter()
             return
             
         # Simple header without box
-        print(f"\n=== {self.name.upper()} - {category.upper()} ===")
-        print(f"Your Credits: {player.credits:,}")
-        print("\nAvailable inventory:")
+        self.io.print(f"\n=== {self.name.upper()} - {category.upper()} ===")
+        self.io.print(f"Your Credits: {player.credits:,}")
+        self.io.print("\nAvailable inventory:")
         
         for i, item in enumerate(self.inventory[category], 1):
-            print("\n" + "─" * 60)
+            self.io.print("\n" + "─" * 60)
             
             if hasattr(item, 'damage'):  # Weapon
                 self._display_weapon(i, item, player)
@@ -162,8 +164,8 @@ class Shop:
             else:  # Combat item
                 self._display_combat_item(i, item, player)
         
-        print("\n" + "─" * 60)
-        print("\n[0] Back")
+        self.io.print("\n" + "─" * 60)
+        self.io.print("\n[0] Back")
     
     def handle_purchase(self, category, player, choice):
         """Handle purchasing an item from the shop"""
@@ -176,8 +178,8 @@ class Shop:
             price = self._get_item_price(item)
             
             if player.credits < price:
-                print("\nYou don't have enough credits!")
-                wait_for_enter()
+                self.io.print("\nYou don't have enough credits!")
+                self.io.wait_for_enter()
                 return False
                 
             # Handle purchase based on item type
@@ -197,63 +199,63 @@ class Shop:
         """Process weapon purchase"""
         # Show comparison if player has a weapon
         if player.weapon:
-            print(f"\nYour current weapon: {player.weapon}")
+            self.io.print(f"\nYour current weapon: {player.weapon}")
             if weapon.damage > player.weapon.damage:
-                print(f"This weapon does {weapon.damage - player.weapon.damage} more damage than your current one.")
+                self.io.print(f"This weapon does {weapon.damage - player.weapon.damage} more damage than your current one.")
             else:
-                print(f"This weapon does {player.weapon.damage - weapon.damage} less damage than your current one.")
+                self.io.print(f"This weapon does {player.weapon.damage - weapon.damage} less damage than your current one.")
         
         # Confirm purchase
-        print(f"\nPurchase {weapon.name} for {price:,} credits?")
-        print("1. Yes")
-        print("2. No")
+        self.io.print(f"\nPurchase {weapon.name} for {price:,} credits?")
+        self.io.print("1. Yes")
+        self.io.print("2. No")
         
         while True:
             try:
-                choice = int(input("\nEnter choice (1-2): "))
+                choice = int(self.io.input("\nEnter choice (1-2): "))
                 if choice == 1:
                     player.credits -= price
                     player.weapon = weapon
-                    print(f"\nYou purchased and equipped {weapon.name}!")
-                    wait_for_enter()
+                    self.io.print(f"\nYou purchased and equipped {weapon.name}!")
+                    self.io.wait_for_enter()
                     return True
                 elif choice == 2:
                     return False
             except ValueError:
                 pass
-            print("Invalid choice. Please enter 1 (yes) or 2 (no)")
+            self.io.print("Invalid choice. Please enter 1 (yes) or 2 (no)")
     
     def _handle_armor_purchase(self, player, armor, price):
         """Process armor purchase"""
         # Show comparison if player has armor
         if player.armor_item:
-            print(f"\nYour current armor: {player.armor_item}")
+            self.io.print(f"\nYour current armor: {player.armor_item}")
             if armor.defense > player.armor_item.defense:
-                print(f"This armor provides {armor.defense - player.armor_item.defense} more protection than your current one.")
+                self.io.print(f"This armor provides {armor.defense - player.armor_item.defense} more protection than your current one.")
             else:
-                print(f"This armor provides {player.armor_item.defense - armor.defense} less protection than your current one.")
+                self.io.print(f"This armor provides {player.armor_item.defense - armor.defense} less protection than your current one.")
         
         # Confirm purchase
-        print(f"\nPurchase {armor.name} for {price:,} credits?")
-        print("1. Yes")
-        print("2. No")
+        self.io.print(f"\nPurchase {armor.name} for {price:,} credits?")
+        self.io.print("1. Yes")
+        self.io.print("2. No")
         
         while True:
             try:
-                choice = int(input("\nEnter choice (1-2): "))
+                choice = int(self.io.input("\nEnter choice (1-2): "))
                 if choice == 1:
                     player.credits -= price
                     player.armor_item = armor
-                    print(f"\nYou purchased and equipped {armor.name}!")
+                    self.io.print(f"\nYou purchased and equipped {armor.name}!")
                     if hasattr(armor, 'is_illegal') and armor.is_illegal:
                         player.illegal_activity_today = True
-                    wait_for_enter()
+                    self.io.wait_for_enter()
                     return True
                 elif choice == 2:
                     return False
             except ValueError:
                 pass
-            print("Invalid choice. Please enter 1 (yes) or 2 (no)")
+            self.io.print("Invalid choice. Please enter 1 (yes) or 2 (no)")
     
     def _handle_item_purchase(self, player, item, price):
         """Process combat item purchase"""
@@ -261,24 +263,24 @@ class Shop:
         item_instance = item()
         
         # Confirm purchase
-        print(f"\nPurchase {item_instance.name} for {price:,} credits?")
-        print("1. Yes")
-        print("2. No")
+        self.io.print(f"\nPurchase {item_instance.name} for {price:,} credits?")
+        self.io.print("1. Yes")
+        self.io.print("2. No")
         
         while True:
             try:
-                choice = int(input("\nEnter choice (1-2): "))
+                choice = int(self.io.input("\nEnter choice (1-2): "))
                 if choice == 1:
                     player.credits -= price
                     player.add_item(item())  # Create a new instance of the item
-                    print(f"\nYou purchased {item_instance.name}!")
-                    wait_for_enter()
+                    self.io.print(f"\nYou purchased {item_instance.name}!")
+                    self.io.wait_for_enter()
                     return True
                 elif choice == 2:
                     return False
             except ValueError:
                 pass
-            print("Invalid choice. Please enter 1 (yes) or 2 (no)")
+            self.io.print("Invalid choice. Please enter 1 (yes) or 2 (no)")
     
     def _get_item_price(self, item):
         """Get the price of an item"""
@@ -286,12 +288,12 @@ class Shop:
             return item.price
         
         # Combat items have fixed prices
-        if hasattr(item, 'name'):
-            if item().name == "Medkit":
+        if hasattr(item, 'item_id'):
+            if item.item_id == "medkit":
                 return 200
-            elif item().name == "Shield":
+            elif item.item_id == "shield":
                 return 350
-            elif item().name == "Stun Grenade":
+            elif item.item_id == "grenade":
                 return 500
         
         # Default price
@@ -328,16 +330,16 @@ class Shop:
         if hasattr(weapon, 'is_illegal') and weapon.is_illegal:
             title += " [ILLEGAL]"
         
-        print(f"[{index}] {title}")
-        print(f"    Damage: {weapon.damage}  |  Price: {price:,} credits")
+        self.io.print(f"[{index}] {title}")
+        self.io.print(f"    Damage: {weapon.damage}  |  Price: {price:,} credits")
         
         # Show comparison with current weapon
         if player.weapon:
             damage_diff = weapon.damage - player.weapon.damage
             if damage_diff > 0:
-                print(f"    +{damage_diff} damage upgrade")
+                self.io.print(f"    +{damage_diff} damage upgrade")
             elif damage_diff < 0:
-                print(f"    {damage_diff} damage downgrade")
+                self.io.print(f"    {damage_diff} damage downgrade")
     
     def _display_armor(self, index, armor, player):
         """Display armor with clean formatting"""
@@ -348,36 +350,39 @@ class Shop:
         if hasattr(armor, 'is_illegal') and armor.is_illegal:
             title += " [ILLEGAL]"
             
-        print(f"[{index}] {title}")
-        print(f"    Defense: {armor.defense}  |  Price: {price:,} credits")
+        self.io.print(f"[{index}] {title}")
+        self.io.print(f"    Defense: {armor.defense}  |  Price: {price:,} credits")
         
         # Show comparison with current armor
         if player.armor_item:
             defense_diff = armor.defense - player.armor_item.defense
             if defense_diff > 0:
-                print(f"    +{defense_diff} defense upgrade")
+                self.io.print(f"    +{defense_diff} defense upgrade")
             elif defense_diff < 0:
-                print(f"    {defense_diff} defense downgrade")
+                self.io.print(f"    {defense_diff} defense downgrade")
     
     def _display_combat_item(self, index, item_func, player):
         """Display combat item with clean formatting"""
         item_instance = item_func()
         price = self._get_item_price(item_func)
         
-        print(f"[{index}] {item_instance.name}")
-        print(f"    {item_instance.description}")
-        print(f"    Price: {price:,} credits")
+        self.io.print(f"[{index}] {item_instance.name}")
+        self.io.print(f"    {item_instance.description}")
+        self.io.print(f"    Price: {price:,} credits")
         
         # Show current stock if player has any
         current_count = sum(1 for item in player.items if item.name == item_instance.name)
         if current_count > 0:
-            print(f"    You have: {current_count}x")
+            self.io.print(f"    You have: {current_count}x")
 
 class TradeHubShop(Shop):
-    """Legal shop available at trade hubs"""
-    def __init__(self):
-        super().__init__("Trade Hub Shop")
-        self.restock()
+    """Legal shop available at trade hubs (stocked by restock() unless given an inventory)"""
+    def __init__(self, io, rng, inventory=None):
+        super().__init__("Trade Hub Shop", io, rng)
+        if inventory is None:
+            self.restock()
+        else:
+            self.inventory = inventory
     
     def restock(self):
         """Restock the shop with legal items"""
@@ -389,51 +394,17 @@ class TradeHubShop(Shop):
         }
         
         # Add 2-4 legal weapons based on rarity
-        num_weapons = DiceRoller.d6() // 2 + 1  # 1-3 weapons
-        for _ in range(num_weapons):
-            weapon = get_random_weapon(include_illegal=False)
-            if weapon:
-                self.inventory['weapons'].append(weapon)
+        num_weapons = self.rng.loot.d6() // 2 + 1  # 1-3 weapons
+        self.inventory['weapons'].extend(get_random_weapon(include_illegal=False, rng=self.rng.loot, n=num_weapons))
                 
         # Add 1-2 legal armor pieces
-        num_armor = DiceRoller.d6() // 3 + 1  # 1-2 armor pieces
-        for _ in range(num_armor):
-            armor = get_random_armor(include_illegal=False)
-            if armor:
-                self.inventory['armor'].append(armor)
+        num_armor = self.rng.loot.d6() // 3 + 1  # 1-2 armor pieces
+        self.inventory['armor'].extend(get_random_armor(include_illegal=False, rng=self.rng.loot, n=num_armor))
     
     def shop_menu(self, game, hub_type=None):
         """Main shop menu for Trade Hub, with hub_type flavor."""
         player = game.player
 
-        # Expanded intro flavor by hub type
-        SHOP_INTROS = {
-            "slum": [
-                "A vendor behind a battered counter grunts: 'If you break it, you buy it.'",
-                "A tired merchant eyes you warily. 'No credit, no trouble.'",
-                "The shop smells of ozone and desperation. 'Looking for something cheap or just lost?'"
-            ],
-            "corp": [
-                "A holographic clerk beams: 'Welcome, valued customer. All transactions are monitored.'",
-                "A synthetic voice chimes: 'Your satisfaction is our highest priority. Please spend generously.'",
-                "A pristine counter gleams. 'May I interest you in our premium loyalty program?'"
-            ],
-            "cartel": [
-                "A sharp-eyed merchant mutters: 'Ask for what you want. Don't waste my time.'",
-                "A tattooed vendor leans in. 'If you can't pay, you can leave.'",
-                "A heavyset dealer grins. 'We got what you need—if you got the credits.'"
-            ],
-            "ghost": [
-                "A flickering terminal displays: 'State your request. No refunds.'",
-                "The shop is empty, save for a humming console. 'Inventory... limited.'",
-                "A chill hangs in the air. 'Welcome. Or what's left of it.'"
-            ],
-            "blacksite": [
-                "A masked military officer says flatly: 'State your request. Efficiency is expected.'",
-                "A cold voice echoes: 'Transactions are logged. Do not linger.'",
-                "A security drone hovers nearby. 'Authorized personnel only.'"
-            ],
-        }
         SHOP_BANTER = {
             "slum": [
                 "You want a receipt? I can write one on scrap paper.",
@@ -462,130 +433,131 @@ class TradeHubShop(Shop):
                 "Transaction complete. Move along."
             ],
         }
-        if hub_type in SHOP_INTROS:
-            print(f"\n{random.choice(SHOP_INTROS[hub_type])}")
+        intro = f"shop.intro.{hub_type}"
+        if narrative.has(intro):
+            self.io.print(f"\n{self.rng.flavor.choice(narrative.lines(intro))}")
         else:
-            print("\nThe shopkeeper eyes you as you enter.")
+            self.io.print("\nThe shopkeeper eyes you as you enter.")
 
         while True:
-            print(f"\n=== {self.name} ===")
-            print(f"Your Credits: {player.credits:,}")
-            print("\nWhat would you like to do?")
-            print("1. Browse Weapons")
-            print("2. Browse Armor")
-            print("3. Browse Items")
-            print("4. Sell Goods")
-            print("\n0. Go back")
+            self.io.print(f"\n=== {self.name} ===")
+            self.io.print(f"Your Credits: {player.credits:,}")
+            self.io.print("\nWhat would you like to do?")
+            self.io.print("1. Browse Weapons")
+            self.io.print("2. Browse Armor")
+            self.io.print("3. Browse Items")
+            self.io.print("4. Sell Goods")
+            self.io.print("\n0. Go back")
             try:
-                choice = int(input("\nEnter your choice (1-4): "))
+                choice = int(self.io.input("\nEnter your choice (1-4): "))
                 if choice == 1:  # Weapons
                     self.display_inventory('weapons', player)
-                    weapon_choice = input("\nSelect weapon to buy: ")
+                    weapon_choice = self.io.input("\nSelect weapon to buy: ")
                     self.handle_purchase('weapons', player, weapon_choice)
                     # Occasional banter
-                    if hub_type in SHOP_BANTER and random.random() < 0.33:
-                        print(random.choice(SHOP_BANTER[hub_type]))
+                    if hub_type in SHOP_BANTER and self.rng.flavor.random() < 0.33:
+                        self.io.print(self.rng.flavor.choice(SHOP_BANTER[hub_type]))
                 elif choice == 2:  # Armor
                     self.display_inventory('armor', player)
-                    armor_choice = input("\nSelect armor to buy: ")
+                    armor_choice = self.io.input("\nSelect armor to buy: ")
                     self.handle_purchase('armor', player, armor_choice)
-                    if hub_type in SHOP_BANTER and random.random() < 0.33:
-                        print(random.choice(SHOP_BANTER[hub_type]))
+                    if hub_type in SHOP_BANTER and self.rng.flavor.random() < 0.33:
+                        self.io.print(self.rng.flavor.choice(SHOP_BANTER[hub_type]))
                 elif choice == 3:  # Items
                     self.display_inventory('items', player)
-                    item_choice = input("\nSelect item to buy: ")
+                    item_choice = self.io.input("\nSelect item to buy: ")
                     self.handle_purchase('items', player, item_choice)
-                    if hub_type in SHOP_BANTER and random.random() < 0.33:
-                        print(random.choice(SHOP_BANTER[hub_type]))
+                    if hub_type in SHOP_BANTER and self.rng.flavor.random() < 0.33:
+                        self.io.print(self.rng.flavor.choice(SHOP_BANTER[hub_type]))
                 elif choice == 4:  # Sell Items
                     self._sell_items(player, game)
                 elif choice == 0:  # Leave
-                    print("\nYou go back to the Trade Hub...")
-                    wait_for_enter()
+                    self.io.print("\nYou go back to the Trade Hub...")
+                    self.io.wait_for_enter()
                     return
             except ValueError:
-                print("Invalid choice. Please enter 1-4.")
-                wait_for_enter()
+                self.io.print("Invalid choice. Please enter 1-4.")
+                self.io.wait_for_enter()
 
     def _sell_items(self, player, game):
         """Sell contraband items from player's inventory"""
         if not player.inventory:
-            print("\nYou don't have any items to sell.")
-            wait_for_enter()
+            self.io.print("\nYou don't have any items to sell.")
+            self.io.wait_for_enter()
             return
             
-        print("\n=== SELL GOODS ===")
+        self.io.print("\n=== SELL GOODS ===")
         # Warn about selling stolen goods at legal shops
         # INSERT_YOUR_CODE
         # Add some flavor text and make the warning come from NOVA
-        print("\nYou approach the counter, goods in hand. The clerk eyes you with a practiced indifference.")
-        wait_for_enter()
-        if random.random() < 0.5:
-            print("A nearby security drone swivels its camera in your direction, its lens glinting coldly.")
-            wait_for_enter()
-        print("[NOVA] 'Just a heads up: selling stolen or illegal goods at a legal trade hub is a great way to end up in a holding cell.'")
-        wait_for_enter()
+        self.io.print("\nYou approach the counter, goods in hand. The clerk eyes you with a practiced indifference.")
+        self.io.wait_for_enter()
+        if self.rng.flavor.random() < 0.5:
+            self.io.print("A nearby security drone swivels its camera in your direction, its lens glinting coldly.")
+            self.io.wait_for_enter()
+        self.io.print("[NOVA] 'Just a heads up: selling stolen or illegal goods at a legal trade hub is a great way to end up in a holding cell.'")
+        self.io.wait_for_enter()
 
 
-        print("Available items:")
+        self.io.print("Available items:")
         
         # Loop through all items in inventory
         for item in player.inventory[:]:  # Create a copy of list to allow removal during iteration
             base_value = item['value']
             
             # Generate random offer between 60% and 120% of value
-            offer_multiplier = random.uniform(0.6, 1.2)
+            offer_multiplier = self.rng.loot.uniform(0.6, 1.2)
             offer = int(base_value * offer_multiplier)
             
-            print(f"\n{item['name']}")
-            print(f"Base value: {base_value:,} credits")
-            print(f"The seller offers you: {offer:,} credits")
+            self.io.print(f"\n{item['name']}")
+            self.io.print(f"Base value: {base_value:,} credits")
+            self.io.print(f"The seller offers you: {offer:,} credits")
             
-            print("\nAccept their offer?")
-            print("1. Yes")
-            print("2. No")
-            print("\n0. Stop selling")
+            self.io.print("\nAccept their offer?")
+            self.io.print("1. Yes")
+            self.io.print("2. No")
+            self.io.print("\n0. Stop selling")
             
             try:
-                choice = input("\nEnter choice (1-3): ")
+                choice = self.io.input("\nEnter choice (1-3): ")
                 
                 if choice == "0":
-                    print("\nStopping sales...")
-                    wait_for_enter()
+                    self.io.print("\nStopping sales...")
+                    self.io.wait_for_enter()
                     return
                     
                 if choice == "1":
-                    if DiceRoller.chance(0.5):
-                        print("\nThe seller confiscated the item and called in the cops!")
+                    if self.rng.encounters.chance(0.5):
+                        self.io.print("\nThe seller confiscated the item and called in the cops!")
                         player.inventory.remove(item)
                         player.illegal_activity_today = True
                         police_result = PoliceEncounter(game).run()
                         if police_result == "game_over":
-                            print("Game Over!")
-                            print(f"You survived {game.days_survived} days.")
-                            quit()
+                            self.io.print("Game Over!")
+                            self.io.print(f"You survived {game.day} days.")
+                            raise GameEnded(game.end_game("DEATH", "Police raid"))
                         else:
-                            print("\nYou escaped the police and returned to the trade hub.")
-                            wait_for_enter()
+                            self.io.print("\nYou escaped the police and returned to the trade hub.")
+                            self.io.wait_for_enter()
                             break
                     else:
-                        print(f"\nSold {item['name']} for {offer:,} credits!")
-                        wait_for_enter()
+                        self.io.print(f"\nSold {item['name']} for {offer:,} credits!")
+                        self.io.wait_for_enter()
                         player.inventory.remove(item)
                         player.credits += offer
-                    wait_for_enter()
+                    self.io.wait_for_enter()
                 elif choice == "2":
-                    print("\nOffer declined.")
-                    wait_for_enter()
+                    self.io.print("\nOffer declined.")
+                    self.io.wait_for_enter()
             except ValueError:
-                print("\nInvalid choice.")
-                wait_for_enter()
+                self.io.print("\nInvalid choice.")
+                self.io.wait_for_enter()
                 continue
 
 class BlackMarketShop(Shop):
     """Illegal shop with better items but higher prices and heat risk"""
-    def __init__(self):
-        super().__init__("Black Market")
+    def __init__(self, io, rng):
+        super().__init__("Black Market", io, rng)
         self.restock()
     
     def restock(self):
@@ -598,25 +570,25 @@ class BlackMarketShop(Shop):
         }
         
         # Add 3-5 weapons with preference for illegal ones
-        num_weapons = DiceRoller.d6() // 2 + 2  # 2-4 weapons
-        for _ in range(num_weapons):
+        num_weapons = self.rng.loot.d6() // 2 + 2  # 2-4 weapons
+        for illegal in self.rng.loot.chance(0.8, num_weapons):
             # 80% chance of illegal weapons
-            if DiceRoller.chance(0.8):
-                weapon = get_random_weapon(include_illegal=True, min_rarity=UNCOMMON)
+            if illegal:
+                weapon = get_random_weapon(include_illegal=True, min_rarity=UNCOMMON, rng=self.rng.loot)
             else:
-                weapon = get_random_weapon(include_illegal=False, min_rarity=RARE)
+                weapon = get_random_weapon(include_illegal=False, min_rarity=RARE, rng=self.rng.loot)
                 
             if weapon and weapon not in self.inventory['weapons']:
                 self.inventory['weapons'].append(weapon)
                 
         # Add 2-3 armor pieces with preference for illegal ones
-        num_armor = DiceRoller.d6() // 2 + 1  # 1-3 armor pieces
-        for _ in range(num_armor):
+        num_armor = self.rng.loot.d6() // 2 + 1  # 1-3 armor pieces
+        for illegal in self.rng.loot.chance(0.8, num_armor):
             # 80% chance of illegal armor
-            if DiceRoller.chance(0.8):
-                armor = get_random_armor(include_illegal=True, min_rarity=UNCOMMON)
+            if illegal:
+                armor = get_random_armor(include_illegal=True, min_rarity=UNCOMMON, rng=self.rng.loot)
             else:
-                armor = get_random_armor(include_illegal=False, min_rarity=RARE)
+                armor = get_random_armor(include_illegal=False, min_rarity=RARE, rng=self.rng.loot)
                 
             if armor and armor not in self.inventory['armor']:
                 self.inventory['armor'].append(armor)
@@ -642,28 +614,28 @@ class BlackMarketShop(Shop):
         player.illegal_activity_today = True
         
         # Generate atmospheric details
-        market_type, market_visual, market_sound, market_mood, dealer_personalities, nova_commentary = generate_black_market_atmosphere()
+        market_type, market_visual, market_sound, market_mood, dealer_personalities, nova_commentary = generate_black_market_atmosphere(self.rng.flavor)
         
         # Entry atmosphere
-        print(f"\nYou descend into the {market_type.replace('_', ' ')}...")
-        wait_for_enter()
+        self.io.print(f"\nYou descend into the {market_type.replace('_', ' ')}...")
+        self.io.wait_for_enter()
         
         # Random atmospheric details
-        if random.random() < 0.7:
-            print(random.choice(market_visual[market_type]))
-        if random.random() < 0.5:
-            print(random.choice(market_sound[market_type]))
-        if random.random() < 0.5:
-            print(random.choice(market_mood[market_type]))
+        if self.rng.flavor.random() < 0.7:
+            self.io.print(self.rng.flavor.choice(market_visual[market_type]))
+        if self.rng.flavor.random() < 0.5:
+            self.io.print(self.rng.flavor.choice(market_sound[market_type]))
+        if self.rng.flavor.random() < 0.5:
+            self.io.print(self.rng.flavor.choice(market_mood[market_type]))
                 
         # Dealer introduction
-        print(random.choice(dealer_personalities[market_type]))
-        wait_for_enter()
+        self.io.print(self.rng.flavor.choice(dealer_personalities[market_type]))
+        self.io.wait_for_enter()
         
         # NOVA commentary
-        if random.random() < 0.6:
-            print(random.choice(nova_commentary[market_type]))
-            wait_for_enter()
+        if self.rng.flavor.random() < 0.6:
+            self.io.print(self.rng.flavor.choice(nova_commentary[market_type]))
+            self.io.wait_for_enter()
         
         # Shop banter by market type
         shop_banter = {
@@ -690,43 +662,43 @@ class BlackMarketShop(Shop):
         }
 
         while True:
-            print(f"\n=== {self.name} ===")
-            print(f"Your Credits: {player.credits:,}")
-            print("\nWhat would you to do?")
-            print("1. Browse Weapons")
-            print("2. Browse Armor")
-            print("3. Browse Items")
-            print("4. Sell Goods")
-            print("5. Open Sealed Crates")
-            print("\n0. Leave Black Market")
+            self.io.print(f"\n=== {self.name} ===")
+            self.io.print(f"Your Credits: {player.credits:,}")
+            self.io.print("\nWhat would you to do?")
+            self.io.print("1. Browse Weapons")
+            self.io.print("2. Browse Armor")
+            self.io.print("3. Browse Items")
+            self.io.print("4. Sell Goods")
+            self.io.print("5. Open Sealed Crates")
+            self.io.print("\n0. Leave Black Market")
             
             try:
-                choice = int(input("\nEnter your choice (1-5): "))
+                choice = int(self.io.input("\nEnter your choice (1-5): "))
                 
                 if choice == 1:  # Weapons
                     self.display_inventory('weapons', player)
-                    weapon_choice = input("\nSelect weapon to buy: ")
+                    weapon_choice = self.io.input("\nSelect weapon to buy: ")
                     if self.handle_purchase('weapons', player, weapon_choice):
                         # Occasional dealer banter
-                        if random.random() < 0.4:
-                            print(f"\n{random.choice(shop_banter[market_type])}")
-                            wait_for_enter()
+                        if self.rng.flavor.random() < 0.4:
+                            self.io.print(f"\n{self.rng.flavor.choice(shop_banter[market_type])}")
+                            self.io.wait_for_enter()
                     
                 elif choice == 2:  # Armor
                     self.display_inventory('armor', player)
-                    armor_choice = input("\nSelect armor to buy: ")
+                    armor_choice = self.io.input("\nSelect armor to buy: ")
                     if self.handle_purchase('armor', player, armor_choice):
-                        if random.random() < 0.4:
-                            print(f"\n{random.choice(shop_banter[market_type])}")
-                            wait_for_enter()
+                        if self.rng.flavor.random() < 0.4:
+                            self.io.print(f"\n{self.rng.flavor.choice(shop_banter[market_type])}")
+                            self.io.wait_for_enter()
                     
                 elif choice == 3:  # Items
                     self.display_inventory('items', player)
-                    item_choice = input("\nSelect item to buy: ")
+                    item_choice = self.io.input("\nSelect item to buy: ")
                     if self.handle_purchase('items', player, item_choice):
-                        if random.random() < 0.4:
-                            print(f"\n{random.choice(shop_banter[market_type])}")
-                            wait_for_enter()
+                        if self.rng.flavor.random() < 0.4:
+                            self.io.print(f"\n{self.rng.flavor.choice(shop_banter[market_type])}")
+                            self.io.wait_for_enter()
                     
                 elif choice == 4:  # Sell Items
                     self._sell_items(player, market_type)
@@ -742,19 +714,19 @@ class BlackMarketShop(Shop):
                         "pirate_outpost": "You walk past the trophy wall, feeling eyes on your back...",
                         "shadow_bazaar": "The darkness seems to follow you as you leave..."
                     }
-                    print(f"\n{exit_messages[market_type]}")
-                    wait_for_enter()
+                    self.io.print(f"\n{exit_messages[market_type]}")
+                    self.io.wait_for_enter()
                     return
                     
             except ValueError:
-                print("Invalid choice. Please enter 1-5.")
-                wait_for_enter()
+                self.io.print("Invalid choice. Please enter 1-5.")
+                self.io.wait_for_enter()
     
     def _crack_sealed_crates(self, player, game, market_type):
         """Open sealed crates if player has a contract with them"""
         if not player.current_contract:
-            print("\nYou don't have any crates to open.")
-            wait_for_enter()
+            self.io.print("\nYou don't have any crates to open.")
+            self.io.wait_for_enter()
             return
             
         # Check for sealed crates
@@ -764,8 +736,8 @@ class BlackMarketShop(Shop):
         ]
         
         if not sealed_crates:
-            print("\nYou don't have any sealed crates to open.")
-            wait_for_enter()
+            self.io.print("\nYou don't have any sealed crates to open.")
+            self.io.wait_for_enter()
             return
         
         # Themed approach based on market type
@@ -776,24 +748,24 @@ class BlackMarketShop(Shop):
             "shadow_bazaar": "A silent figure in dark robes produces mysterious scanning equipment..."
         }
         
-        print(f"\n{crate_opening_intro[market_type]}")
-        wait_for_enter()
-        print("\"I can crack these open for you:\"")
+        self.io.print(f"\n{crate_opening_intro[market_type]}")
+        self.io.wait_for_enter()
+        self.io.print("\"I can crack these open for you:\"")
         
-        cost = DiceRoller.d6() * 500
+        cost = self.rng.loot.d6() * 500
         for idx, (crate_idx, crate) in enumerate(sealed_crates, 1):
-            print(f"{idx}. Sealed Crate #{crate_idx + 1} - {cost:,} credits")
-        print("\n0. Cancel")
+            self.io.print(f"{idx}. Sealed Crate #{crate_idx + 1} - {cost:,} credits")
+        self.io.print("\n0. Cancel")
         
         try:
-            choice = int(input("\nWhich crate do you want to open? "))
+            choice = int(self.io.input("\nWhich crate do you want to open? "))
             if 1 <= choice <= len(sealed_crates):
                 crate_idx, crate = sealed_crates[choice - 1]
                 
                 # Check if player can afford it
                 if player.credits < cost:
-                    print("\nYou don't have enough credits.")
-                    wait_for_enter()
+                    self.io.print("\nYou don't have enough credits.")
+                    self.io.wait_for_enter()
                     return
                     
                 player.credits -= cost
@@ -808,27 +780,27 @@ class BlackMarketShop(Shop):
                     "shadow_bazaar": "Strange energy patterns dance across the crate before it opens silently..."
                 }
                 
-                print(f"\n{opening_process[market_type]}")
-                wait_for_enter()
+                self.io.print(f"\n{opening_process[market_type]}")
+                self.io.wait_for_enter()
                 
                 # Open the crate
                 contents, value = crate.open(player.current_contract, game)
                 
                 if crate.is_stone:
-                    print(f"\n⚠ IT'S AN INFINITY STONE! ⚠")
-                    player.stones_discovered.append(crate.stone_type)
-                    wait_for_enter()
+                    self.io.print(f"\n⚠ IT'S AN INFINITY STONE! ⚠")
+                    player.discover_stone(crate.stone_type, "crate opened")
+                    self.io.wait_for_enter()
 
-                print(f"\nThe crate contains: {contents}")
+                self.io.print(f"\nThe crate contains: {contents}")
 
-                print("\nWhat do you want to do?")
-                print("1. Continue with contract delivery")
-                print("2. Steal the items")
+                self.io.print("\nWhat do you want to do?")
+                self.io.print("1. Continue with contract delivery")
+                self.io.print("2. Steal the items")
                 
                 try:
-                    sell_choice = int(input("\nEnter choice (1-2): "))
+                    sell_choice = int(self.io.input("\nEnter choice (1-2): "))
                     if sell_choice == 1:
-                        print("\nYou decide to stick with the contract.")
+                        self.io.print("\nYou decide to stick with the contract.")
                     elif sell_choice == 2:
                         # Store contract reference before clearing it
                         contract = player.current_contract
@@ -836,25 +808,25 @@ class BlackMarketShop(Shop):
                         # Add to player inventory and remove from contract
                         for crate in contract.crates:
                             if crate.is_stone:
-                                player.stones.append(crate.stone_type)
-                                print(f"\nThe {crate.stone_type} Stone pulses with energy as you pocket it...")
-                                wait_for_enter()
+                                player.take_stone(crate.stone_type, "theft")
+                                self.io.print(f"\nThe {crate.stone_type} Stone pulses with energy as you pocket it...")
+                                self.io.wait_for_enter()
                             else:
                                 player.inventory.append({
-                                    'name': crate.contents,
+                                    'name': crate.contents or f"Unopened {crate.tier.title()} Crate",
                                     'value': crate.value,
                                     'is_contraband': crate.tier in ['illicit', 'sealed']
                                 })
-                                print(f"\nAdded to inventory: {crate.contents}")
-                                wait_for_enter()
+                                self.io.print(f"\nAdded to inventory: {crate.contents}")
+                                self.io.wait_for_enter()
                         
                         # Now clear the contract
                         player.current_contract = None
                         
-                        print("\nThe cartel won't be happy about this...")
+                        self.io.print("\nThe cartel won't be happy about this...")
                         # 50% chance of immediate cartel encounter
                         player.cartel_threat_level += 1  # Increase threat either way
-                        if DiceRoller.chance(0.5):
+                        if self.rng.encounters.chance(0.5):
                             cartel = CartelEncounter(game)
                             result = cartel.run()
                             
@@ -862,8 +834,8 @@ class BlackMarketShop(Shop):
                                 return "game_over"
                         
                 except ValueError:
-                    print("\nInvalid choice.")
-                wait_for_enter()
+                    self.io.print("\nInvalid choice.")
+                self.io.wait_for_enter()
         except ValueError:
             pass
     
@@ -871,8 +843,8 @@ class BlackMarketShop(Shop):
         """Sell contraband items from player's inventory"""
         
         if not player.inventory:
-            print("\nYou don't have any items to sell.")
-            wait_for_enter()
+            self.io.print("\nYou don't have any items to sell.")
+            self.io.wait_for_enter()
             return
         
         # Themed selling introduction
@@ -883,11 +855,11 @@ class BlackMarketShop(Shop):
             "shadow_bazaar": "A robed figure appraises your items with unseen eyes..."
         }
         
-        print(f"\n{selling_intro[market_type]}")
-        wait_for_enter()
+        self.io.print(f"\n{selling_intro[market_type]}")
+        self.io.wait_for_enter()
         
-        print("\n=== SELL ITEMS ===")
-        print("Available items:")
+        self.io.print("\n=== SELL ITEMS ===")
+        self.io.print("Available items:")
         
         # Loop through all items in inventory
         for item in player.inventory[:]:  # Create a copy of list to allow removal during iteration
@@ -896,22 +868,22 @@ class BlackMarketShop(Shop):
             # Generate random offer between 60% and 120% of value
             # Increase multiplier for contraband items
             if 'contraband' in item.get('tags', []):
-                offer_multiplier = random.uniform(1.2, 1.8)  # 120-180% for contraband
+                offer_multiplier = self.rng.loot.uniform(1.2, 1.8)  # 120-180% for contraband
             else:
-                offer_multiplier = random.uniform(0.6, 1.2)  # 60-120% for normal items 
+                offer_multiplier = self.rng.loot.uniform(0.6, 1.2)  # 60-120% for normal items 
             offer = int(base_value * offer_multiplier)
             
-            print(f"\n{item['name']}")
-            print(f"Base value: {base_value:,} credits")
-            print(f"Seller offers: {offer:,} credits")
+            self.io.print(f"\n{item['name']}")
+            self.io.print(f"Base value: {base_value:,} credits")
+            self.io.print(f"Seller offers: {offer:,} credits")
             
-            print("\nAccept offer?")
-            print("1. Yes")
-            print("2. No")
-            print("\n0. Stop selling")
+            self.io.print("\nAccept offer?")
+            self.io.print("1. Yes")
+            self.io.print("2. No")
+            self.io.print("\n0. Stop selling")
             
             try:
-                choice = input("\nEnter choice (1-2, 0 to stop): ")
+                choice = self.io.input("\nEnter choice (1-2, 0 to stop): ")
                 
                 if choice == "0":
                     # Themed stop selling message
@@ -921,8 +893,8 @@ class BlackMarketShop(Shop):
                         "pirate_outpost": "You gather your remaining items and nod to the fence...",
                         "shadow_bazaar": "You withdraw your goods into the shadows..."
                     }
-                    print(f"\n{stop_messages[market_type]}")
-                    wait_for_enter()
+                    self.io.print(f"\n{stop_messages[market_type]}")
+                    self.io.wait_for_enter()
                     return
                     
                 if choice == "1":
@@ -936,13 +908,13 @@ class BlackMarketShop(Shop):
                     
                     player.inventory.remove(item)
                     player.credits += offer
-                    print(f"\n{transaction_messages[market_type]}")
-                    print(f"Sold {item['name']} for {offer:,} credits!")
-                    wait_for_enter()
+                    self.io.print(f"\n{transaction_messages[market_type]}")
+                    self.io.print(f"Sold {item['name']} for {offer:,} credits!")
+                    self.io.wait_for_enter()
                 elif choice == "2":
-                    print("\nOffer declined.")
-                    wait_for_enter()
+                    self.io.print("\nOffer declined.")
+                    self.io.wait_for_enter()
             except ValueError:
-                print("\nInvalid choice.")
-                wait_for_enter()
+                self.io.print("\nInvalid choice.")
+                self.io.wait_for_enter()
                 continue
\ No newline at end of file
@@ -0,0 +1,277 @@
+import re
+import random
+import time
+
+from game_io import ScriptedIO, ScriptExhausted
+
+OPTION_PATTERN = re.compile(r"^\s*\[?(\d+)[\].]\s", re.MULTILINE)
+RANGE_PATTERN = re.compile(r"\((\d+)-(\d+)\)")
+
+class RandomPolicy:
+    """Automated decision policy that answers every prompt with a random legal option.
+
+    Options are read from the menu lines printed since the previous prompt
+    ("1. Travel", "[2] Railgun ..."); prompts that only give a range such as
+    "(0-8)" get a random number in that range. When a prompt is re-asked
+    without the menu being reprinted (e.g. after an invalid pick), the last
+    menu seen is reused.
+    """
+    def __init__(self, seed=None, max_days=365):
+        self.rng = random.Random(seed)
+        self.max_days = max_days
+        self.game = None
+        self.heat_by_day = []
+        self.last_options = ["1"]
+
+    def attach(self, game):
+        """Let the policy observe the game it is playing"""
+        self.game = game
+
+    def __call__(self, prompt, recent_output):
+        if self.game is not None:
+            # Sample the heat curve once per day
+            while len(self.heat_by_day) <= self.game.day:
+                self.heat_by_day.append(self.game.player.heat)
+            if self.game.day > self.max_days:
+                raise ScriptExhausted(f"Game ran past {self.max_days} days")
+
+        if "name" in prompt.lower():
+            return "Sim"
+        return self.choose(prompt, recent_output)
+
+    def choose(self, prompt, recent_output):
+        """A random option from the menu just printed"""
+        options = OPTION_PATTERN.findall("\n".join(recent_output))  # One pass over the whole screen
+        if options:
+            self.last_options = options
+            return self.rng.choice(options)
+
+        match = RANGE_PATTERN.search(prompt)
+        if match:
+            return str(self.rng.randint(int(match.group(1)), int(match.group(2))))
+        return self.rng.choice(self.last_options)
+
+class SensiblePolicy(RandomPolicy):
+    """A minimally competent pilot, for balance runs; random wherever it has no plan.
+
+    It keeps the tank topped up at every hub, takes the best paying contract
+    it has the fuel and time for and delivers it, lays low when the heat
+    gets high, flies as far towards the destination as the fuel allows,
+    lands at planets when it needs a hub, buys and uses medkits, and fights
+    unless nearly dead. It never travels on an empty tank while a contract
+    is pending. Shops and the rest are left to chance.
+    """
+
+    HIGH_HEAT = 60
+    SLACK = 2  # Days and fuel kept spare for detours
+
+    def __init__(self, seed=None, max_days=365):
+        super().__init__(seed, max_days)
+        self.hub_done = set()  # Hub menu options already used this visit
+        self.hub_visit = None  # Each visit deals a new contract list
+
+    def choose(self, prompt, recent_output):
+        game = self.game
+        if game is None:
+            return super().choose(prompt, recent_output)
+        if prompt.startswith("\nEnter your choice (1-4) or 0 to leave"):
+            return self._hub(game)
+        if prompt.startswith("\nHow many units would you like to buy"):
+            return RANGE_PATTERN.search(prompt).group(2)  # As much as the tank and wallet allow
+        if prompt.startswith("\nSelect contract"):
+            return self._contract(game)
+        if prompt == "\nEnter choice: " and recent_output and recent_output[-1] == "How many sectors do you want to travel?":
+            return self._sectors(game)
+        if prompt == "\nEnter choice (1-3): " and "1. Attack" in recent_output:
+            player = game.player
+            if self._medkit(game) and player.hp * 5 < player.max_hp * 2:
+                return "2"
+            return "3" if player.hp < player.max_hp // 4 else "1"  # Fight, unless nearly dead
+        if prompt in ("\nChoose item:", "\nChoose item to use"):
+            return self._medkit(game) or "0"
+        if prompt == "\nEnter your choice (1-4): " and "3. Browse Items" in recent_output:
+            if self._needs_medkit(game) and "medkit" not in self.hub_done:
+                self.hub_done.add("medkit")
+                return "3"
+            return "0"
+        if prompt == "\nSelect item to buy: ":
+            for line in recent_output:
+                if line.endswith("] Medkit"):
+                    return line[1:line.index("]")]
+            return "0"
+        if prompt == "\nEnter choice (1-2): " and any(line.startswith("\nPurchase Medkit") for line in recent_output):
+            return "1"
+        if prompt == "\nEnter your choice (1-2): " and "1. Complete delivery" in recent_output:
+            return "1"
+        if not prompt and "1. Travel" in recent_output:
+            return self._daily(game)
+        if "2. Go through" in recent_output:
+            # Asteroids hit for up to 50; going around costs up to 3 fuel and a day's progress
+            return "1" if game.player.hp <= 50 and game.ship.fuel > 3 else "2"
+        if "Would you like to land?" in recent_output:
+            # Landing is the only way to a hub (and fuel) without a delivery to
+            # make, but costs a day's progress on one
+            contract = game.player.current_contract
+            return "1" if contract is None or game.ship.fuel < self._days(game, contract) else "2"
+        return super().choose(prompt, recent_output)
+
+    def _daily(self, game):
+        if game.ship.fuel < 1:
+            # Anything but laying low strands you. Only a hub sells fuel, so
+            # once there's no contract left to wait out, waiting can't help
+            # and the game may as well say so.
+            return "2" if game.player.current_contract else "1"
+        if game.player.hp * 2 < game.player.max_hp and self._medkit(game):
+            return "3"  # Doesn't end the day
+        contract = game.player.current_contract
+        spare_days = contract.deadline - self._days(game, contract) if contract else self.SLACK
+        if game.player.heat >= self.HIGH_HEAT and spare_days >= self.SLACK and self.rng.random() < 0.5:
+            return "2"
+        return "1"
+
+    def _medkit(self, game):
+        """Menu number of the player's first medkit, or None"""
+        for i, item in enumerate(game.player.items, 1):
+            if item.item_id == "medkit":
+                return str(i)
+        return None
+
+    def _needs_medkit(self, game):
+        player = game.player
+        return player.hp * 5 < player.max_hp * 3 and not self._medkit(game) and player.credits >= 400
+
+    def _days(self, game, contract):
+        """Days of travel left to deliver a contract"""
+        return -(-(contract.distance - contract.sectors_traveled) // game.ship.speed)
+
+    def _hub(self, game):
+        ship, player = game.ship, game.player
+        if self.hub_visit is not game.current_hub.available_contracts:
+            self.hub_visit = game.current_hub.available_contracts
+            self.hub_done = set()
+        if "2" not in self.hub_done and ship.fuel < ship.max_fuel and player.credits >= game.current_hub.fuel_price:
+            choice = "2"
+        elif "1" not in self.hub_done and player.current_contract is None:
+            choice = "1"
+        elif "3" not in self.hub_done and self._needs_medkit(game):
+            choice = "3"
+        else:
+            return "0"
+        self.hub_done.add(choice)
+        return choice
+
+    def _contract(self, game):
+        ship, player = game.ship, game.player
+        best, best_score = "0", 0
+        for i, contract in enumerate(game.current_hub.available_contracts, 1):
+            days = self._days(game, contract)
+            if days + self.SLACK > contract.deadline or days * max(1, round(ship.speed / 2)) + self.SLACK > ship.fuel:
+                continue  # Can't make it, allowing for a detour
+            if player.heat + contract.calculate_heat_risk() >= 100:
+                continue
+            score = contract.reward / days
+            if score > best_score:
+                best, best_score = str(i), score
+        return best
+
+    def _sectors(self, game):
+        sectors = game.ship.speed
+        contract = game.player.current_contract
+        if contract is not None:
+            sectors = min(sectors, max(1, contract.distance - contract.sectors_traveled))
+        while sectors > 1 and max(1, round(sectors / 2)) > game.ship.fuel:
+            sectors -= 1
+        return str(sectors)
+
+POLICIES = {"sensible": SensiblePolicy, "random": RandomPolicy}
+
+def run_single(seed, max_days=365, max_inputs=20000, policy="sensible"):
+    """Play one complete game headlessly and return a summary dict
+
+    Args:
+        policy: Name of the policy in POLICIES that plays it
+    """
+    from game import Game
+
+    policy = POLICIES[policy](seed, max_days)
+    io = ScriptedIO(policy=policy, max_inputs=max_inputs)
+    game = Game(io, seed=seed)
+    policy.attach(game)
+
+    try:
+        result = game.play()
+        ending, cause = result.ending, result.cause_of_death
+    except ScriptExhausted:
+        ending, cause = "TIMEOUT", None
+
+    return {
+        "seed": seed,
+        "ending": ending,
+        "cause": cause,
+        "days": game.day,
+        "credits": game.player.credits,
+        "heat": policy.heat_by_day,
+    }
+
+def run_batch(n, workers=1, seed=0, max_days=365, policy="sensible"):
+    """Play n games spread across a process pool and return their summaries"""
+    seeds = range(seed, seed + n)
+    if workers <= 1:
+        return [run_single(s, max_days, policy=policy) for s in seeds]
+
+    from multiprocessing import Pool  # Costs more to import than a short serial batch takes
+
+    chunksize = max(1, n // (workers * 8))
+    with Pool(workers) as pool:
+        return list(pool.starmap(run_single, [(s, max_days, 20000, policy) for s in seeds], chunksize))
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+def format_report(results, elapsed):
+    """Build a text report of ending frequencies, days, credits and heat"""
+    n = len(results)
+    lines = []
+    lines.append(f"=== Simulation: {n:,} games in {elapsed:.2f}s ({n / max(elapsed, 1e-9):,.0f} games/s) ===")
+
+    lines.append("\nEndings:")
+    counts = {}
+    for result in results:
+        counts[result["ending"]] = counts.get(result["ending"], 0) + 1
+    for ending, count in sorted(counts.items(), key=lambda item: -item[1]):
+        lines.append(f"  {ending:<12} {count:>8,}  {100 * count / n:6.2f}%")
+
+    causes = {}
+    for result in results:
+        if result["cause"]:
+            causes[result["cause"]] = causes.get(result["cause"], 0) + 1
+    if causes:
+        lines.append("\nCauses of death:")
+        for cause, count in sorted(causes.items(), key=lambda item: -item[1])[:10]:
+            lines.append(f"  {cause:<32} {count:>8,}")
+
+    for label, key in (("Days survived", "days"), ("Final credits", "credits")):
+        values = sorted(result[key] for result in results)
+        lines.append(f"\n{label}:")
+        lines.append(f"  mean {sum(values) / n:,.1f}  median {_percentile(values, 0.5):,}  "
+                     f"p90 {_percentile(values, 0.9):,}  max {values[-1]:,}")
+
+    lines.append("\nMean heat by day (games still running):")
+    longest = max(len(result["heat"]) for result in results)
+    step = max(1, longest // 10)
+    for day in range(0, longest, step):
+        samples = [result["heat"][day] for result in results if len(result["heat"]) > day]
+        lines.append(f"  day {day:>4}: {sum(samples) / len(samples):6.1f}  ({len(samples):,} games)")
+
+    return "\n".join(lines)
+
+def simulate(n, workers=1, seed=0, max_days=365, policy="sensible"):
+    """Run a batch and print the report"""
+    start = time.perf_counter()
+    results = run_batch(n, workers, seed, max_days, policy)
+    print(format_report(results, time.perf_counter() - start))
+    return results
+
+__all__ = ['RandomPolicy', 'SensiblePolicy', 'POLICIES', 'run_single', 'run_batch', 'format_report', 'simulate']
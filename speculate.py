@@ -0,0 +1,158 @@
+import threading
+
+from contracts import TradeHub
+from encounters import roll_trip
+from shop import TradeHubShop
+from utils import load_lazy_modules
+
+# Speculative precompute while the player reads.
+#
+# An interactive game spends nearly all its time blocked in wait_for_enter.
+# While it is, a background thread rolls ahead the next expensive steps on
+# private copies of the RNG streams they use: the next hub's contract board,
+# its shop stock and tomorrow's trip. When the game gets to a step it asks
+# for the precomputed result; that is only handed over if the streams are
+# still exactly where the worker started from (the streams are shared
+# copy-on-write, so rolling one swaps in a new object) and the inputs match.
+# The game then continues from the worker's streams, so every roll comes
+# out the same as if it had been made on the spot. Anything stale is
+# dropped.
+#
+# Each cache entry holds one share (see DiceRoller.sharers) of every stream
+# it started from, and gives it back when it is taken or dropped, so the
+# game's next roll of a stream nobody else holds doesn't copy it.
+
+MISSING = object()  # No usable precomputed value
+
+def _contracts(rng, max_crates):
+    hub = TradeHub()
+    hub.generate_contracts(max_crates, rng)
+    return hub.available_contracts
+
+def _restock(rng):
+    return TradeHubShop(None, rng).inventory
+
+class Step:
+    """Something worth rolling ahead.
+
+    Args:
+        streams: Names of the RNG streams compute() rolls
+        compute: compute(rng, *inputs) -> value; must only roll those streams
+        guesses: guesses(game) -> list of input tuples likely to come up
+    """
+
+    def __init__(self, streams, compute, guesses):
+        self.streams = streams
+        self.compute = compute
+        self.guesses = guesses
+
+def _trip_guesses(game):
+    # One guess per distance the ship can go; see Game.travel_action
+    player, speed = game.player, game.ship.speed
+    return [(0.5 + 0.5 * sectors / speed, player.heat, player.cartel_threat_level, len(player.stones))
+            for sectors in range(1, speed + 1)]
+
+# In the order they are rolled ahead; a step continues from the streams the
+# first guess of the steps before it left behind, the way a hub visit rolls
+# the contract board and then the shop
+STEPS = {
+    "contracts": Step(("contracts", "loot"), _contracts, lambda game: [(game.ship.max_cargo,)]),
+    "restock": Step(("loot",), _restock, lambda game: [()]),
+    "trip": Step(("encounters",), roll_trip, _trip_guesses),
+}
+
+class Speculator:
+    """Rolls ahead STEPS for one game while it waits for the player"""
+
+    def __init__(self, game):
+        self.game = game
+        self._cache = {}  # kind -> (shared streams it started from, {inputs: (value, streams after)})
+        self._guesses = {}  # kind -> the guesses the cache was rolled for
+        self._thread = None
+
+    def __reduce__(self):
+        return (Speculator, (self.game,))  # Threads don't pickle; a copy starts idle
+
+    def attach(self, io):
+        """Speculate whenever io waits for the player"""
+        self.game.speculator = self
+        io.on_idle = self.start
+
+    def start(self):
+        """Roll ahead in the background unless the cache is still good"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        # Everything read from the game is read here, on the game's own thread
+        rng = self.game.rng
+        guesses = {kind: step.guesses(self.game) for kind, step in STEPS.items()}
+        if (len(self._cache) == len(STEPS) and guesses == self._guesses and
+                all(rng.unchanged(shared) for shared, _ in self._cache.values())):
+            return
+        self._drop()
+        names = sorted({name for step in STEPS.values() for name in step.streams})
+        self._guesses = guesses
+        load_lazy_modules()  # Not on the worker thread: the lazy loader isn't thread-safe
+        jobs = [(kind, step, guesses[kind]) for kind, step in STEPS.items()]
+        self._thread = threading.Thread(target=self._run, args=(rng, rng.share(names), jobs), daemon=True)
+        self._thread.start()
+
+    def _run(self, rng, streams, jobs):
+        fresh = set(streams)  # Shared by start(); the first step to use one holds that share
+        for kind, step, guesses in jobs:
+            shared = {name: streams[name] for name in step.streams}
+            for name, stream in shared.items():
+                if name in fresh:
+                    fresh.discard(name)
+                elif stream is not None:
+                    stream.sharers += 1  # Left behind by an earlier step; the game can't see it yet
+            results = {}
+            for inputs in guesses:
+                private = rng.private(shared)
+                value = step.compute(private, *inputs)
+                results[inputs] = (value, {name: private.stream(name) for name in step.streams})
+            streams.update(results[guesses[0]][1])
+            self._cache[kind] = (shared, results)
+
+    def take(self, kind, inputs):
+        """The precomputed value for a step, or MISSING if there isn't a valid one.
+
+        On a hit the game's RNG continues from where the worker left off.
+        """
+        if self._thread is not None:
+            self._thread.join()
+        entry = self._cache.pop(kind, None)
+        if entry is None:
+            return MISSING
+        shared, results = entry
+        rng = self.game.rng
+        hit = results.get(inputs)
+        if hit is not None and not rng.unchanged(shared):
+            hit = None
+        rng.release(shared)
+        if hit is None:
+            return MISSING
+        value, streams = hit
+        rng.adopt(streams)
+        return value
+
+    def cancel(self):
+        """Drop everything rolled ahead, waiting for the worker if it is still going"""
+        if self._thread is not None:
+            self._thread.join()
+        self._drop()
+
+    def _drop(self):
+        for shared, _ in self._cache.values():
+            self.game.rng.release(shared)
+        self._cache = {}
+
+def precomputed(game, kind, *inputs):
+    """STEPS[kind].compute(game.rng, *inputs), reusing work done in the background"""
+    speculator = game.speculator
+    if speculator is not None:
+        value = speculator.take(kind, inputs)
+        if value is not MISSING:
+            return value
+    return STEPS[kind].compute(game.rng, *inputs)
+
+__all__ = ['Step', 'STEPS', 'Speculator', 'precomputed']
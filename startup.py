@@ -0,0 +1,106 @@
+import sys
+import time
+
+# --profile-import: where the time goes before the first screen.
+#
+# A child interpreter runs under `python -X importtime`, which logs the
+# self and cumulative cost of every import to stderr, and goes through
+# the phases below, writing a marker line before each. Modules handed out
+# by utils.lazy_import don't go through the import system when they
+# finally load, so the child forces each one that is still pending and
+# times it itself.
+
+PHASES = (
+    ("startup", "import game"),
+    ("deferred", "subsystems loaded on first use"),
+    ("first game", "simulate.run_single(0)"),
+)
+MARKER = "@profile"
+TOP_MODULES = 8
+
+def _pending_modules():
+    return [name for name, module in sys.modules.items() if type(module).__name__ == "_LazyModule"]
+
+def _measure():
+    """Runs in the child interpreter"""
+    def mark(*fields):
+        sys.stderr.write(" ".join([MARKER] + [str(field) for field in fields]) + "\n")
+        sys.stderr.flush()
+
+    mark("phase", "startup")
+    start = time.perf_counter()
+    import game  # noqa: F401
+    mark("wall", round((time.perf_counter() - start) * 1e6))
+
+    mark("phase", "deferred")
+    total = time.perf_counter()
+    for name in _pending_modules():
+        start = time.perf_counter()
+        mark("module", name)
+        dir(sys.modules[name])  # Any attribute access loads it
+        mark("loaded", round((time.perf_counter() - start) * 1e6))
+    mark("wall", round((time.perf_counter() - total) * 1e6))
+
+    mark("phase", "first game")
+    start = time.perf_counter()
+    import simulate
+    simulate.run_single(0)
+    mark("wall", round((time.perf_counter() - start) * 1e6))
+
+def _parse(log):
+    """Per-phase {"wall": us, "modules": {name: self us}} from the child's stderr"""
+    phases = {}
+    phase = None
+    forcing = None  # [name, self time of the imports it set off]
+    for line in log.splitlines():
+        if line.startswith(MARKER):
+            fields = line.split()[1:]
+            if fields[0] == "phase":
+                phase = phases.setdefault(" ".join(fields[1:]), {"wall": 0, "modules": {}})
+            elif fields[0] == "wall":
+                phase["wall"] = int(fields[1])
+            elif fields[0] == "module":
+                forcing = [fields[1], 0]
+            elif fields[0] == "loaded":
+                phase["modules"][forcing[0]] = max(0, int(fields[1]) - forcing[1])
+                forcing = None
+        elif line.startswith("import time:") and phase is not None:
+            self_us, _, name = line[len("import time:"):].split("|")
+            if not self_us.strip().isdigit():
+                continue  # The column header
+            name = name.strip()
+            phase["modules"][name] = phase["modules"].get(name, 0) + int(self_us)
+            if forcing is not None:
+                forcing[1] += int(self_us)
+    return phases
+
+def format_report(phases, top=TOP_MODULES):
+    lines = ["Import profile (self time per module, slowest first)"]
+    for key, label in PHASES:
+        phase = phases.get(key)
+        if phase is None:
+            continue
+        modules = sorted(phase["modules"].items(), key=lambda item: -item[1])
+        lines.append("")
+        lines.append(f"{key}: {label:<38} {phase['wall'] / 1000:8.1f} ms  ({len(modules)} modules)")
+        for name, self_us in modules[:top]:
+            lines.append(f"  {name:<48} {self_us / 1000:8.1f} ms")
+        if len(modules) > top:
+            rest = sum(self_us for _, self_us in modules[top:])
+            lines.append(f"  {f'{len(modules) - top} more':<48} {rest / 1000:8.1f} ms")
+    return "\n".join(lines)
+
+def profile_import(top=TOP_MODULES):
+    """Profile startup in a fresh interpreter and print the report"""
+    import os
+    import subprocess
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    child = subprocess.run([sys.executable, "-X", "importtime", "-c", "import startup; startup._measure()"],
+                           cwd=here, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    if child.returncode != 0:
+        print(child.stderr.strip().splitlines()[-1] if child.stderr.strip() else "Profiling run failed")
+        return
+    print(format_report(_parse(child.stderr), top))
+
+__all__ = ['profile_import', 'format_report']
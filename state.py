@@ -0,0 +1,81 @@
+from operator import attrgetter
+
+# Observable game state.
+#
+# Player and Ship keep their fields in __slots__. The ones a class lists in
+# OBSERVED are properties over a private "_" slot: setting one to a value
+# that differs from the old one calls each observer subscribed to that
+# field with (field, old, new, cause). A read costs little more than a
+# plain attribute's, and a write nobody watches one function call, so a
+# cache can follow the fields it depends on (see endings.EndingWatch)
+# instead of re-reading all of them every turn.
+#
+# cause is None for a plain assignment (player.heat += 5); update() sets
+# fields with a reason attached. Observed lists are replaced, never changed
+# in place, or the change would go unseen; old and new are then both intact.
+
+class Observable:
+    """Base for state with observed fields (see OBSERVED)"""
+
+    __slots__ = ("_observers",)
+    OBSERVED = ()  # Fields that report changes; each needs a "_" slot
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for field in cls.__dict__.get("OBSERVED", ()):
+            slot = cls.__dict__["_" + field]  # The slot's own descriptor, to skip attribute lookup
+            setattr(cls, field, property(attrgetter(slot.__name__), _setter(field, slot.__get__, slot.__set__)))
+        cls._slots = tuple(name for klass in cls.__mro__ for name in klass.__dict__.get("__slots__", ())
+                           if name != "_observers")  # For copy(); __init__ sets every one
+
+    def __init__(self):
+        self._observers = {}  # {field: (observer, ...)}
+
+    def subscribe(self, observer, fields=None):
+        """Call observer(field, old, new, cause) when any of fields changes
+
+        Args:
+            fields: Names from OBSERVED; defaults to all of them
+        """
+        for field in self.OBSERVED if fields is None else fields:
+            if field not in self.OBSERVED:
+                raise ValueError(f"{type(self).__name__}.{field} isn't observed")
+            self._observers[field] = self._observers.get(field, ()) + (observer,)
+
+    def unsubscribe(self, observer):
+        for field, observers in list(self._observers.items()):
+            observers = tuple(o for o in observers if o != observer)
+            if observers:
+                self._observers[field] = observers
+            else:
+                del self._observers[field]
+
+    def update(self, cause=None, **values):
+        """Set fields, telling observers why they changed"""
+        for field, value in values.items():
+            if field not in self.OBSERVED:
+                raise ValueError(f"{type(self).__name__}.{field} isn't observed")
+            getattr(type(self), field).fset(self, value, cause)
+
+    def copy(self):
+        """Shallow copy with no observers; copy any list changed in place"""
+        clone = object.__new__(self.__class__)
+        clone._observers = {}
+        for name in self._slots:
+            setattr(clone, name, getattr(self, name))
+        return clone
+
+def _setter(field, get, put):
+    def set_field(obj, value, cause=None):
+        observers = obj._observers.get(field)
+        if observers:
+            old = get(obj)
+            put(obj, value)
+            if old != value:
+                for observer in observers:
+                    observer(field, old, value, cause)
+        else:
+            put(obj, value)
+    return set_field
+
+__all__ = ['Observable']
@@ -0,0 +1,126 @@
+import random
+import time
+
+from equipment import WEAPONS, ARMORS
+from odds import ENEMY_FACTORIES
+from fights import generate_cartel_enemies
+from encounters import generate_shadow_enemy
+from utils import np  # Loaded by the first sweep; None without NumPy, which only the sweep needs
+
+# Batch combat simulator for balancing.
+#
+# Every (loadout, opponent, repeat) fight is one slot in a set of parallel
+# arrays. All fights advance one round per step: the player attacks, then
+# every enemy still standing swings back, with finished fights masked out.
+# An opponent can be a gauntlet of several enemies fought back to back with
+# HP carried over, like the bigger cartel ambushes.
+
+class Loadout:
+    """A weapon/armor combination (either may be None)"""
+
+    def __init__(self, weapon=None, armor_item=None):
+        self.weapon = weapon
+        self.armor_item = armor_item
+        self.name = f"{weapon.name if weapon else 'Fists'} + {armor_item.name if armor_item else 'No armor'}"
+
+    def damage(self, base_damage):
+        return base_damage + (self.weapon.damage if self.weapon else 0)
+
+    def armor(self):
+        return self.armor_item.defense if self.armor_item else 0
+
+class Opponent:
+    """One or more enemies fought in a row, as (hp, min_damage, max_damage) stages"""
+
+    def __init__(self, name, enemies):
+        self.name = name
+        self.stages = [(enemy.hp, enemy.min_damage, enemy.max_damage) for enemy in enemies]
+
+def all_loadouts():
+    """Every weapon × every armor, plus going without either"""
+    return [Loadout(weapon, armor_item) for weapon in [None] + WEAPONS for armor_item in [None] + ARMORS]
+
+def all_opponents(max_threat=8, heat_levels=(0, 40, 80, 120)):
+    """Police tiers, bounty hunters, cartel ambushes by threat level and tractor beam enemies by heat"""
+    opponents = []
+    for factory in ENEMY_FACTORIES:
+        enemy = factory()
+        opponents.append(Opponent(enemy.name, [enemy]))
+    for threat_level in range(max_threat + 1):
+        opponents.append(Opponent(f"Cartel threat {threat_level}", generate_cartel_enemies(threat_level)))
+    names = random.Random(0)  # Only picks the enemy's name
+    for encounter_type in ("cartel", "federation", "stones"):
+        for heat in heat_levels:
+            enemy = generate_shadow_enemy(encounter_type, heat, names)
+            opponents.append(Opponent(f"Shadow {encounter_type} heat {heat}", [enemy]))
+    return opponents
+
+class SweepResult:
+    """Loadout × opponent matrices of win rate and mean rounds fought"""
+
+    def __init__(self, loadouts, opponents, win_rate, mean_turns, fights, elapsed):
+        self.loadouts = loadouts
+        self.opponents = opponents
+        self.win_rate = win_rate
+        self.mean_turns = mean_turns
+        self.fights = fights
+        self.elapsed = elapsed
+
+    def format(self, limit=20):
+        """Text report: per-opponent summary and the strongest loadouts overall"""
+        total = len(self.loadouts) * len(self.opponents) * self.fights
+        lines = [f"=== Combat sweep: {total:,} fights in {self.elapsed:.2f}s ==="]
+        lines.append(f"\n{'Opponent':<30} {'best win':>9} {'mean win':>9} {'turns':>7}")
+        for j, opponent in enumerate(self.opponents):
+            lines.append(f"{opponent.name:<30} {self.win_rate[:, j].max():9.1%} "
+                         f"{self.win_rate[:, j].mean():9.1%} {self.mean_turns[:, j].mean():7.2f}")
+        lines.append(f"\nTop {limit} loadouts by mean win rate:")
+        overall = self.win_rate.mean(axis=1)
+        for i in np.argsort(-overall)[:limit]:
+            lines.append(f"  {self.loadouts[i].name:<52} {overall[i]:6.1%}")
+        return "\n".join(lines)
+
+def sweep(loadouts=None, opponents=None, fights=1000, seed=0, hp=100, base_damage=10):
+    """Fight every loadout against every opponent `fights` times, attacking every round
+
+    Returns:
+        SweepResult with win_rate and mean_turns arrays of shape (loadouts, opponents)
+    """
+    if np is None:
+        raise RuntimeError("The combat sweep needs NumPy, which isn't installed (pip install numpy)")
+    loadouts = loadouts if loadouts is not None else all_loadouts()
+    opponents = opponents if opponents is not None else all_opponents()
+    start = time.perf_counter()
+    generator = np.random.default_rng(seed)
+    shape = (len(loadouts), len(opponents), fights)
+
+    damage = np.array([loadout.damage(base_damage) for loadout in loadouts])[:, None, None]
+    armor = np.array([loadout.armor() for loadout in loadouts])[:, None, None]
+    player_hp = np.full(shape, hp)
+    turns = np.zeros(shape, dtype=np.int64)
+    alive = np.ones(shape, dtype=bool)
+
+    for stage in range(max(len(opponent.stages) for opponent in opponents)):
+        # Stats of this stage's enemy for each opponent; hp 0 means the gauntlet is already over
+        stats = np.array([opponent.stages[stage] if stage < len(opponent.stages) else (0, 0, 0)
+                          for opponent in opponents])
+        enemy_hp = np.broadcast_to(stats[:, 0][None, :, None], shape).copy()
+        min_damage = np.broadcast_to(stats[:, 1][None, :, None], shape)
+        max_damage = np.broadcast_to(stats[:, 2][None, :, None], shape)
+        active = alive & (enemy_hp > 0)
+
+        while active.any():
+            turns += active
+            enemy_hp -= np.where(active, damage, 0)
+            active &= enemy_hp > 0
+            hits = generator.integers(min_damage, max_damage + 1)
+            player_hp -= np.where(active, np.maximum(0, hits - armor), 0)
+            died = active & (player_hp <= 0)
+            alive &= ~died
+            active &= ~died
+
+    win_rate = alive.mean(axis=2)
+    mean_turns = turns.mean(axis=2)
+    return SweepResult(loadouts, opponents, win_rate, mean_turns, fights, time.perf_counter() - start)
+
+__all__ = ['Loadout', 'Opponent', 'SweepResult', 'all_loadouts', 'all_opponents', 'sweep']
@@ -0,0 +1,53 @@
+import os
+import sys
+
+import pytest
+
+# The game is a flat set of modules at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import Game
+from game_io import RecordingIO, ScriptedIO, ScriptExhausted
+from simulate import SensiblePolicy
+
+MAX_DAYS = 20  # Long enough to see hubs, contracts and fights; short enough to run fast
+
+@pytest.fixture
+def start():
+    """start(seed, game=None, io_class=ScriptedIO, max_days=MAX_DAYS) -> (game, RecordingIO)
+
+    Sets a game up to be played by a SensiblePolicy seeded like the game,
+    with everything it prints and reads recorded. Given a game (a fork or a
+    loaded save), that game gets the new IO instead of a fresh one.
+    """
+    def start(seed, game=None, io_class=ScriptedIO, max_days=MAX_DAYS):
+        policy = SensiblePolicy(seed, max_days)
+        io = RecordingIO(io_class(policy=policy, max_inputs=5000))
+        if game is None:
+            game = Game(io, seed=seed)
+        else:
+            game.io = io
+        policy.attach(game)
+        return game, io
+    return start
+
+@pytest.fixture
+def finish():
+    """finish(game, setup=True) -> the ending, or "TIMEOUT" when the policy stops"""
+    def finish(game, setup=True):
+        try:
+            return game.play(setup).ending
+        except ScriptExhausted:
+            return "TIMEOUT"
+    return finish
+
+@pytest.fixture
+def snapshot():
+    """snapshot(game) -> what two runs of the same game must agree on"""
+    def snapshot(game):
+        player = game.player
+        contract = player.current_contract
+        return (game.day, game.game_over, player.hp, player.credits, player.heat, player.stones,
+                [item.name for item in player.items], player.inventory, game.ship.fuel,
+                contract and (contract.distance, contract.deadline, contract.reward, contract.sectors_traveled))
+    return snapshot
@@ -0,0 +1,113 @@
+import pytest
+
+import advisor
+import narrative
+from advisor import BATCH, Advisor, apply_option, rollout, search
+from combat import LOCAL_DEPUTY
+from fights import PoliceEncounter
+from game_io import RecordingIO, ScriptedIO, ScriptExhausted
+from outcome import GameEnded
+from simulate import SensiblePolicy
+from trade_hub_gameplay import hub_menu
+
+DAILY = [("Travel", ("daily", 1)), ("Lay Low", ("daily", 2))]
+
+@pytest.fixture
+def game(start):
+    """A game set up and played for a couple of turns"""
+    for seed in range(200):
+        game, _ = start(seed)
+        game.initial_setup()
+        try:
+            for _ in range(2):
+                game.play_turn()
+        except GameEnded:
+            continue
+        if not game.game_over:
+            return game
+    pytest.fail("No game lasted two turns")
+
+@pytest.fixture
+def untouched(snapshot):
+    """untouched(game) -> what advice must leave alone: the game and its next rolls"""
+    def untouched(game):
+        fork = game.fork()
+        return snapshot(game), [fork.rng.stream(name).d100() for name in fork.rng.STREAMS]
+    return untouched
+
+def test_rollouts_repeat_and_leave_the_game_alone(game, untouched):
+    before = untouched(game)
+    first = rollout(game, ("daily", 2), 5, horizon=3)
+    assert rollout(game, ("daily", 2), 5, horizon=3) == first
+    assert untouched(game) == before
+
+def test_every_option_gets_a_rollout(game):
+    stats = search(game, DAILY, budget=0, horizon=2, seed=1)
+    assert [(s.label, s.visits) for s in stats] == [("Travel", 1), ("Lay Low", 1)]
+    assert all(0.0 <= s.reward <= 1.0 for s in stats)
+
+def test_same_spot_same_advice(game):
+    advisor = Advisor(budget=0, horizon=2, workers=0)
+    first, second = advisor.evaluate(game, DAILY), advisor.evaluate(game, DAILY)
+    assert [(s.label, s.survived, s.credits) for s in first] == [(s.label, s.survived, s.credits) for s in second]
+    assert first[0].reward >= first[1].reward
+
+def test_recommend_prints_advice_and_changes_nothing(game, untouched):
+    before = untouched(game)
+    game.advisor = Advisor(budget=0.05, horizon=2)
+    best = game.recommend(DAILY)
+    assert best.label in ("Travel", "Lay Low")
+    assert "I'd go with: " + best.label in game.io.output_text()
+    assert untouched(game) == before
+
+def test_unknown_option(game):
+    with pytest.raises(ValueError, match="Unknown option"):
+        apply_option(game.fork(), ("dance",))
+
+@pytest.fixture
+def rich(game):
+    """A fork of the game with credits to spare, talking to a SensiblePolicy"""
+    fork = game.fork(RecordingIO(ScriptedIO(policy=SensiblePolicy(1, game.day + 2), max_inputs=500)))
+    fork.player.credits, fork.player.heat = 100000, 0
+    return fork
+
+def test_police_decisions(rich):
+    lines = set(narrative.lines("bribe.success.default") + narrative.lines("bribe.failure.default"))
+    for choice in ("stop", "bribe"):
+        fork = rich.fork(RecordingIO(ScriptedIO(policy=SensiblePolicy(1, rich.day + 2), max_inputs=500)))
+        try:
+            PoliceEncounter(fork).resolve(choice, LOCAL_DEPUTY)
+        except (GameEnded, ScriptExhausted):
+            pass
+        output = fork.io.output_text()
+        assert "glances around furtively" in output
+        assert "1. Offer" not in output  # Decided up front, not asked
+        assert any(line in output for line in lines) == (choice == "bribe")
+    with pytest.raises(ValueError, match="Unknown patrol decision 'wave'"):
+        PoliceEncounter(rich).resolve("wave", LOCAL_DEPUTY)
+
+def test_police_prompt_offers_every_decision(rich):
+    offered = []
+    rich.recommend = offered.extend
+    rich.io = ScriptedIO(["recommend"])
+    with pytest.raises(ScriptExhausted):
+        PoliceEncounter(rich).run()
+    assert [option[1][1] for option in offered] == ["run", "stop", "bribe"]
+
+def test_contract_prompt_takes_recommend_again(rich):
+    asked = []
+    rich.recommend = asked.append
+    rich.player.current_contract = None
+    rich.io = ScriptedIO(["1", "recommend", "recommend", "0", "0"])
+    hub_menu(rich, "slum")
+    assert len(asked) == 2
+    assert rich.player.current_contract is None
+
+def test_workers_share_one_search(game):
+    try:
+        stats = Advisor(budget=0.05, horizon=2, workers=2).evaluate(game, DAILY)
+        assert all(s.visits and s.visits % BATCH == 0 for s in stats)
+        assert advisor._pools
+    finally:
+        advisor.shutdown()
+    assert not advisor._pools
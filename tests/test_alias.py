@@ -0,0 +1,46 @@
+import pytest
+
+from utils import AliasSampler, DiceRoller, alias_sampler, np
+
+WEIGHTS = (50, 30, 15, 4, 1, 0, 7)
+
+def exact_probabilities(sampler):
+    """Chance of each index over a uniform roll, read off the table"""
+    mass = [0.0] * sampler.size
+    for i in range(sampler.size):
+        mass[i] += sampler.probability[i] / sampler.size
+        mass[sampler.alias[i]] += (1.0 - sampler.probability[i]) / sampler.size
+    return mass
+
+def test_table_matches_the_weights():
+    for weights in (WEIGHTS, (1,), (3, 3, 3), (1, 1000), (0.25, 0.5, 0.25)):
+        total = sum(weights)
+        for got, weight in zip(exact_probabilities(AliasSampler(weights)), weights):
+            assert got == pytest.approx(weight / total, abs=1e-12)
+
+def test_zero_weights_are_never_picked():
+    sampler = AliasSampler((0, 1, 0))
+    assert {sampler.sample(i / 1000) for i in range(1000)} == {1}
+
+def test_no_positive_weight():
+    for weights in ((), (0, 0)):
+        with pytest.raises(ValueError):
+            AliasSampler(weights)
+
+def test_batch_matches_single_samples():
+    sampler = AliasSampler(WEIGHTS)
+    rolls = [i / 997 for i in range(997)]
+    expected = [sampler.sample(u) for u in rolls]
+    assert list(sampler.sample_many(rolls if np is None else np.array(rolls))) == expected
+
+def test_weighted_choice_frequencies():
+    dice = DiceRoller("alias")
+    picks = [dice.weighted_choice(WEIGHTS) for _ in range(20000)]
+    for i, weight in enumerate(WEIGHTS):
+        assert picks.count(i) / len(picks) == pytest.approx(weight / sum(WEIGHTS), abs=0.02)  # About 5 sigma
+    batch = list(dice.weighted_choice(WEIGHTS, n=20000))
+    assert batch.count(0) / len(batch) == pytest.approx(50 / sum(WEIGHTS), abs=0.02)
+    assert batch.count(5) == 0
+
+def test_tables_are_cached():
+    assert alias_sampler(WEIGHTS) is alias_sampler(WEIGHTS)
@@ -0,0 +1,80 @@
+import pytest
+
+from combat import ATTACK, ESCAPE, GRENADE_DAMAGE, CombatState, escape_chance, resolve_turn, use_item
+from enemies import ENEMY_TIERS, EnemyTier
+from utils import GameRNG
+
+def fight(**changes):
+    """A fight against an enemy that always hits for 10"""
+    state = CombatState(
+        player_hp=100, player_max_hp=100, player_damage=20, armor=0,
+        enemy_hp=50, enemy_min_damage=10, enemy_max_damage=10, credits_reward=75,
+        drop_table=ENEMY_TIERS[EnemyTier.LOCAL_DEPUTY].drop_table,
+        ship_speed=1, items=(), shield_active=False, enemy_stunned=False, outcome=None,
+    )
+    return state._replace(**changes)
+
+def test_exchange_of_blows():
+    before = fight()
+    state, events = resolve_turn(before, ATTACK, GameRNG(1))
+    assert before == fight()  # The old state is left alone
+    assert (state.player_hp, state.enemy_hp, state.outcome) == (90, 30, None)
+    assert events == [("player_attack", 20), ("enemy_attack", 10)]
+
+def test_killing_blow():
+    state, events = resolve_turn(fight(enemy_hp=20), ATTACK, GameRNG(1))
+    assert state.outcome == "victory" and state.enemy_hp == 0 and state.player_hp == 100
+    assert events[:2] == [("player_attack", 20), ("enemy_defeated", 75)]
+    assert all(event[0] == "drop" for event in events[2:])
+
+def test_armor():
+    state, events = resolve_turn(fight(armor=4), ATTACK, GameRNG(1))
+    assert state.player_hp == 94
+    assert events[1:] == [("armor_absorbed", 4), ("enemy_attack", 6)]
+    state, events = resolve_turn(fight(armor=15), ATTACK, GameRNG(1))
+    assert state.player_hp == 100 and events[-1] == ("enemy_attack", 0)
+
+def test_shield_and_stun_each_stop_one_attack():
+    state, events = resolve_turn(fight(shield_active=True), ATTACK, GameRNG(1))
+    assert state.player_hp == 100 and not state.shield_active and events[-1] == ("shield_blocked",)
+    state, events = resolve_turn(fight(enemy_stunned=True), ATTACK, GameRNG(1))
+    assert state.player_hp == 100 and not state.enemy_stunned and events[-1] == ("enemy_stunned",)
+
+def test_items():
+    state, events = resolve_turn(fight(player_hp=90, items=("shield", "medkit")), use_item(1), GameRNG(1))
+    assert state.items == ("shield",)
+    assert events[0] == ("item_used", "medkit", 10)  # Healing stops at max HP
+    assert state.player_hp == 90  # Healed to 100, then hit for 10
+
+    state, events = resolve_turn(fight(items=("grenade",)), use_item(0), GameRNG(1))
+    assert GRENADE_DAMAGE[0] <= 50 - state.enemy_hp <= GRENADE_DAMAGE[1]
+    assert events[0] == ("item_used", "grenade", 50 - state.enemy_hp)
+
+    with pytest.raises(ValueError):
+        resolve_turn(fight(items=("banana",)), use_item(0), GameRNG(1))
+
+def test_escape():
+    assert escape_chance(19) == pytest.approx(1.0)
+    state, events = resolve_turn(fight(ship_speed=19), ESCAPE, GameRNG(1))
+    assert state.outcome == "escaped" and events == [("escaped",)] and state.player_hp == 100
+    state, events = resolve_turn(fight(ship_speed=-1), ESCAPE, GameRNG(1))  # No chance at all
+    assert events == [("escape_failed",), ("enemy_attack", 10)]
+
+def test_defeat():
+    state, events = resolve_turn(fight(player_hp=5), ATTACK, GameRNG(1))
+    assert state.outcome == "defeat" and state.player_hp == -5
+    assert events[-1] == ("player_defeated",)
+
+def test_same_rolls_same_round():
+    state = fight(enemy_min_damage=1, enemy_max_damage=40, items=("grenade",))
+    for action in (ATTACK, ESCAPE, use_item(0)):
+        assert resolve_turn(state, action, GameRNG(7)) == resolve_turn(state, action, GameRNG(7))
+
+def test_only_combat_and_loot_streams_are_rolled():
+    rng = GameRNG(7)
+    for _ in range(20):
+        resolve_turn(fight(enemy_hp=20, enemy_min_damage=1, enemy_max_damage=40), ATTACK, rng)
+        resolve_turn(fight(), ESCAPE, rng)
+    fresh = GameRNG(7)
+    for name in ("contracts", "encounters", "flavor"):
+        assert [rng.stream(name).d100() for _ in range(20)] == [fresh.stream(name).d100() for _ in range(20)]
@@ -0,0 +1,76 @@
+import pytest
+
+import cutscene
+import narrative
+from cutscene import HEADLESS, PLAY, SKIP, play, script
+from game_io import GameIO
+from narrative import NarrativeError, NarrativeTable, pack, parse
+
+SCENES = """
+== scene
+@clear
+Hello {name}.
+@wait
+Second line.
+@print The end, {name}.
+== broken
+@dance
+"""
+
+class PacedIO(GameIO):
+    """Records what a cutscene shows; answers each pause from a list"""
+
+    def __init__(self, answers=()):
+        self.shown = []
+        self.answers = list(answers)
+
+    def print(self, *args, sep=" ", end="\n"):
+        self.shown.append(sep.join(str(arg) for arg in args))
+
+    def wait_for_enter(self):
+        self.shown.append("...")
+        return self.answers.pop(0) if self.answers else ""
+
+    def clear(self):
+        self.shown.append("CLEAR")
+
+@pytest.fixture(autouse=True)
+def scenes(monkeypatch):
+    monkeypatch.setattr(narrative, "_table", NarrativeTable(pack(parse(SCENES))))
+    script.cache_clear()
+    yield
+    script.cache_clear()
+
+def test_script_steps():
+    assert script("scene") == ((cutscene.CLEAR, None), (cutscene.LINE, "Hello {name}."), (cutscene.WAIT, None),
+                               (cutscene.LINE, "Second line."), (cutscene.PRINT, "The end, {name}."))
+    with pytest.raises(NarrativeError, match="Unknown cutscene step '@dance' in broken"):
+        script("broken")
+
+def test_play():
+    io = PacedIO()
+    play(io, "scene", PLAY, name="Rex")
+    assert io.shown == ["CLEAR", "Hello Rex.", "...", "...", "Second line.", "...", "The end, Rex."]
+
+def test_skip_at_a_pause():
+    io = PacedIO(["", " Skip "])
+    play(io, "scene", PLAY, name="Rex")
+    assert io.shown == ["CLEAR", "Hello Rex.", "...", "...", "The end, Rex."]
+
+def test_skip_mode_shows_only_the_end():
+    io = PacedIO()
+    play(io, "scene", SKIP, name="Rex")
+    assert io.shown == ["The end, Rex."]
+
+def test_headless_reads_nothing(monkeypatch):
+    monkeypatch.setattr(narrative, "_table", None)
+    monkeypatch.setattr(narrative, "open_table", lambda *args: pytest.fail("The table was opened"))
+    io = PacedIO()
+    play(io, "scene", HEADLESS)
+    assert io.shown == []
+
+def test_mode_defaults_to_the_ios():
+    io = PacedIO()
+    io.cutscenes = SKIP
+    play(io, "scene", name="Rex")
+    assert io.shown == ["The end, Rex."]
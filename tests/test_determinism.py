@@ -0,0 +1,86 @@
+from utils import DiceRoller, GameRNG
+
+def rolls(rng, stream, n=50):
+    """n single rolls from one of a GameRNG's streams"""
+    dice = rng.stream(stream)
+    return [dice.d100() for _ in range(n)]
+
+def test_same_seed_plays_the_same_game(start, finish):
+    for seed in (1, 7, 42):
+        first, first_io = start(seed)
+        second, second_io = start(seed)
+        assert finish(first) == finish(second)
+        assert first_io.transcript == second_io.transcript
+        assert first.day == second.day and first.player.credits == second.player.credits
+
+def test_different_seeds_play_different_games(start, finish):
+    games = []
+    for seed in (1, 2):
+        game, io = start(seed)
+        finish(game)
+        games.append(io.transcript)
+    assert games[0] != games[1]
+
+def test_streams_are_independent():
+    rng = GameRNG(3)
+    expected = rolls(GameRNG(3), "combat")
+    rolls(rng, "flavor", 500)  # More flavor text mustn't shift the fights
+    assert rolls(rng, "combat") == expected
+
+def test_streams_differ_by_name_and_seed():
+    rng = GameRNG(3)
+    assert rolls(rng, "combat") != rolls(rng, "loot")
+    assert rolls(GameRNG(3), "loot") != rolls(GameRNG(4), "loot")
+
+def test_dice_stay_on_their_faces():
+    dice = DiceRoller("faces")
+    assert {dice.d6() for _ in range(600)} == set(range(1, 7))
+    assert all(1 <= dice.d100() <= 100 for _ in range(1000))
+
+def test_fork_rolls_what_the_game_would():
+    rng = GameRNG(5)
+    rolls(rng, "loot", 10)
+    fork = rng.fork()
+    assert rolls(fork, "loot") == rolls(rng, "loot")
+    assert rolls(rng.fork(reseed=6), "loot") != rolls(rng.fork(), "loot")
+
+def test_fork_leaves_the_original_alone():
+    rng = GameRNG(5)
+    rolls(rng, "combat", 10)
+    expected = rolls(rng.fork(), "combat")
+    rolls(rng.fork(), "combat", 100)
+    assert rolls(rng, "combat") == expected
+
+def test_share_and_adopt():
+    rng = GameRNG(8)
+    rolls(rng, "encounters", 3)
+    expected = rolls(rng.fork(), "encounters")
+
+    shared = rng.share(["encounters"])
+    ahead = rng.private(shared)
+    assert rolls(ahead, "encounters") == expected
+    assert rng.unchanged(shared)
+    after = rolls(ahead.fork(), "encounters")
+    rng.adopt({"encounters": ahead.stream("encounters")})
+    assert rolls(rng, "encounters") == after
+
+    shared = rng.share(["encounters"])
+    rolls(rng, "encounters", 1)
+    assert not rng.unchanged(shared)
+
+def test_getstate_setstate_resumes_buffered_rolls():
+    dice = DiceRoller("state")
+    dice.d6(), dice.unit(), dice.d20(n=40)  # Part-used buffers and a NumPy generator, if installed
+    state = dice.getstate()
+    expected = [dice.d6() for _ in range(100)] + [dice.unit() for _ in range(100)] + list(dice.d20(n=40))
+
+    restored = DiceRoller()
+    restored.setstate(state)
+    assert [restored.d6() for _ in range(100)] + [restored.unit() for _ in range(100)] + list(restored.d20(n=40)) == expected
+
+def test_clone_is_unshared():
+    dice = DiceRoller("clone")
+    dice.sharers = 3
+    clone = dice.clone()
+    assert clone.sharers == 1
+    assert [clone.d12() for _ in range(20)] == [dice.d12() for _ in range(20)]
@@ -0,0 +1,81 @@
+import pytest
+
+from endings import FIELDS, Ending, EndingWatch
+from game import Game
+from game_io import ScriptedIO
+from outcome import GameEnded
+
+class Checked:
+    """A predicate that counts how often it is evaluated"""
+
+    def __init__(self, result=False):
+        self.calls = 0
+        self.result = result
+
+    def __call__(self, player):
+        self.calls += 1
+        return self.result
+
+def test_unknown_fields_are_rejected():
+    with pytest.raises(ValueError, match=r"unknown fields \['hp'\]"):
+        Ending("HEALTHY", ("hp", "credits"), bool, print)
+
+def test_changes_mark_fields_dirty():
+    game = Game(ScriptedIO(), seed=1)
+    watch = EndingWatch(game.player)
+    assert watch._dirty == set(FIELDS)  # The first check evaluates everything
+    watch.check(game)
+    assert watch._dirty == set()
+    game.player.credits += 1
+    game.player.take_stone("Mind")
+    game.player.heat += 5  # No ending reads it
+    assert watch._dirty == {"credits", "stones"}
+    game.player.hp = game.player.hp  # Not a change
+    watch.check(game)
+    assert watch._dirty == set()
+
+def test_only_endings_on_changed_fields_are_checked():
+    game = Game(ScriptedIO(), seed=1)
+    rich, stony = Checked(), Checked()
+    handled = []
+    watch = EndingWatch(game.player, [Ending("RICH", ("credits",), rich, handled.append),
+                                      Ending("STONY", ("stones",), stony, handled.append)])
+    watch.check(game)
+    assert (rich.calls, stony.calls) == (1, 1)
+    for _ in range(3):
+        watch.check(game)
+    assert (rich.calls, stony.calls) == (1, 1)
+    game.player.credits += 10
+    watch.check(game)
+    assert (rich.calls, stony.calls) == (2, 1)
+    rich.result = True
+    game.player.credits += 10
+    watch.check(game)
+    assert handled == [game]
+
+def test_copies_watch_their_own_player():
+    game = Game(ScriptedIO(), seed=1)
+    watch = EndingWatch(game.player)
+    watch.check(game)
+    fork = game.player.copy()
+    copy = watch.copy(fork)
+    fork.credits += 5
+    assert copy._dirty == {"credits"} and watch._dirty == set()
+    game.player.take_stone("Soul")
+    assert copy._dirty == {"credits"} and watch._dirty == {"stones"}
+
+def test_kingpin_ending():
+    game = Game(ScriptedIO(["1"]), seed=1)
+    game.check_for_endings()
+    game.player.credits = 1000000
+    with pytest.raises(GameEnded) as ended:
+        game.check_for_endings()
+    assert ended.value.result.ending == "DENIAL"
+
+def test_turning_kingpin_down_is_remembered():
+    game = Game(ScriptedIO(["2"]), seed=1)
+    game.player.credits = 1000000
+    game.check_for_endings()  # The null IO would raise if asked again
+    game.player.credits += 1
+    game.check_for_endings()
+    assert game.player.rejected_kingpin and not game.game_over
@@ -0,0 +1,40 @@
+from flavor import (HUB_LANDING, HUB_MOOD, HUB_NOVA, HUB_NPC, HUB_SOUND, HUB_TYPE_DESCRIPTORS, HUB_TYPES,
+                    HUB_VISUAL, NOVA_LINES, generate_trade_hub_name, get_random_nova_quote)
+from game import Game
+from game_io import RecordingIO, ScriptedIO
+from utils import DiceRoller
+
+FIELDS = dict(heat=85, fuel=1, name="Tester", credits=120)
+
+def visit(seed):
+    io = RecordingIO(ScriptedIO())
+    return generate_trade_hub_name(io, DiceRoller(seed)), io.transcript
+
+def test_every_hub_type_has_its_text():
+    for table in (HUB_LANDING, HUB_TYPE_DESCRIPTORS, HUB_VISUAL, HUB_SOUND, HUB_NPC, HUB_MOOD, HUB_NOVA):
+        assert set(table) == set(HUB_TYPES)
+        assert all(table[hub_type] for hub_type in HUB_TYPES)
+
+def test_hub_names():
+    for seed in range(200):
+        (name, hub_type), transcript = visit(seed)
+        assert hub_type in HUB_TYPES
+        assert "{" not in name
+        assert ("out", f"You've arrived at the {name}...\n") in transcript
+    assert visit(7) == visit(7)
+
+def test_nova_templates_fill_in():
+    for pool, templates in NOVA_LINES.items():
+        for template in templates:
+            line = template.format(**FIELDS)
+            assert "{" not in line, (pool, template)
+
+def test_nova_quote_mentions_the_player():
+    game = Game(ScriptedIO(), seed=2)
+    game.player.name, game.player.heat, game.player.hp = FIELDS["name"], FIELDS["heat"], 100
+    expected = {"[NOVA] " + template.format(heat=game.player.heat, fuel=game.ship.fuel, name=game.player.name,
+                                            credits=game.player.credits)
+                for pool in ("high_heat", "teasing") for template in NOVA_LINES[pool]}
+    quotes = {get_random_nova_quote(game) for _ in range(300)}
+    assert quotes <= expected
+    assert any("85" in quote for quote in quotes)
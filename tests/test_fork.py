@@ -0,0 +1,53 @@
+import pickle
+
+import pytest
+
+from game_io import ScriptedIO
+from outcome import GameEnded
+
+TURNS = 6
+
+@pytest.fixture
+def partway(start):
+    """A game played for TURNS turns, stopped between turns"""
+    for seed in range(200):
+        game, _ = start(seed)
+        game.initial_setup()
+        try:
+            for _ in range(TURNS):
+                game.play_turn()
+        except GameEnded:
+            continue
+        if not game.game_over:
+            return game
+    pytest.fail(f"No game lasted {TURNS} turns")
+
+@pytest.fixture
+def continue_game(start, finish, snapshot):
+    """continue_game(game) -> (ending, snapshot, transcript) of playing it on"""
+    def continue_game(game):
+        game, io = start(game.rng.seed, game)
+        return finish(game, setup=False), snapshot(game), io.transcript
+    return continue_game
+
+def test_fork_plays_on_like_the_original(partway, continue_game):
+    fork = partway.fork()
+    from_fork = continue_game(fork)
+    from_game = continue_game(partway)
+    assert from_fork == from_game
+    assert len(from_game[2]) > 10
+
+def test_playing_a_fork_leaves_the_original_alone(partway, continue_game, snapshot):
+    before = snapshot(partway)
+    watch = partway.ending_watch._dirty.copy()
+    continue_game(partway.fork())
+    assert snapshot(partway) == before
+    assert partway.ending_watch._dirty == watch
+
+def test_pickled_fork_plays_on_like_the_original(partway, continue_game):
+    fork = pickle.loads(pickle.dumps(partway.fork(ScriptedIO())))
+    assert continue_game(fork) == continue_game(partway)
+
+def test_reseeded_fork_has_its_own_luck(partway, continue_game):
+    reseeded = continue_game(partway.fork(reseed=99))
+    assert reseeded != continue_game(partway)
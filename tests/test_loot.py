@@ -0,0 +1,61 @@
+import pytest
+
+from equipment import (ARMORS, COMMON, LEGENDARY, LOOT_INDEX, RARE, RARITY_RANKS, RARITY_WEIGHTS, WEAPONS,
+                       Weapon, LootIndex, get_random_weapon)
+from utils import DiceRoller
+
+def baseline(catalog, include_illegal, min_rarity):
+    """The items and weights get_random_equipment used to filter and weigh on every call"""
+    items = [eq for eq in catalog if include_illegal or not eq.is_illegal]
+    if min_rarity:
+        items = [eq for eq in items if RARITY_RANKS.index(eq.rarity) >= RARITY_RANKS.index(min_rarity)]
+    return items, [RARITY_WEIGHTS[eq.rarity] for eq in items]
+
+def combinations():
+    for catalog in (WEAPONS, ARMORS):
+        for include_illegal in (True, False):
+            for min_rarity in (None,) + RARITY_RANKS:
+                yield catalog, include_illegal, min_rarity
+
+def test_tables_match_the_baseline():
+    for catalog, include_illegal, min_rarity in combinations():
+        items, weights = baseline(catalog, include_illegal, min_rarity)
+        table = LOOT_INDEX.table(catalog, include_illegal, min_rarity)
+        assert list(table[0]) == items
+        assert [b - a for a, b in zip([0] + table[1], table[1])] == weights
+
+def test_picks_follow_the_baseline_odds():
+    dice = DiceRoller("loot")
+    items, weights = baseline(WEAPONS, True, RARE)
+    picks = [LOOT_INDEX.sample(dice, WEAPONS, True, RARE) for _ in range(20000)]
+    batch = LOOT_INDEX.sample(dice, WEAPONS, True, RARE, n=20000)
+    for item, weight in zip(items, weights):
+        expected = weight / sum(weights)
+        assert picks.count(item) / len(picks) == pytest.approx(expected, abs=0.02)
+        assert batch.count(item) / len(batch) == pytest.approx(expected, abs=0.02)
+
+def test_nothing_to_pick():
+    dice = DiceRoller("empty")
+    assert baseline(ARMORS, False, LEGENDARY)[0] == []
+    assert LOOT_INDEX.sample(dice, ARMORS, False, LEGENDARY) is None
+    assert LOOT_INDEX.sample(dice, ARMORS, False, LEGENDARY, n=3) == []
+
+def test_helpers_draw_from_the_given_stream():
+    picks = []
+    for _ in range(2):
+        dice = DiceRoller(5)
+        picks.append([get_random_weapon(include_illegal=False, rng=dice) for _ in range(20)])
+    assert picks[0] == picks[1]
+    assert all(not weapon.is_illegal for weapon in picks[0])
+
+def test_rebuild_after_changing_a_catalog():
+    catalog = [Weapon("Stick", 1, 1, False, COMMON)]
+    index = LootIndex(catalog)
+    catalog.append(Weapon("Bigger Stick", 2, 2, False, RARE))
+    assert len(index.table(catalog)[0]) == 1
+    index.rebuild()
+    assert [eq.name for eq in index.table(catalog)[0]] == ["Stick", "Bigger Stick"]
+
+def test_unregistered_catalog():
+    catalog = WEAPONS[:3]
+    assert LootIndex().sample(DiceRoller(1), catalog) in catalog
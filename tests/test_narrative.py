@@ -0,0 +1,71 @@
+import os
+
+import pytest
+
+import narrative
+from narrative import HEADER, NarrativeError, NarrativeTable, build, open_table, pack, parse
+
+SOURCE = """# Comments and blank lines are skipped
+
+== ending.win
+You made it.\\nAll the way.
+{name} lands.
+== a
+x
+== long
+""" + "\n".join(["The same long line, over and over."] * 40) + "\n"
+
+def test_parse():
+    entries = parse(SOURCE)
+    assert entries["ending.win"] == ("You made it.\nAll the way.", "{name} lands.")
+    assert entries["a"] == ("x",)
+    assert len(entries["long"]) == 40
+
+def test_parse_errors():
+    with pytest.raises(NarrativeError, match="Line 1: text before the first key"):
+        parse("stray\n== key\nline")
+    with pytest.raises(NarrativeError, match="Line 3: duplicate key 'key'"):
+        parse("== key\nline\n== key\nagain")
+
+def test_pack_round_trip():
+    entries = parse(SOURCE)
+    table = NarrativeTable(pack(entries))
+    assert len(table) == 3
+    for key, lines in entries.items():
+        assert key in table and table.lines(key) == lines
+    assert table.text("ending.win") == "You made it.\nAll the way.\n{name} lands."
+    assert "missing" not in table
+    with pytest.raises(KeyError):
+        table.lines("missing")
+    assert len(pack(entries)) < len(SOURCE)  # The repeated entry is compressed
+    assert len(NarrativeTable(pack({}))) == 0
+
+def test_bad_tables():
+    data = pack(parse(SOURCE))
+    with pytest.raises(NarrativeError, match="too short"):
+        NarrativeTable(data[:HEADER.size - 1])
+    with pytest.raises(NarrativeError, match="Not a narrative table"):
+        NarrativeTable(b"XXXX" + data[4:])
+    with pytest.raises(NarrativeError, match="Unsupported narrative table version"):
+        NarrativeTable(data[:4] + b"\x09\x00" + data[6:])
+
+def test_open_table_rebuilds_when_the_source_changes(tmp_path):
+    source, target = str(tmp_path / "narrative.txt"), str(tmp_path / "narrative.bin")
+    with open(source, "w", encoding="utf-8") as f:
+        f.write("== a\nfirst\n")
+    assert open_table(source, target).lines("a") == ("first",)
+    assert os.path.exists(target)
+
+    with open(source, "w", encoding="utf-8") as f:
+        f.write("== a\nsecond\n")
+    later = os.path.getmtime(target) + 10
+    os.utime(source, (later, later))
+    assert open_table(source, target).lines("a") == ("second",)
+
+def test_shipped_table_has_the_narration(tmp_path):
+    target = str(tmp_path / "narrative.bin")
+    assert build(narrative.SOURCE, target) > 0
+    with open(narrative.SOURCE, encoding="utf-8") as f:
+        entries = parse(f.read())
+    table = open_table(narrative.SOURCE, target)
+    assert all(table.lines(key) == lines for key, lines in entries.items())
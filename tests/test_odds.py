@@ -0,0 +1,63 @@
+import pytest
+
+from combat import ATTACK, CombatState, resolve_turn
+from enemies import ENEMY_TIERS, EnemyTier
+from odds import fight_odds
+from utils import GameRNG
+
+def test_one_round_win():
+    odds = fight_odds(50, 20, 0, 20, 5, 15)  # The enemy dies before it can swing
+    assert (odds.victory, odds.defeat, odds.expected_hp, odds.expected_turns) == (1.0, 0.0, 50.0, 1.0)
+
+def test_armor_absorbs_everything():
+    odds = fight_odds(10, 5, 20, 100, 5, 15)
+    assert odds.victory == pytest.approx(1.0)
+    assert odds.defeat == 0.0
+    assert odds.expected_hp == pytest.approx(10.0)
+    assert odds.expected_turns == pytest.approx(20.0)
+
+def test_one_swing_decides():
+    # One swing of 5-15 at 10 HP: 10 and up (6 of 11) kills, 5-9 leaves 5..1 HP
+    odds = fight_odds(10, 10, 0, 20, 5, 15)
+    assert odds.victory == pytest.approx(5 / 11)
+    assert odds.defeat == pytest.approx(6 / 11)
+    assert odds.expected_hp == pytest.approx(3.0)
+    assert odds.expected_turns == pytest.approx(1 * 6 / 11 + 2 * 5 / 11)
+
+def test_two_swings():
+    # 3 HP against two swings of 1-2: only 1 then 1 survives, with 1 HP; every loss comes in round 2
+    odds = fight_odds(3, 1, 0, 3, 1, 2)
+    assert (odds.victory, odds.defeat) == (pytest.approx(1 / 4), pytest.approx(3 / 4))
+    assert odds.expected_hp == pytest.approx(1.0)
+    assert odds.expected_turns == pytest.approx(2 * 3 / 4 + 3 * 1 / 4)
+
+def test_no_damage_dealt():
+    odds = fight_odds(10, 0, 0, 10, 1, 2)
+    assert (odds.victory, odds.defeat) == (0.0, 1.0)
+
+def test_already_dead():
+    for hp in (0, -5):
+        odds = fight_odds(hp, 20, 0, 20, 5, 15)
+        assert (odds.victory, odds.defeat, odds.expected_hp, odds.expected_turns) == (0.0, 1.0, 0.0, 0.0)
+
+def test_outcomes_add_up():
+    for args in ((100, 20, 5, 90, 10, 20), (60, 12, 0, 300, 25, 40), (1, 3, 2, 9, 1, 4)):
+        odds = fight_odds(*args)
+        assert odds.victory + odds.defeat == pytest.approx(1.0)
+
+def test_matches_played_fights():
+    hp, damage, armor, enemy_hp, low, high = 100, 20, 5, 110, 10, 30
+    odds = fight_odds(hp, damage, armor, enemy_hp, low, high)
+    rng = GameRNG(11)
+    start = CombatState(hp, hp, damage, armor, enemy_hp, low, high, 0,
+                        ENEMY_TIERS[EnemyTier.LOCAL_DEPUTY].drop_table, 1, (), False, False, None)
+    fights = 4000
+    wins = turns = 0
+    for _ in range(fights):
+        state = start
+        while state.outcome is None:
+            state, _ = resolve_turn(state, ATTACK, rng)
+            turns += 1
+        wins += state.outcome == "victory"
+    assert wins / fights == pytest.approx(odds.victory, abs=0.04)  # About 5 sigma
+    assert turns / fights == pytest.approx(odds.expected_turns, abs=0.1)
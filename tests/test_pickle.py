@@ -0,0 +1,66 @@
+import pickle
+
+from combat import (BountyHunter, Enemy, CombatItem, ENEMY_TEMPLATES, LOCAL_DEPUTY, MEDKIT,
+                    create_enemy, create_item)
+from enemies import EnemyTier
+from game_io import ScriptedIO
+from utils import DiceRoller, GameRNG
+
+def round_trip(value):
+    return pickle.loads(pickle.dumps(value))
+
+def test_templates_pickle_by_id():
+    assert round_trip(MEDKIT) is MEDKIT
+    assert round_trip(BountyHunter.HUNTERS[2]) is BountyHunter.HUNTERS[2]
+    assert b"Heals 30 HP" not in pickle.dumps(MEDKIT())
+
+def test_items_and_enemies_round_trip():
+    medkit = round_trip(create_item("medkit"))
+    assert (medkit.name, medkit.item_id) == ("Medkit", "medkit")
+    deputy = create_enemy("local_deputy", hp=12)
+    copy = round_trip(deputy)
+    assert (copy.name, copy.hp, copy.tier, copy.enemy_id) == ("Local Deputy", 12, EnemyTier.LOCAL_DEPUTY, "local_deputy")
+    assert LOCAL_DEPUTY().hp == ENEMY_TEMPLATES["local_deputy"].hp
+
+def test_unregistered_round_trip():
+    enemy = round_trip(Enemy("Cartel Goon", 40, 3, 9, 50, EnemyTier.CARTEL))
+    assert (enemy.name, enemy.hp, enemy.min_damage, enemy.max_damage, enemy.enemy_id) == ("Cartel Goon", 40, 3, 9, None)
+    item = round_trip(CombatItem("Flare", "Blinds", "flare"))
+    assert (item.name, item.description, item.item_id) == ("Flare", "Blinds", "flare")
+
+def test_stream_continues_after_pickle():
+    roller = DiceRoller("pickle")
+    for _ in range(20):  # Leave buffers part used, and past their first refill
+        roller.d6()
+        roller.unit()
+    copy = round_trip(roller)
+    assert [roller.d6() for _ in range(3000)] == [copy.d6() for _ in range(3000)]
+    assert [roller.unit() for _ in range(3000)] == [copy.unit() for _ in range(3000)]
+    assert roller.randint(1, 10 ** 9) == copy.randint(1, 10 ** 9)
+
+def test_stream_pickles_as_seed_and_words_drawn():
+    for label in ("pickle", 5, None):  # None seeds from the OS, so it keeps the full state
+        roller = DiceRoller(label)
+        roller.d6(n=3000)  # Several blocks of the Twister's 624 words in
+        roller.unit()
+        data = pickle.dumps(roller)
+        assert (len(data) < 1000) == (label is not None)
+        copy = pickle.loads(data)
+        assert [roller.unit() for _ in range(3000)] == [copy.unit() for _ in range(3000)]
+
+def test_rng_continues_after_pickle():
+    rng = GameRNG(9)
+    rng.combat.d20(n=5)
+    rng.loot.d100()
+    copy = round_trip(rng)
+    for name in GameRNG.STREAMS:
+        assert [rng.stream(name).d100() for _ in range(100)] == [copy.stream(name).d100() for _ in range(100)]
+
+def test_game_pickles_and_plays_on(start, finish):
+    game, io = start(3)
+    copy = round_trip(game)
+    assert finish(game) == finish(copy)
+    assert io.transcript == copy.io.transcript
+    finished = round_trip(game)
+    assert (finished.day, finished.player.credits, finished.player.heat) == (game.day, game.player.credits, game.player.heat)
+    assert len(pickle.dumps(game.fork(ScriptedIO()))) < 4000  # Streams pickle as seeds, not Twister states
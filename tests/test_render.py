@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from equipment import WEAPONS
+from game import Game
+from game_io import CLEAR_SCREEN, ScriptedIO, TerminalIO
+from render import BAR_LENGTH, WIDTH, bar, day_banner, status_lines
+
+def test_day_banner_is_centered_in_the_box():
+    top, middle, bottom = day_banner(12)
+    assert len(top) == len(middle) == len(bottom) == WIDTH + 2
+    left, right = middle[1:-1].split(" Day 12 ")
+    assert abs(len(left) - len(right)) <= 1
+
+def test_bars():
+    assert bar(0) == "[" + "░" * BAR_LENGTH + "]"
+    assert bar(5) == "[" + "█" * 5 + "░" * (BAR_LENGTH - 5) + "]"
+
+def test_status_lines():
+    game = Game(ScriptedIO(), seed=1)
+    lines = status_lines(game)
+    assert f"  Credits: {game.player.credits:,}" in lines
+    assert not any("Cartel Threat" in line for line in lines)  # Only once the cartel is after you
+    game.player.cartel_threat_level = 4
+    game.player.weapon = WEAPONS[0]
+    lines = status_lines(game)
+    assert f"  Cartel Threat:{bar(8)} 4/10" in lines
+    assert f"Weapon: {WEAPONS[0].name} +{WEAPONS[0].damage} damage" in lines
+
+@pytest.fixture
+def terminal(monkeypatch, capsys):
+    """terminal(ansi) -> (TerminalIO, read) on a 80x24 screen; read() returns what was written since"""
+    monkeypatch.setattr("shutil.get_terminal_size", lambda *args: os.terminal_size((80, 24)))
+    def terminal(ansi):
+        return TerminalIO(ansi=ansi), lambda: capsys.readouterr().out
+    return terminal
+
+def test_plain_frames_are_written_whole(terminal):
+    io, read = terminal(ansi=False)
+    io.frame(["a", "b"])
+    io.frame(["a", "c"])
+    assert read() == "a\nb\na\nc\n"
+
+def test_ansi_frames_patch_changed_lines(terminal):
+    io, read = terminal(ansi=True)
+    io.frame(["same", "old", "gone"])
+    assert read() == CLEAR_SCREEN + "same\nold\ngone\n"
+    io.frame(["same", "new"])
+    assert read() == "\x1b[2;1Hnew\x1b[K\x1b[3;1H\x1b[J"
+
+def test_scrolled_frames_are_redrawn(terminal):
+    io, read = terminal(ansi=True)
+    io.frame(["one", "two"])
+    io.print("\n" * 30)  # Pushes the frame off the screen
+    read()
+    io.frame(["one", "three"])
+    assert read() == CLEAR_SCREEN + "one\nthree\n"
+
+def test_frames_too_big_to_patch(terminal):
+    io, read = terminal(ansi=True)
+    io.frame(["x" * 90])  # Wraps, so its rows can't be addressed
+    read()
+    io.frame(["y"])
+    assert read().startswith(CLEAR_SCREEN)
+    io.clear()
+    read()
+    io.frame(["z"])
+    assert read().startswith(CLEAR_SCREEN)
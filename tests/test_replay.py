@@ -0,0 +1,54 @@
+import pytest
+
+from replay import HEADER, REPLAY_MAGIC, REPLAY_VERSION, Replay, ReplayError, play_back
+
+def record(start, finish, seed, **kwargs):
+    game, io = start(seed, **kwargs)
+    finish(game)
+    return game, Replay(seed, io.inputs)
+
+@pytest.fixture
+def recorded(start, finish):
+    """(game, replay) for the first seed whose game ends after day 5"""
+    for seed in range(200):
+        game, replay = record(start, finish, seed)
+        if game.result is not None and game.result.day > 5:
+            return game, replay
+    pytest.fail("No game lasted past day 5")
+
+def test_play_back_ends_the_same_way(recorded, snapshot):
+    game, replay = recorded
+    replayed = play_back(replay)
+    assert replayed.result is not None
+    assert (replayed.result.ending, replayed.result.day, replayed.result.credits, replayed.result.cause_of_death) == \
+           (game.result.ending, game.result.day, game.result.credits, game.result.cause_of_death)
+    assert snapshot(replayed) == snapshot(game)
+
+def test_play_back_until_day(recorded, start, finish, snapshot):
+    original, replay = recorded
+    partway, _ = record(start, finish, replay.seed, max_days=4)  # The policy stops at the first prompt of day 5
+    replayed = play_back(replay, until_day=5)
+    assert replayed.result is None
+    assert snapshot(replayed) == snapshot(partway)
+    assert snapshot(replayed) != snapshot(original)
+
+def test_file_round_trip(recorded, tmp_path):
+    _, replay = recorded
+    path = str(tmp_path / "game.rpl")
+    replay.save(path)
+    loaded = Replay.load(path)
+    assert (loaded.seed, loaded.answers) == (replay.seed, replay.answers)
+    assert Replay.loads(Replay(3, []).dumps()).answers == []
+
+def test_bad_files():
+    data = Replay(3, ["1", "2"]).dumps()
+    with pytest.raises(ReplayError, match="too short"):
+        Replay.loads(data[:HEADER.size - 1])
+    with pytest.raises(ReplayError, match="Not a replay file"):
+        Replay.loads(b"XXXX" + data[4:])
+    with pytest.raises(ReplayError, match="Unsupported replay version"):
+        Replay.loads(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION + 1, 3, 2) + data[HEADER.size:])
+    with pytest.raises(ReplayError, match="should hold 3 answers"):
+        Replay.loads(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, 3, 3) + data[HEADER.size:])
+    with pytest.raises(ReplayError, match="Corrupt"):
+        Replay.loads(data[:HEADER.size] + b"not zlib")
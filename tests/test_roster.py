@@ -0,0 +1,37 @@
+import pickle
+
+from combat import BountyHunter, BountyRoster
+from game_io import ScriptedIO
+from game import Game
+from utils import DiceRoller
+
+NAMES = [hunter.name for hunter in BountyHunter.HUNTERS]
+
+def test_eliminations_are_bits():
+    roster = BountyRoster()
+    assert roster.mark_eliminated(NAMES[0])
+    assert roster.mark_eliminated(NAMES[3])
+    assert roster.eliminated == 0b1001
+    assert roster.is_eliminated(NAMES[3]) and not roster.is_eliminated(NAMES[1])
+    assert not roster.mark_eliminated("Nobody")
+    assert not roster.is_eliminated("Nobody")
+    assert roster.eliminated == 0b1001
+
+def test_eliminated_hunters_never_return():
+    roster = BountyRoster(0b10110)
+    rng = DiceRoller(1)
+    names = {roster.get_random_hunter(rng).name for _ in range(200)}
+    assert names == {NAMES[0], NAMES[3]}
+
+def test_all_eliminated_falls_back():
+    roster = BountyRoster((1 << len(NAMES)) - 1)
+    assert roster.get_random_hunter(DiceRoller(1)).name == "Galactic Enforcer"
+
+def test_each_game_has_its_own_roster():
+    first, second = Game(ScriptedIO(), seed=1), Game(ScriptedIO(), seed=1)
+    first.bounty_roster.mark_eliminated(NAMES[2])
+    assert not second.bounty_roster.is_eliminated(NAMES[2])
+
+def test_roster_pickles_as_its_mask():
+    roster = pickle.loads(pickle.dumps(BountyRoster(0b101)))
+    assert roster.eliminated == 0b101 and roster.is_eliminated(NAMES[2])
@@ -0,0 +1,115 @@
+import pytest
+
+import savegame
+from equipment import ARMORS, WEAPONS
+from game import Game
+from game_io import ScriptedIO
+from savegame import HEADER, SaveError
+
+def comparable(data):
+    """Save bytes without the parts a reload always changes: epoch and time saved"""
+    fields = list(HEADER.unpack_from(data))
+    fields[2] = fields[9] = 0
+    return HEADER.pack(*fields) + data[HEADER.size:]
+
+def outfitted_game():
+    """A fresh game with something in every part of the save"""
+    game = Game(ScriptedIO(), seed=4)
+    player = game.player
+    player.name = "Tester"
+    player.credits, player.heat, player.cartel_threat_level = 12345, 40, 2
+    player.weapon, player.armor_item = WEAPONS[6], ARMORS[2]
+    player.stones, player.stones_discovered = ["Mind"], ["Mind"]
+    player.inventory.append({"name": "Stolen Goods", "value": 900, "is_contraband": True})
+    game.ship.cargo = ["Spare Parts"]
+    game.current_hub.generate_contracts(3, game.rng)
+    crate = game.current_hub.available_contracts[0].crates[0]
+    crate.is_opened, crate.is_stone, crate.stone_type, crate.contents = True, True, "Soul", "Soul Stone"
+    player.current_contract = game.current_hub.available_contracts[1]
+    game.bounty_roster.eliminated = 5
+    game.day = 9
+    return game
+
+@pytest.fixture
+def played(start, finish):
+    """played(max_days) -> (seed, game) for the first seed still flying after max_days"""
+    def played(max_days):
+        for seed in range(200):
+            game, _ = start(seed, max_days=max_days)
+            if finish(game) == "TIMEOUT":
+                return seed, game
+        pytest.fail(f"No game lasted {max_days} days")
+    return played
+
+def test_round_trip_keeps_every_field():
+    game = outfitted_game()
+    data = savegame.dumps(game)
+    loaded = savegame.loads(data, ScriptedIO())
+    assert comparable(savegame.dumps(loaded)) == comparable(data)
+
+    player = loaded.player
+    assert (loaded.day, player.name, player.credits, player.heat) == (9, "Tester", 12345, 40)
+    assert player.weapon is WEAPONS[6] and player.armor_item is ARMORS[2]
+    assert player.stones == ["Mind"] and player.stones_discovered == ["Mind"]
+    assert player.inventory == game.player.inventory
+    assert player.current_contract is loaded.current_hub.available_contracts[1]
+    assert loaded.current_hub.available_contracts[0].crates[0].stone_type == "Soul"
+    assert loaded.bounty_roster.eliminated == 5
+    assert loaded.ship.cargo == ["Spare Parts"]
+    assert loaded.rng.seed == game.rng.seed and loaded.rng.epoch == game.rng.epoch + 1
+
+def test_round_trip_of_a_played_game(played):
+    _, game = played(8)
+    data = savegame.dumps(game)
+    assert comparable(savegame.dumps(savegame.loads(data, ScriptedIO()))) == comparable(data)
+
+def test_loaded_game_continues_the_same_way(played, start, finish):
+    seed, game = played(8)
+    data = savegame.dumps(game)
+    transcripts = []
+    for _ in range(2):
+        loaded, io = start(seed, savegame.loads(data, ScriptedIO()))
+        finish(loaded, setup=False)
+        transcripts.append(io.transcript)
+    assert transcripts[0] == transcripts[1]
+    assert len(transcripts[0]) > 10
+
+def test_save_files(tmp_path):
+    game = outfitted_game()
+    path = savegame.save_path(game.player.name, str(tmp_path))
+    savegame.save_game(game, path)
+    header = savegame.read_header(path)
+    assert (header.name, header.day, header.credits, header.stones) == ("Tester", 9, 12345, 1)
+    assert [h.name for h in savegame.list_saves(str(tmp_path))] == ["Tester"]
+    assert savegame.load_game(path, ScriptedIO()).player.credits == 12345
+
+def test_cargo_number_and_long_names(tmp_path):
+    game = outfitted_game()
+    game.ship.cargo = 5  # What the need4speed code leaves behind
+    game.player.name = "Captain Aurelio Vantablack-Okonkwo III"
+    path = str(tmp_path / "long.sav")
+    savegame.save_game(game, path)
+    assert savegame.read_header(path).name == game.player.name
+    loaded = savegame.load_game(path, ScriptedIO())
+    assert (loaded.player.name, loaded.ship.cargo) == (game.player.name, 5)
+
+def test_bad_header():
+    data = savegame.dumps(outfitted_game())
+    with pytest.raises(SaveError, match="too short"):
+        savegame.loads(data[:HEADER.size - 1])
+    with pytest.raises(SaveError, match="too short"):
+        savegame.loads(data[:HEADER.size + 4])  # Cut off inside the name
+    with pytest.raises(SaveError, match="Not a save file"):
+        savegame.loads(b"XXXX" + data[4:])
+
+def test_unsupported_version():
+    data = savegame.dumps(outfitted_game())
+    fields = list(HEADER.unpack_from(data))
+    fields[1] = savegame.SAVE_VERSION + 1
+    with pytest.raises(SaveError, match="Unsupported save version"):
+        savegame.loads(HEADER.pack(*fields) + data[HEADER.size:])
+
+def test_truncated_body():
+    data = savegame.dumps(outfitted_game())
+    with pytest.raises(SaveError, match="Corrupt save file"):
+        savegame.loads(data[:HEADER.size + 10], ScriptedIO())
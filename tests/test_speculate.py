@@ -0,0 +1,91 @@
+import sys
+
+import speculate
+from game import Game
+from game_io import ScriptedIO
+from speculate import MISSING, STEPS, Speculator
+from utils import lazy_import
+
+class IdleIO(ScriptedIO):
+    """Scripted IO that goes idle at every pause, the way TerminalIO does"""
+
+    def wait_for_enter(self):
+        if self.on_idle is not None:
+            self.on_idle()
+
+class CountingSpeculator(Speculator):
+    hits = 0
+
+    def take(self, kind, inputs):
+        value = super().take(kind, inputs)
+        if value is not MISSING:
+            self.hits += 1
+        return value
+
+def test_speculation_doesnt_change_the_game(start, finish):
+    hits = 0
+    for seed in range(5):
+        plain, plain_io = start(seed, io_class=IdleIO)
+        plain_ending = finish(plain)
+
+        game, io = start(seed, io_class=IdleIO)
+        speculator = CountingSpeculator(game)
+        speculator.attach(io.inner)
+        assert finish(game) == plain_ending
+        assert io.transcript == plain_io.transcript
+        hits += speculator.hits
+    assert hits > 0  # Or the comparison proves nothing
+
+def test_take_continues_from_the_workers_streams():
+    game = Game(ScriptedIO(), seed=3)
+    inputs = STEPS["trip"].guesses(game)[0]
+    on_the_spot = game.rng.fork()
+    expected = STEPS["trip"].compute(on_the_spot, *inputs)
+
+    speculator = Speculator(game)
+    speculator.attach(ScriptedIO())
+    speculator.start()
+    assert speculate.precomputed(game, "trip", *inputs) == expected
+    assert [game.rng.encounters.d100() for _ in range(20)] == [on_the_spot.encounters.d100() for _ in range(20)]
+
+def test_stale_results_are_dropped():
+    game = Game(ScriptedIO(), seed=3)
+    inputs = STEPS["trip"].guesses(game)[0]
+    speculator = Speculator(game)
+    speculator.start()
+    game.rng.encounters.d6()  # The game rolled the stream after the worker started from it
+    assert speculator.take("trip", inputs) is MISSING
+
+    speculator.start()
+    assert speculator.take("trip", (0.0,) + inputs[1:]) is MISSING  # Inputs nobody guessed
+
+def sharers(game):
+    return {name: stream.sharers for name, stream in game.rng._streams.items()}
+
+def test_shares_are_given_back():
+    game = Game(ScriptedIO(), seed=3)
+    for name in game.rng.STREAMS:
+        game.rng.stream(name)  # Create every stream, so there is something to share
+    alone = sharers(game)
+    speculator = Speculator(game)
+    speculator.start()
+    speculator.take("contracts", STEPS["contracts"].guesses(game)[0])
+    assert sharers(game)["loot"] == 2  # Where the contract board left it; restock still holds it
+    speculator.take("restock", ())
+    speculator.take("trip", STEPS["trip"].guesses(game)[0])
+    assert sharers(game) == alone
+
+    speculator.start()
+    game.rng.encounters.d6()  # Stale: the next start() rolls everything again
+    speculator.start()
+    speculator.cancel()
+    assert sharers(game) == alone
+
+def test_lazy_modules_load_before_the_worker_starts(monkeypatch):
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    module = lazy_import("colorsys")
+    assert type(module).__name__ == "_LazyModule"
+    speculator = Speculator(Game(ScriptedIO(), seed=3))
+    speculator.start()
+    assert type(module).__name__ == "module"
+    speculator.cancel()
@@ -0,0 +1,65 @@
+import pickle
+
+import pytest
+
+from game import Player, Ship
+
+@pytest.fixture
+def events():
+    """(player, list of the (field, old, new, cause) events it sends)"""
+    player, seen = Player(), []
+    player.subscribe(lambda *event: seen.append(event))
+    return player, seen
+
+def test_changes_are_reported(events):
+    player, seen = events
+    player.heat += 5
+    player.update("bribe", credits=400, heat=0)
+    assert seen == [("heat", 0, 5, None), ("credits", 500, 400, "bribe"), ("heat", 5, 0, "bribe")]
+
+def test_unchanged_values_are_quiet(events):
+    player, seen = events
+    player.update("nothing", credits=player.credits)
+    player.name = "Rex"  # Not observed
+    assert seen == []
+
+def test_lists_are_replaced(events):
+    player, seen = events
+    before = player.stones
+    player.take_stone("Mind", "crate")
+    assert seen == [("stones", [], ["Mind"], "crate")]
+    assert before == [] and player.stones == ["Mind"]
+
+def test_subscribe_to_some_fields():
+    ship, seen = Ship(), []
+    ship.subscribe(lambda *event: seen.append(event[:3]), ("fuel",))
+    ship.speed += 1
+    ship.fuel += 2
+    assert seen == [("fuel", 0, 2)]
+    with pytest.raises(ValueError, match="Ship.cargo isn't observed"):
+        ship.subscribe(print, ("cargo",))
+    with pytest.raises(ValueError, match="Ship.cargo isn't observed"):
+        ship.update(cargo=[])
+
+def test_unsubscribe(events):
+    player, seen = events
+    watcher = seen.append
+    player.subscribe(watcher, ("hp",))
+    player.unsubscribe(watcher)
+    player.hp -= 1
+    assert len(seen) == 1  # Only the fixture's observer
+
+def test_copies_have_no_observers(events):
+    player, seen = events
+    player.name = "Rex"
+    clone = player.copy()
+    clone.credits += 1
+    assert seen == []
+    assert (clone.name, clone.credits, player.credits) == ("Rex", 501, 500)
+
+def test_slots_only():
+    player = Player()
+    with pytest.raises(AttributeError):
+        player.nickname = "Rex"
+    copy = pickle.loads(pickle.dumps(Player()))
+    assert (copy.hp, copy.credits, copy.stones) == (100, 500, [])
@@ -0,0 +1,46 @@
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from equipment import WEAPONS, ARMORS
+from odds import ENEMY_FACTORIES, fight_odds
+import sweep as sweep_module
+from sweep import Loadout, Opponent, all_loadouts, all_opponents, sweep
+
+FIGHTS = 4000
+
+def test_shapes():
+    loadouts, opponents = all_loadouts()[:3], all_opponents()[:4]
+    result = sweep(loadouts, opponents, fights=10)
+    assert result.win_rate.shape == result.mean_turns.shape == (3, 4)
+    assert "Combat sweep" in result.format(limit=2)
+
+def test_matches_exact_odds():
+    loadouts = [Loadout(), Loadout(WEAPONS[0], ARMORS[0]), Loadout(WEAPONS[-1], ARMORS[-1])]
+    enemies = [factory() for factory in ENEMY_FACTORIES]
+    result = sweep(loadouts, [Opponent(enemy.name, [enemy]) for enemy in enemies], fights=FIGHTS, seed=3)
+    for i, loadout in enumerate(loadouts):
+        for j, enemy in enumerate(enemies):
+            odds = fight_odds(100, loadout.damage(10), loadout.armor(), enemy.hp, enemy.min_damage, enemy.max_damage)
+            assert result.win_rate[i, j] == pytest.approx(odds.victory, abs=0.04)  # About 5 sigma
+            assert result.mean_turns[i, j] == pytest.approx(odds.expected_turns, rel=0.05)
+
+def test_armor_absorbs_everything():
+    enemy = ENEMY_FACTORIES[-1]()
+    plate = SimpleNamespace(name="Plate", defense=enemy.max_damage)
+    result = sweep([Loadout(armor_item=plate)], [Opponent(enemy.name, [enemy] * 3)], fights=50)
+    assert result.win_rate[0, 0] == 1.0
+    assert result.mean_turns[0, 0] == 3 * -(-enemy.hp // 10)
+
+def test_gauntlet_is_harder():
+    enemy = ENEMY_FACTORIES[1]()
+    result = sweep([Loadout()], [Opponent("one", [enemy]), Opponent("three", [enemy] * 3)], fights=FIGHTS)
+    assert result.win_rate[0, 1] < result.win_rate[0, 0]
+    assert result.mean_turns[0, 1] > result.mean_turns[0, 0]
+
+def test_needs_numpy(monkeypatch):
+    monkeypatch.setattr(sweep_module, "np", None)
+    with pytest.raises(RuntimeError, match="needs NumPy"):
+        sweep(all_loadouts()[:1], all_opponents()[:1], fights=1)
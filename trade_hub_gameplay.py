@@ -1,43 +1,40 @@
 from flavor import get_random_trade_quote, get_random_cargo_quote, generate_trade_hub_name
 from shop import TradeHubShop
-import random
-from utils import DiceRoller
 from fights import PoliceEncounter
 
-def wait_for_enter():
-    input("\n...\n")
-
 def handle_trade_hub(game):
     """Handles all trade hub interactions. Takes the game instance to access player, ship, and hub."""
-    hub_name, hub_type = generate_trade_hub_name()
-    wait_for_enter()
+    from speculate import precomputed  # Imports contracts, which imports this module
+    io = game.io
+    hub_name, hub_type = generate_trade_hub_name(io, game.rng.flavor)
+    io.wait_for_enter()
 
 
-    #print("\nYou enter at the trade hub...")
-    #wait_for_enter()
+    #io.print("\nYou enter at the trade hub...")
+    #io.wait_for_enter()
 
     # Police encounter before entering the trade hub, based on heat
     if game.player.heat > 0:
-        print("\nAs you prepare to enter the trade hub, flashing lights appear outside your viewport.")
-        #wait_for_enter()
+        io.print("\nAs you prepare to enter the trade hub, flashing lights appear outside your viewport.")
+        #io.wait_for_enter()
         heat_before = game.player.heat
         police_result = PoliceEncounter(game).run()
         if police_result == "game_over":
             return  # Player defeated or arrested
         elif police_result is not None:  # Player ran/escaped
-            print("\nYou blast off, evading the authorities.")
-            wait_for_enter()
+            io.print("\nYou blast off, evading the authorities.")
+            io.wait_for_enter()
             return  # Do not enter the trade hub
         heat_after = game.player.heat
         if heat_after - heat_before > 10:
-            print("\nAfter a violent incident with the authorities, you land your ship amidst tense stares and hushed whispers...")
+            io.print("\nAfter a violent incident with the authorities, you land your ship amidst tense stares and hushed whispers...")
         else:
-            print("\nThe authorities clear you to land. You exit your ship and enter the bustling trade hub...")
-        wait_for_enter()
+            io.print("\nThe authorities clear you to land. You exit your ship and enter the bustling trade hub...")
+        io.wait_for_enter()
 
     
     # Generate contracts based on ship's cargo capacity
-    game.current_hub.generate_contracts(game.ship.max_cargo)
+    game.current_hub.available_contracts = precomputed(game, "contracts", game.ship.max_cargo)
 
     #encounter
 
@@ -63,8 +60,8 @@ def handle_trade_hub(game):
 
     price_ranges = [(30,45), (46,60), (61,75), (76,85), (86,100)]
     
-    selected_range = price_ranges[DiceRoller.weighted_choice(weights)]
-    game.current_hub.fuel_price = random.randint(selected_range[0], selected_range[1])
+    selected_range = price_ranges[game.rng.contracts.weighted_choice(weights)]
+    game.current_hub.fuel_price = game.rng.contracts.randint(selected_range[0], selected_range[1])
     
     # STARTING FUEL SAFETY CHECK: Prevent impossible starts
     # If player has very low fuel (0-2) and limited credits, cap fuel price to ensure viability
@@ -72,7 +69,7 @@ def handle_trade_hub(game):
         max_affordable_fuel = game.player.credits // game.current_hub.fuel_price
         if max_affordable_fuel < 8:  # Need at least 8 fuel units for viable gameplay
             # Cap fuel price to ensure player can afford at least 8 units
-            print(f"[NOVA] 'Looks like the fuel prices just dropped. Lucky break, {game.player.name}.'")
+            io.print(f"[NOVA] 'Looks like the fuel prices just dropped. Lucky break, {game.player.name}.'")
             max_safe_price = game.player.credits // 8
             if game.current_hub.fuel_price > max_safe_price and max_safe_price >= 30:
                 game.current_hub.fuel_price = max(max_safe_price, 30)  # Don't go below 30 credits
@@ -82,8 +79,15 @@ def handle_trade_hub(game):
                 game.current_hub.fuel_price = 30
 
     # Create shop instance
-    shop = TradeHubShop()
-    
+    shop = TradeHubShop(io, game.rng, precomputed(game, "restock"))
+    hub_menu(game, hub_type, shop)
+
+def hub_menu(game, hub_type, shop=None):
+    """The trade hub's main menu, until the player leaves (or gets sent off)"""
+    io = game.io
+    if shop is None:
+        shop = TradeHubShop(io, game.rng)
+
     # Fuel flavor lines by hub type
     FUEL_FLAVOR = {
         "slum": "A grimy attendant wipes their hands. 'Fuel's cheap, but don't ask what we cut it with.'",
@@ -93,22 +97,22 @@ def handle_trade_hub(game):
         "blacksite": "A silent drone monitors you as you refuel from the military-grade pumps.",
     }
     while True:
-        print("\n=== Trade Hub ===")
-        print(f"Your Credits: {game.player.credits:,}")
-        print(f"Your Fuel: {game.ship.fuel}/{game.ship.max_fuel}")
-        print("\nOptions:")
-        print("1. View Available Contracts")
-        print(f"2. Buy Fuel")
-        print("3. Visit Equipment Shop | Sell Goods")
-        print("4. Ship Upgrades")
-        print("\n0. Leave Trade Hub")
+        io.print("\n=== Trade Hub ===")
+        io.print(f"Your Credits: {game.player.credits:,}")
+        io.print(f"Your Fuel: {game.ship.fuel}/{game.ship.max_fuel}")
+        io.print("\nOptions:")
+        io.print("1. View Available Contracts")
+        io.print(f"2. Buy Fuel")
+        io.print("3. Visit Equipment Shop | Sell Goods")
+        io.print("4. Ship Upgrades")
+        io.print("\n0. Leave Trade Hub")
         
         try:
-            choice = int(input("\nEnter your choice (1-4) or 0 to leave: "))
+            choice = int(io.input("\nEnter your choice (1-4) or 0 to leave: "))
             if choice == 1:
                 if game.player.current_contract:
-                    print("You already have an active contract! The hub's fixers don't like double-dealing.")
-                    wait_for_enter()
+                    io.print("You already have an active contract! The hub's fixers don't like double-dealing.")
+                    io.wait_for_enter()
                 else:
                     # INSERT_YOUR_CODE
                     # Add some flavor when viewing contracts, random and affected by hub type
@@ -140,78 +144,85 @@ def handle_trade_hub(game):
                         ]
                     }
                     if hub_type in CONTRACT_FLAVOR:
-                        print(f"\n{random.choice(CONTRACT_FLAVOR[hub_type])}")
+                        io.print(f"\n{game.rng.flavor.choice(CONTRACT_FLAVOR[hub_type])}")
                     else:
-                        print("\nA bored clerk slides a contract list across the counter.")
-                    wait_for_enter()
-                    game.current_hub.display_contracts()
+                        io.print("\nA bored clerk slides a contract list across the counter.")
+                    io.wait_for_enter()
+                    game.current_hub.display_contracts(io)
                     try:
-                        contract_choice = int(input("\nSelect contract (1-3) or 0 to cancel: "))
+                        answer = io.input("\nSelect contract (1-3) or 0 to cancel: ")
+                        while answer.strip().lower() == "recommend":  # Ask as often as you like
+                            options = [(f"Contract {i}", ("contract", i - 1, hub_type))
+                                       for i in range(1, len(game.current_hub.available_contracts) + 1)]
+                            game.recommend(options + [("No contract", ("contract", None, hub_type))])
+                            answer = io.input("\nSelect contract (1-3) or 0 to cancel: ")
+                        contract_choice = int(answer)
                         if 1 <= contract_choice <= 3:
                             contract = game.current_hub.available_contracts[contract_choice - 1]
                             if contract.accept(game):
-                                print(f"\nContract accepted. {get_random_cargo_quote()}")
-                                wait_for_enter()
+                                io.print(f"\nContract accepted. {get_random_cargo_quote(game.rng.flavor)}")
+                                io.wait_for_enter()
                     except ValueError:
-                        print("Invalid choice")
+                        io.print("Invalid choice")
             elif choice == 2:
                 max_possible = min(
                     game.ship.max_fuel - game.ship.fuel,  # Space left in tank
                     game.player.credits // game.current_hub.fuel_price  # What you can afford
                 )
                 if hub_type in FUEL_FLAVOR:
-                    print(f"\n{FUEL_FLAVOR[hub_type]}")
-                    #wait_for_enter()
+                    io.print(f"\n{FUEL_FLAVOR[hub_type]}")
+                    #io.wait_for_enter()
                 if max_possible <= 0:
                     if game.ship.fuel >= game.ship.max_fuel:
-                        print("Your fuel tank is already full. The attendant shrugs and moves on.")
+                        io.print("Your fuel tank is already full. The attendant shrugs and moves on.")
                     else:
-                        print("You can't afford any fuel. Maybe try your luck in the alleys.")
-                    wait_for_enter()
+                        io.print("You can't afford any fuel. Maybe try your luck in the alleys.")
+                    io.wait_for_enter()
                     continue
                 
-                print(f"\nYou can buy up to {max_possible} units of fuel.")
-                print(f"Current price per unit: {game.current_hub.fuel_price} credits")
-                print(f"Your credits: {game.player.credits:,}")
+                io.print(f"\nYou can buy up to {max_possible} units of fuel.")
+                io.print(f"Current price per unit: {game.current_hub.fuel_price} credits")
+                io.print(f"Your credits: {game.player.credits:,}")
                 
                 try:
-                    amount = int(input(f"\nHow many units would you like to buy (0-{max_possible})? "))
+                    amount = int(io.input(f"\nHow many units would you like to buy (0-{max_possible})? "))
                     if 0 <= amount <= max_possible:
                         cost = amount * game.current_hub.fuel_price
                         if game.current_hub.refuel_ship(game.player, game.ship, amount):
-                            print(f"\nThe fuel pumps whir to life...")
-                            print(f"Added {amount} units of fuel for {cost} credits")
-                            print(f"Credits remaining: {game.player.credits:,}")
-                            wait_for_enter()
+                            io.print(f"\nThe fuel pumps whir to life...")
+                            io.print(f"Added {amount} units of fuel for {cost} credits")
+                            io.print(f"Credits remaining: {game.player.credits:,}")
+                            io.wait_for_enter()
                     else:
-                        print("Invalid amount!")
-                        wait_for_enter()
+                        io.print("Invalid amount!")
+                        io.wait_for_enter()
                 except ValueError:
-                    print("Invalid input!")
-                    wait_for_enter()
+                    io.print("Invalid input!")
+                    io.wait_for_enter()
             elif choice == 3:
                 # Visit equipment shop
-                print("\nYou enter the Trade Hub's licensed equipment shop...")
-                #wait_for_enter()
+                io.print("\nYou enter the Trade Hub's licensed equipment shop...")
+                #io.wait_for_enter()
                 shop.shop_menu(game, hub_type)
             elif choice == 4:
                 # Ship upgrades
                 handle_ship_upgrades(game)
             elif choice == 0:
-                print("\nYou leave the Trade Hub...")
+                io.print("\nYou leave the Trade Hub...")
                 # INSERT_YOUR_CODE
-                print("\nYou head back to your ship, engines roaring as you leave the trade hub and its secrets behind.")
-                wait_for_enter()
+                io.print("\nYou head back to your ship, engines roaring as you leave the trade hub and its secrets behind.")
+                io.wait_for_enter()
                 if game.ship.fuel < 2:
-                    print("\nWarning: Low fuel! The void doesn't forgive mistakes.")
-                    wait_for_enter()
+                    io.print("\nWarning: Low fuel! The void doesn't forgive mistakes.")
+                    io.wait_for_enter()
                 return
         except ValueError:
-            print("Invalid choice")
-            wait_for_enter()
+            io.print("Invalid choice")
+            io.wait_for_enter()
 
 def handle_ship_upgrades(game):
     """Handle ship upgrade menu and purchases"""
+    io = game.io
     ship = game.ship
     player = game.player
     
@@ -222,73 +233,73 @@ def handle_ship_upgrades(game):
         cargo_cost = 5000 * (3 ** (ship.max_cargo - 3))  # Base 5000, triples each level
         fuel_cost = 3000 * (3 ** (ship.max_fuel // 5 - 1))  # Base 4000, triples each level
         
-        print("\n=== SHIP UPGRADES ===")
-        print(f"Your Credits: {player.credits:,}")
-        print("\nCurrent Ship Stats:")
-        print(f"Speed: {ship.speed}")
-        print(f"Cargo Hold: {ship.max_cargo} slots")
-        print(f"Fuel Tank: {ship.max_fuel} units")
-        print("\nAvailable Upgrades:")
+        io.print("\n=== SHIP UPGRADES ===")
+        io.print(f"Your Credits: {player.credits:,}")
+        io.print("\nCurrent Ship Stats:")
+        io.print(f"Speed: {ship.speed}")
+        io.print(f"Cargo Hold: {ship.max_cargo} slots")
+        io.print(f"Fuel Tank: {ship.max_fuel} units")
+        io.print("\nAvailable Upgrades:")
         
         # Show available upgrades based on current levels
         if ship.speed < 5:
-            print(f"1. Increase Speed ({ship.speed} → {ship.speed + 1}) - {speed_cost:,} credits")
+            io.print(f"1. Increase Speed ({ship.speed} → {ship.speed + 1}) - {speed_cost:,} credits")
         else:
-            print("1. Speed (MAX)")
+            io.print("1. Speed (MAX)")
             
         if ship.max_cargo < 5:
-            print(f"2. Expand Cargo Hold ({ship.max_cargo} → {ship.max_cargo + 1} slots) - {cargo_cost:,} credits")
+            io.print(f"2. Expand Cargo Hold ({ship.max_cargo} → {ship.max_cargo + 1} slots) - {cargo_cost:,} credits")
         else:
-            print("2. Cargo Hold (MAX)")
+            io.print("2. Cargo Hold (MAX)")
             
         if ship.max_fuel < 20:
-            print(f"3. Upgrade Fuel Tank ({ship.max_fuel} → {ship.max_fuel + 5} units) - {fuel_cost:,} credits")
+            io.print(f"3. Upgrade Fuel Tank ({ship.max_fuel} → {ship.max_fuel + 5} units) - {fuel_cost:,} credits")
         else:
-            print("3. Fuel Tank (MAX)")
+            io.print("3. Fuel Tank (MAX)")
             
-        print("\n0. Back")
+        io.print("\n0. Back")
         
         try:
-            choice = int(input("\nSelect upgrade (0-3): "))
+            choice = int(io.input("\nSelect upgrade (0-3): "))
             
             if choice == 0:
 
-                print("\nYou go back the Trade Hub...")
-                wait_for_enter()
+                io.print("\nYou go back the Trade Hub...")
+                io.wait_for_enter()
                 return
                 
             if choice == 1 and ship.speed < 5:
                 if player.credits >= speed_cost:
                     player.credits -= speed_cost
                     ship.speed += 1
-                    print(f"\nSpeed upgraded to {ship.speed}!")
-                    wait_for_enter()
+                    io.print(f"\nSpeed upgraded to {ship.speed}!")
+                    io.wait_for_enter()
                 else:
-                    print("\nNot enough credits!")
-                    wait_for_enter()
+                    io.print("\nNot enough credits!")
+                    io.wait_for_enter()
                     
             elif choice == 2 and ship.max_cargo < 5:
                 if player.credits >= cargo_cost:
                     player.credits -= cargo_cost
                     ship.max_cargo += 1
-                    print(f"\nCargo hold expanded to {ship.max_cargo} slots!")
-                    print("\nYou'll need to visit another trade hub to get contracts for your expanded cargo capacity.")
-                    wait_for_enter()
+                    io.print(f"\nCargo hold expanded to {ship.max_cargo} slots!")
+                    io.print("\nYou'll need to visit another trade hub to get contracts for your expanded cargo capacity.")
+                    io.wait_for_enter()
                 else:
-                    print("\nNot enough credits!")
-                    wait_for_enter()
+                    io.print("\nNot enough credits!")
+                    io.wait_for_enter()
                     
             elif choice == 3 and ship.max_fuel < 20:
                 if player.credits >= fuel_cost:
                     player.credits -= fuel_cost
                     ship.max_fuel += 5
                     ship.fuel = min(ship.fuel, ship.max_fuel)  # Adjust current fuel if needed
-                    print(f"\nFuel tank upgraded to {ship.max_fuel} units!")
-                    wait_for_enter()
+                    io.print(f"\nFuel tank upgraded to {ship.max_fuel} units!")
+                    io.wait_for_enter()
                 else:
-                    print("\nNot enough credits!")
-                    wait_for_enter()
+                    io.print("\nNot enough credits!")
+                    io.wait_for_enter()
                     
         except ValueError:
-            print("\nInvalid choice.")
-            wait_for_enter() 
\ No newline at end of file
+            io.print("\nInvalid choice.")
+            io.wait_for_enter() 
\ No newline at end of file
@@ -1,57 +1,364 @@
+import importlib.util
 import random
+import sys
+from functools import lru_cache
 
-class DiceRoller:
-
-    @staticmethod
-    def d100():
-        return random.randint(1, 100)
-    
-    @staticmethod
-    def d20():
-        return random.randint(1, 20)
-    
-    @staticmethod
-    def d12():
-        return random.randint(1, 12)
-    
-    @staticmethod
-    def d10():
-        return random.randint(1, 10)
-    
-    @staticmethod
-    def d8():
-        return random.randint(1, 8)
-    
-    @staticmethod
-    def d6():
-        return random.randint(1, 6)
-    
-    
-    @staticmethod
-    def chance(probability):
-        """Return True with given probability (0-1)"""
-        return random.random() < probability
-    
-    @staticmethod
-    def weighted_choice(weights):
+def lazy_import(name):
+    """Return a module that is only loaded on first attribute access.
+
+    Returns None if the module isn't installed, so optional dependencies
+    keep the usual `if np is None` checks.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return None
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def load_lazy_modules():
+    """Finish loading every module lazy_import handed out that hasn't loaded yet.
+
+    The lazy loader isn't thread-safe, so call this before starting a
+    thread that might be the first to touch one.
+    """
+    while True:
+        pending = [module for module in list(sys.modules.values()) if type(module).__name__ == "_LazyModule"]
+        if not pending:
+            return
+        for module in pending:
+            dir(module)  # Any attribute access loads it
+
+# NumPy is optional; batch rolls then come back as lists. Loaded by the
+# first large batch rather than at startup, since it costs more than the
+# whole game.
+np = lazy_import("numpy")
+
+class AliasSampler:
+    """Walker's alias table for drawing indices from a fixed weight vector.
+
+    Built once in O(k); every draw afterwards costs one uniform roll and a
+    table lookup, however many options there are.
+    """
+
+    def __init__(self, weights):
+        k = len(weights)
+        total = sum(weights)
+        if k == 0 or total <= 0:
+            raise ValueError("weights must contain at least one positive weight")
+        self.size = k
+        self.probability = [1.0] * k
+        self.alias = list(range(k))
+
+        scaled = [weight * k / total for weight in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            low, high = small.pop(), large.pop()
+            self.probability[low] = scaled[low]
+            self.alias[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            (small if scaled[high] < 1.0 else large).append(high)
+        # Whatever is left is 1.0 up to rounding error and keeps its own index
+        self._np_tables = None  # (probability, alias) arrays, made by the first batch
+
+    def sample(self, u):
+        """Map one uniform roll in [0, 1) to an index"""
+        u *= self.size
+        i = int(u)
+        return i if u - i < self.probability[i] else self.alias[i]
+
+    def sample_many(self, rolls):
+        """Map a batch of uniform rolls (a list or an array) to indices"""
+        if isinstance(rolls, list):
+            return [self.sample(u) for u in rolls]
+        if self._np_tables is None:
+            self._np_tables = (np.array(self.probability), np.array(self.alias))
+        probability, alias = self._np_tables
+        scaled = rolls * self.size
+        column = scaled.astype(np.intp)
+        keep = (scaled - column) < probability[column]
+        return np.where(keep, column, alias[column])
+
+@lru_cache(maxsize=256)
+def alias_sampler(weights):
+    """Return the (cached) AliasSampler for a tuple of weights"""
+    return AliasSampler(weights)
+
+class DiceRoller(random.Random):
+    """A seedable random stream with the game's dice helpers.
+
+    Being a random.Random, it also offers randint(), choice(), uniform() etc.
+
+    Every dice helper takes an optional n: without it a single roll is
+    returned, with it a batch of n rolls. Batches of NUMPY_BATCH or more come
+    back as a NumPy array when NumPy is installed, smaller ones as a list,
+    so the handful of rolls a turn batches never loads NumPy. Single rolls
+    are served from buffers refilled in growing blocks of up to BUFFER_SIZE
+    rolls.
+    """
+    BUFFER_SIZE = 1024
+    FIRST_REFILL = 16
+    NUMPY_BATCH = 32  # Below this, randint() in a loop beats NumPy's call overhead
+
+    REPLAY_LIMIT = 1 << 20  # Words drawn past which a pickle keeps the full state instead
+
+    def seed(self, a=None, version=2):
+        super().seed(a, version)
+        self.label = a  # What the stream was seeded with, for compact pickles
+        self.sharers = 1  # GameRNG forks using this object (see GameRNG.fork)
+        self._generator = None  # NumPy generator, derived from this stream on first use
+        self._buffers = {}  # sides (or "u" for uniforms) -> rolls left, in pop order
+        self._refill_sizes = {}
+
+    def getstate(self):
+        generator_state = self._generator.bit_generator.state if self._generator is not None else None
+        buffers = {key: list(values) for key, values in self._buffers.items()}
+        return (super().getstate(), generator_state, buffers, dict(self._refill_sizes), self.sharers, self.label)
+
+    def setstate(self, state):
+        base_state, generator_state, buffers, refill_sizes, self.sharers, self.label = state
+        super().setstate(base_state)
+        self._generator = None
+        if generator_state is not None:
+            # Build the generator directly: _numpy_generator() would draw from the state just restored
+            self._generator = np.random.Generator(np.random.PCG64())
+            self._generator.bit_generator.state = generator_state
+        self._buffers = {key: list(values) for key, values in buffers.items()}
+        self._refill_sizes = dict(refill_sizes)  # Block sizes decide which rolls come next too
+
+    def __reduce__(self):
+        # The Twister's state is ~3.7 KB pickled, most of a pickled game; the
+        # seed and a count of words drawn since pin it down just as well
+        words = self._words_drawn()
+        if words is None:
+            return super().__reduce__()
+        return (_replayed, (self.label, words, self.getstate()[1:]))
+
+    def _words_drawn(self):
+        """How many 32-bit words were drawn since seeding, or None if unknown
+
+        Every draw takes whole words from the Mersenne Twister, so this is
+        found by replaying the seed a block of 624 words at a time.
+        """
+        _, internal, gauss_next = super().getstate()
+        if gauss_next is not None or not isinstance(self.label, (int, str)):
+            return None
+        replay = random.Random(self.label)
+        words = internal[-1] % 624  # Position within the current block
+        if words:
+            replay.getrandbits(32 * words)
+        while words <= self.REPLAY_LIMIT:
+            if replay.getstate()[1] == internal:
+                return words
+            replay.getrandbits(32 * 624)
+            words += 624
+        return None
+
+    def clone(self):
+        """Return an unshared copy in the same state"""
+        clone = DiceRoller.__new__(DiceRoller)
+        clone.setstate(self.getstate())
+        clone.sharers = 1
+        return clone
+
+    def _numpy_generator(self):
+        if self._generator is None:
+            self._generator = np.random.Generator(np.random.PCG64(self.getrandbits(128)))
+        return self._generator
+
+    def _roll_block(self, sides, n):
+        """Roll n dice with the given number of sides ("u" for uniforms in [0, 1))"""
+        if np is not None and n >= self.NUMPY_BATCH:
+            generator = self._numpy_generator()
+            if sides == "u":
+                return generator.random(n)
+            return generator.integers(1, sides + 1, size=n)
+        return self._roll_list(sides, n)
+
+    def _roll_list(self, sides, n):
+        """Roll n dice in pure Python, as a list"""
+        if sides == "u":
+            return [self.random() for _ in range(n)]
+        return [self.randint(1, sides) for _ in range(n)]
+
+    def _next(self, sides):
+        buffer = self._buffers.get(sides)
+        if not buffer:
+            # Start with small refills and grow them, so a short-lived stream
+            # doesn't pay for rolls it never uses
+            size = min(self.BUFFER_SIZE, 2 * self._refill_sizes.get(sides, self.FIRST_REFILL // 2))
+            self._refill_sizes[sides] = size
+            buffer = self._buffers[sides] = self._roll_list(sides, size)
+        return buffer.pop()
+
+    def roll(self, sides, n=None):
+        """Roll one die with the given number of sides, or n of them"""
+        if n is None:
+            return self._next(sides)
+        return self._roll_block(sides, n)
+
+    def d100(self, n=None):
+        return self.roll(100, n)
+
+    def d20(self, n=None):
+        return self.roll(20, n)
+
+    def d12(self, n=None):
+        return self.roll(12, n)
+
+    def d10(self, n=None):
+        return self.roll(10, n)
+
+    def d8(self, n=None):
+        return self.roll(8, n)
+
+    def d6(self, n=None):
+        return self.roll(6, n)
+
+
+    def unit(self, n=None):
+        """Return a uniform roll in [0, 1), or n of them"""
+        if n is None:
+            return self._next("u")
+        return self._roll_block("u", n)
+
+    def chance(self, probability, n=None):
+        """Return True with given probability (0-1), or n such booleans"""
+        if n is None:
+            return self._next("u") < probability
+        rolls = self._roll_block("u", n)
+        if not isinstance(rolls, list):
+            return rolls < probability
+        return [roll < probability for roll in rolls]
+
+    def weighted_choice(self, weights, n=None):
         """Select an index based on weighted probabilities
-        
+
         Args:
-            weights: List of numerical weights
-            
+            weights: Sequence of numerical weights. The alias table for each
+                distinct weight vector is built once and cached.
+            n: Optional number of independent selections to make
+
         Returns:
-            Index selected based on weights
+            Index selected based on weights, or n of them
         """
-        total = sum(weights)
-        r = random.uniform(0, total)
-        running_sum = 0
-        
-        for i, weight in enumerate(weights):
-            if running_sum + weight >= r:
-                return i
-            running_sum += weight
-            
-        return len(weights) - 1  # Fallback to last item
-
-def wait_for_enter():
-    input("\n...\n") 
\ No newline at end of file
+        sampler = alias_sampler(tuple(weights))
+        if n is not None:
+            return sampler.sample_many(self._roll_block("u", n))
+        return sampler.sample(self._next("u"))
+
+def _replayed(label, words, state):
+    """Unpickle a DiceRoller stored as its seed, the words drawn since and the rest of its state"""
+    roller = DiceRoller(label)
+    if words:
+        roller.getrandbits(32 * words)
+    roller.setstate((random.Random.getstate(roller),) + tuple(state))
+    return roller
+
+class GameRNG:
+    """All the randomness of one game, split into independent named streams.
+
+    Every stream is seeded from the game seed and its own name, so the same
+    seed always replays the same game, and drawing more numbers from one
+    stream (say, a new flavor line) never shifts the rolls of another.
+
+    Streams:
+        combat: attacks, escapes, bribes and other fight rolls
+        loot: crate values, drops, shop stock and sale offers
+        contracts: contract generation and hub prices
+        encounters: travel events, searches and heat
+        flavor: purely cosmetic text choices
+    """
+    STREAMS = ("combat", "loot", "contracts", "encounters", "flavor")
+
+    def __init__(self, seed=None, epoch=0):
+        if seed is None:
+            seed = random.getrandbits(32)
+        self.seed = seed
+        self.epoch = epoch  # Bumped each time a saved game is loaded, so it continues on fresh streams
+        self._prefix = f"{seed}:{epoch}" if epoch else f"{seed}"
+        self._streams = {}  # Created on first use
+
+    def _get(self, name):
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = self._streams[name] = DiceRoller(f"{self._prefix}:{name}")
+        elif stream.sharers > 1:
+            # Another fork still holds this stream: take a private copy before rolling
+            stream.sharers -= 1
+            stream = self._streams[name] = stream.clone()
+        return stream
+
+    combat = property(lambda self: self._get("combat"))
+    loot = property(lambda self: self._get("loot"))
+    contracts = property(lambda self: self._get("contracts"))
+    encounters = property(lambda self: self._get("encounters"))
+    flavor = property(lambda self: self._get("flavor"))
+
+    def stream(self, name):
+        """Return the stream with the given name"""
+        if name not in self.STREAMS:
+            raise ValueError(f"Unknown RNG stream: {name}")
+        return self._get(name)
+
+    def fork(self, reseed=None):
+        """Return an independent copy that will roll exactly what this one would.
+
+        Streams are shared copy-on-write, so forking costs a dict copy; a
+        stream is only cloned when one side rolls it. With reseed, the fork
+        gets fresh streams from that seed instead.
+        """
+        if reseed is not None:
+            return GameRNG(reseed, self.epoch)
+        fork = GameRNG.__new__(GameRNG)
+        fork.seed = self.seed
+        fork.epoch = self.epoch
+        fork._prefix = self._prefix
+        fork._streams = dict(self._streams)
+        for stream in fork._streams.values():
+            stream.sharers += 1
+        return fork
+
+    def share(self, names):
+        """Hand out the named streams copy-on-write, for rolling ahead elsewhere
+
+        Returns {name: stream} (None for a stream not created yet). While
+        shared, rolling a stream here swaps in a copy, so unchanged() can
+        tell whether it has been rolled since.
+        """
+        shared = {}
+        for name in names:
+            stream = self._streams.get(name)
+            if stream is not None:
+                stream.sharers += 1
+            shared[name] = stream
+        return shared
+
+    def release(self, shared):
+        """Give back streams handed out by share() once they're no longer needed"""
+        for stream in shared.values():
+            if stream is not None:
+                stream.sharers -= 1
+
+    def unchanged(self, shared):
+        """True if none of the streams from share() have been rolled (or created) since"""
+        return all(self._streams.get(name) is stream for name, stream in shared.items())
+
+    def private(self, shared):
+        """A GameRNG holding private copies of shared streams, for rolling ahead"""
+        rng = GameRNG.__new__(GameRNG)
+        rng.seed = self.seed
+        rng.epoch = self.epoch
+        rng._prefix = self._prefix
+        rng._streams = {name: stream.clone() for name, stream in shared.items() if stream is not None}
+        return rng
+
+    def adopt(self, streams):
+        """Continue from streams that were rolled ahead: {name: stream}"""
+        self._streams.update(streams)